@@ -19,10 +19,20 @@ from capellacollab import openapi as capellacollab_openapi
 from capellacollab.configuration.app import config
 from capellacollab.core import logging as core_logging
 from capellacollab.core.database import engine, migration
+from capellacollab.projects.toolmodels.backups.runs import (
+    supervisor as pipeline_runs_supervisor,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    client as git_client,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    local_cache as git_local_cache,
+)
 from capellacollab.routes import router
 from capellacollab.sessions import alerting as sessions_alerting
 from capellacollab.sessions import auth as sessions_auth
-from capellacollab.sessions import idletimeout, operators
+from capellacollab.sessions import idletimeout, operators, startup, warmpool
+from capellacollab.tools import prepull as tools_prepull
 
 from . import __version__, metrics, redirects, scheduling
 
@@ -43,17 +53,29 @@ async def lifespan(_app: fastapi.FastAPI):  # pragma: no cover
     migration.migrate_db(engine, config.database.url)
 
     # Load the Kubernetes configuration at startup
-    operators.get_operator()
+    operators.get_operator().start_informers()
 
     idletimeout.terminate_idle_sessions_in_background()
+    warmpool.reconcile_warm_pools_in_background()
+    startup.record_pod_startup_phases_in_background()
+    tools_prepull.reconcile_image_pre_pull_in_background()
     sessions_alerting.schedule_alerts()
     sessions_auth.initialize_session_pre_authentication()
 
     metrics.register_metrics()
+    git_client.open_session_pool()
+    git_local_cache.start_invalidation_listener()
+
+    if config.pipelines.scheduler:
+        pipeline_runs_supervisor.start_supervisor()
 
     yield
 
+    await pipeline_runs_supervisor.stop_supervisor()
+    await git_local_cache.stop_invalidation_listener()
+    await git_client.close_session_pool()
     scheduling.stop_scheduler()
+    operators.get_operator().stop_informers()
 
     logger.info("Shutdown completed.")
 
@@ -70,7 +92,6 @@ app = fastapi.FastAPI(
             allow_headers=["*"],
         ),
         middleware.Middleware(core_logging.AttachTraceIdMiddleware),
-        middleware.Middleware(core_logging.AttachUserNameMiddleware),
         middleware.Middleware(core_logging.LogExceptionMiddleware),
         middleware.Middleware(core_logging.LogRequestsMiddleware),
         middleware.Middleware(starlette_prometheus.PrometheusMiddleware),
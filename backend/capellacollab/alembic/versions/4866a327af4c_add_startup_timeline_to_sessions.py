@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add startup timeline to sessions
+
+Revision ID: 4866a327af4c
+Revises: 01bb44cd41b4
+Create Date: 2026-10-18 10:12:41.218377
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "4866a327af4c"
+down_revision = "01bb44cd41b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "sessions",
+        sa.Column(
+            "startup_timeline",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
@@ -81,10 +81,22 @@ def event_listener(event: ap_events.JobEvent):  # pragma: no cover
 def run(
     _verbose: _logging.VerboseOption = False,
 ):  # pragma: no cover
+    import asyncio
+    import threading
+
     from apscheduler.schedulers import background as ap_background_scheduler
 
     from capellacollab import core, scheduling
     from capellacollab.configuration.app import config
+    from capellacollab.projects.toolmodels.backups.runs import (
+        supervisor as pipeline_runs_supervisor,
+    )
+    from capellacollab.sessions import operators
+
+    async def run_supervisor():
+        # The supervisor receives the events of the operator informers
+        operators.get_operator().start_informers()
+        await pipeline_runs_supervisor.supervisor.run()
 
     if core.LOCAL_DEVELOPMENT_MODE:
         LOGGER.warning(
@@ -115,6 +127,12 @@ def run(
             id="scheduler_heartbeat",
             replace_existing=True,
         )
+        threading.Thread(
+            target=asyncio.run,
+            args=(run_supervisor(),),
+            name="pipeline-run-supervisor",
+            daemon=True,
+        ).start()
         typer.secho(
             "Starting scheduler... Press Ctrl+C to stop.",
             fg=typer.colors.GREEN,
@@ -126,3 +144,4 @@ def run(
         )
     finally:
         scheduler.shutdown()
+        operators.get_operator().stop_informers()
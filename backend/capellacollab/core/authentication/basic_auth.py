@@ -13,6 +13,7 @@ from sqlalchemy import orm
 
 from capellacollab.users import crud as user_crud
 from capellacollab.users import models as users_models
+from capellacollab.users.tokens import cache as tokens_cache
 from capellacollab.users.tokens import crud as token_crud
 from capellacollab.users.tokens import models as tokens_models
 
@@ -96,6 +97,9 @@ class HTTPBasicAuth(security.HTTPBasic):
     def validate_password_hash(
         cls, token: tokens_models.DatabaseUserToken, password: str
     ):
+        if tokens_cache.verified_tokens.is_verified(token, password):
+            return
+
         ph = argon2.PasswordHasher(
             time_cost=1, memory_cost=2048, parallelism=1
         )
@@ -105,6 +109,8 @@ class HTTPBasicAuth(security.HTTPBasic):
         except argon2.exceptions.VerifyMismatchError as e:
             raise exceptions.InvalidPersonalAccessTokenError() from e
 
+        tokens_cache.verified_tokens.add(token, password)
+
     @classmethod
     def validate_password_hash_legacy(
         cls, tokens: t.Sequence[tokens_models.DatabaseUserToken], password: str
@@ -113,10 +119,16 @@ class HTTPBasicAuth(security.HTTPBasic):
             time_cost=1, memory_cost=2048, parallelism=1
         )
 
+        for token in tokens:
+            if tokens_cache.verified_tokens.is_verified(token, password):
+                return token
+
         for token in tokens:
             try:
                 ph.verify(token.hash, password)
-                return token
             except argon2.exceptions.VerifyMismatchError:
-                pass
+                continue
+
+            tokens_cache.verified_tokens.add(token, password)
+            return token
         return None
@@ -43,6 +43,38 @@ class _AuthenticationInformationValidation:
         ],
     ) -> tuple[
         users_models.DatabaseUser, tokens_models.DatabaseUserToken | None
+    ]:
+        """Authenticate the request once and reuse the result.
+
+        The result is stored on `request.state`, so that all route
+        dependencies share one authentication and the request logs
+        contain the user name.
+        """
+        if not hasattr(request.state, "user"):
+            try:
+                (
+                    request.state.user,
+                    request.state.token,
+                ) = await cls.authenticate(request, db, logger)
+                request.state.user_name = request.state.user.name
+            except fastapi.HTTPException as e:
+                request.state.user = request.state.token = None
+                request.state.authentication_error = e
+                raise
+
+        if request.state.user is None:
+            raise request.state.authentication_error
+
+        return request.state.user, request.state.token
+
+    @classmethod
+    async def authenticate(
+        cls,
+        request: fastapi.Request,
+        db: orm.Session,
+        logger: logging.LoggerAdapter,
+    ) -> tuple[
+        users_models.DatabaseUser, tokens_models.DatabaseUserToken | None
     ]:
         if request.cookies.get("id_token"):
             username = await api_key_cookie.JWTAPIKeyCookie()(request)
@@ -54,9 +54,9 @@ def get_db() -> t.Iterator[orm.Session]:
 
 
 @functools.lru_cache
-def get_valkey() -> valkey.asyncio.Valkey:
+def get_valkey(decode_responses: bool = True) -> valkey.asyncio.Valkey:
     return valkey.asyncio.Valkey.from_url(
-        config.valkey.url, decode_responses=True
+        config.valkey.url, decode_responses=decode_responses
     )
 
 
@@ -15,8 +15,6 @@ import rich.logging as rich_logging
 from starlette.middleware import base
 
 from capellacollab.configuration.app import config
-from capellacollab.core import database
-from capellacollab.core.authentication import injectables as auth_injectables
 
 from . import injectables
 
@@ -89,29 +87,6 @@ class AttachTraceIdMiddleware(base.BaseHTTPMiddleware):
         return await call_next(request)
 
 
-class AttachUserNameMiddleware(base.BaseHTTPMiddleware):
-    async def dispatch(
-        self,
-        request: fastapi.Request,
-        call_next: base.RequestResponseEndpoint,
-    ):
-        try:
-            with database.SessionLocal() as session:
-                (
-                    user,
-                    _,
-                ) = await auth_injectables.authentication_information_validation(
-                    request, session, injectables.get_request_logger(request)
-                )
-            username = user.name
-        except fastapi.HTTPException:
-            username = "anonymous"
-
-        request.state.user_name = username
-
-        return await call_next(request)
-
-
 class LogExceptionMiddleware(base.BaseHTTPMiddleware):
     async def dispatch(
         self, request: fastapi.Request, call_next: base.RequestResponseEndpoint
@@ -10,8 +10,18 @@ from capellacollab.configuration.app import config
 
 
 class _LogAdapter(logging.LoggerAdapter):
+    """Log with the attributes of the request.
+
+    The attributes are read when logging, since the user name is only
+    known once the request is authenticated by the route dependencies.
+    """
+
+    def __init__(self, logger: logging.Logger, request: fastapi.Request):
+        super().__init__(logger)
+        self.request = request
+
     def process(self, msg: str, kwargs):
-        extra: dict = self.extra | kwargs.get("extra", {})
+        extra: dict = _get_log_args(self.request) | kwargs.get("extra", {})
 
         msg = (
             " ".join([f'{key}="{value}"' for key, value in extra.items()])
@@ -24,8 +34,7 @@ def _get_log_args(request: fastapi.Request) -> dict[str, t.Any]:
     log_args = {}
     if client := request.client:
         log_args["client"] = client.host + ":" + str(client.port)
-    if hasattr(request.state, "user_name"):
-        log_args["user"] = request.state.user_name
+    log_args["user"] = getattr(request.state, "user_name", "anonymous")
     return log_args | {
         "trace_id": request.state.trace_id,
         "method": request.method,
@@ -38,4 +47,4 @@ def get_request_logger(request: fastapi.Request) -> logging.LoggerAdapter:
     logger: logging.Logger = logging.getLogger("capellacollab.request")
     logger.setLevel(config.logging.level)
 
-    return _LogAdapter(logger, _get_log_args(request))
+    return _LogAdapter(logger, request)
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import datetime
+import email.utils
+import hashlib
 import typing as t
 
 import fastapi
@@ -77,6 +79,87 @@ def delete_secure_cookie(
     )
 
 
+CACHE_STATUS_HEADER = "X-Cache-Status"
+
+
+def make_etag(*parts: str) -> str:
+    """Create a strong entity tag from the parts identifying a content."""
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def get_validator_headers(
+    etag: str | None,
+    last_modified: datetime.datetime | None = None,
+    cache_control: str = "no-cache",
+    stale: bool = False,
+) -> dict[str, str]:
+    """Return the headers, which allow clients to revalidate a response.
+
+    With the default `no-cache`, clients may store the response,
+    but have to revalidate it before each use. Responses served from
+    a cache without validation are marked as `stale`.
+    """
+    headers = {"Cache-Control": cache_control}
+    if stale:
+        headers[CACHE_STATUS_HEADER] = "STALE"
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = email.utils.format_datetime(
+            _as_utc(last_modified), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(
+    request: fastapi.Request,
+    etag: str | None,
+    last_modified: datetime.datetime | None = None,
+) -> bool:
+    """Evaluate the preconditions of a conditional GET request.
+
+    As defined in RFC 9110, `If-Modified-Since` is ignored
+    if the request contains an `If-None-Match` header.
+    """
+    if (if_none_match := request.headers.get("If-None-Match")) is not None:
+        if not etag:
+            return False
+        return any(
+            tag.strip().removeprefix("W/") in ("*", etag)
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if not if_modified_since or not last_modified:
+        return False
+
+    try:
+        modified_since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(
+        modified_since
+    )
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.UTC)
+    return value.astimezone(datetime.UTC)
+
+
+class NotModifiedResponse(fastapi.responses.Response):
+    """Response without content for a successful conditional request.
+
+    Pass the same validator headers, which the full response would have.
+    """
+
+    def __init__(self, headers: t.Mapping[str, str] | None = None):
+        super().__init__(status_code=304, headers=headers)
+
+
 class SVGResponse(fastapi.responses.Response):
     """Custom error class for SVG responses.
 
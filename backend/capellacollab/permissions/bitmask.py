@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import collections
+import typing as t
+
+import pydantic
+
+if t.TYPE_CHECKING:
+    from capellacollab.permissions.models import UserTokenVerb
+
+type Path = tuple[str, ...]
+
+
+class ScopeBitmask[T: pydantic.BaseModel]:
+    """Integer representation of a (nested) scope model.
+
+    Each combination of a scope attribute and an allowed verb is assigned
+    one bit. The bits are derived from the model annotations once, so that
+    union, intersection and permission checks become plain bit operations.
+    The pydantic models are only needed for the API surface.
+    """
+
+    def __init__(self, model: type[T]):
+        self.model = model
+        self._bits: dict[tuple[Path, UserTokenVerb], int] = {}
+        self._path_masks: dict[Path, int] = collections.defaultdict(int)
+        self._verb_masks: dict[UserTokenVerb, int] = collections.defaultdict(
+            int
+        )
+        self._collect_bits(model, ())
+
+    def _collect_bits(
+        self, model: type[pydantic.BaseModel], path: Path
+    ) -> None:
+        for name, field in model.model_fields.items():
+            annotation = field.annotation
+            if isinstance(annotation, type) and issubclass(
+                annotation, pydantic.BaseModel
+            ):
+                self._collect_bits(annotation, (*path, name))
+                continue
+
+            # Assuming a structure of set[t.Literal[UserTokenVerb.X, ...]]
+            for verb in t.get_args(t.get_args(annotation)[0]):
+                bit = 1 << len(self._bits)
+                self._bits[((*path, name), verb)] = bit
+                self._path_masks[(*path, name)] |= bit
+                self._verb_masks[verb] |= bit
+
+    def to_mask(self, scope: T) -> int:
+        return self._to_mask(scope, ())
+
+    def _to_mask(self, scope: pydantic.BaseModel, path: Path) -> int:
+        mask = 0
+        for name, value in scope:
+            if isinstance(value, pydantic.BaseModel):
+                mask |= self._to_mask(value, (*path, name))
+                continue
+
+            for verb in value:
+                mask |= self._bits[((*path, name), verb)]
+        return mask
+
+    def to_model(self, mask: int) -> T:
+        scope: dict[str, t.Any] = {}
+        for (path, verb), bit in self._bits.items():
+            if not mask & bit:
+                continue
+
+            node = scope
+            for name in path[:-1]:
+                node = node.setdefault(name, {})
+            node.setdefault(path[-1], set()).add(verb)
+
+        return self.model.model_validate(scope)
+
+    def bit(self, *path: str, verb: UserTokenVerb) -> int:
+        return self._bits[(path, verb)]
+
+    def verb_mask(self, verb: UserTokenVerb) -> int:
+        """Return a mask with the verb set for all attributes that allow it."""
+        return self._verb_masks.get(verb, 0)
+
+    def verbs(self, mask: int, *path: str) -> set[UserTokenVerb]:
+        return {
+            verb
+            for (bit_path, verb), bit in self._bits.items()
+            if bit_path == path and mask & bit
+        }
+
+    def find_missing(
+        self, required: int, actual: int
+    ) -> tuple[Path, set[UserTokenVerb]] | None:
+        """Return the first attribute with required verbs missing in actual.
+
+        The returned set contains all required verbs of the attribute.
+        """
+        if not (missing := required & ~actual):
+            return None
+
+        for path, path_mask in self._path_masks.items():
+            if missing & path_mask:
+                return path, self.verbs(required, *path)
+
+        return None
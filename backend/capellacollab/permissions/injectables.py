@@ -14,6 +14,28 @@ from capellacollab.users.tokens import models as tokens_models
 from . import exceptions, models
 
 
+def get_scope_mask(
+    user: t.Annotated[
+        users_models.DatabaseUser,
+        fastapi.Depends(users_injectables.get_own_user),
+    ],
+    token: t.Annotated[
+        tokens_models.DatabaseUserToken | None,
+        fastapi.Depends(auth_injectables.get_auth_pat),
+    ],
+) -> int:
+    """Return the global scope of the user as bitmask.
+
+    See `models.GLOBAL_SCOPES_BITMASK` for the conversion.
+    """
+    role_mask = models.ROLE_MASKS[user.role]
+
+    if token:
+        return models.GLOBAL_SCOPES_BITMASK.to_mask(token.scope) & role_mask
+
+    return role_mask
+
+
 def get_scope(
     user: t.Annotated[
         users_models.DatabaseUser,
@@ -24,12 +46,12 @@ def get_scope(
         fastapi.Depends(auth_injectables.get_auth_pat),
     ],
 ) -> models.GlobalScopes:
-    role_permissions = models.ROLE_MAPPING[user.role]
-
     if token:
-        return token.scope & role_permissions
+        return models.GLOBAL_SCOPES_BITMASK.to_model(
+            get_scope_mask(user, token)
+        )
 
-    return role_permissions
+    return models.ROLE_MAPPING[user.role]
 
 
 @dataclasses.dataclass(eq=False)
@@ -37,24 +59,22 @@ class PermissionValidation:
     required_scope: models.GlobalScopes | None
     exceptions = [exceptions.InsufficientPermissionError]
 
+    def __post_init__(self):
+        self._required_mask = (
+            models.GLOBAL_SCOPES_BITMASK.to_mask(self.required_scope)
+            if self.required_scope
+            else 0
+        )
+
     def __call__(
         self,
-        actual_scope: t.Annotated[
-            models.GlobalScopes, fastapi.Depends(get_scope)
-        ],
+        actual_scope_mask: t.Annotated[int, fastapi.Depends(get_scope_mask)],
     ) -> None:
-        if self.required_scope is None:
-            self.required_scope = models.GlobalScopes()
-
-        actual_scope_dump = actual_scope.model_dump()
-
-        for scope, perms in self.required_scope:
-            for perm, verbs in perms:
-                for verb in verbs:
-                    if verb not in actual_scope_dump[scope][perm]:
-                        raise exceptions.InsufficientPermissionError(
-                            f"{scope}.{perm}", verbs
-                        )
+        if missing := models.GLOBAL_SCOPES_BITMASK.find_missing(
+            self._required_mask, actual_scope_mask
+        ):
+            path, verbs = missing
+            raise exceptions.InsufficientPermissionError(".".join(path), verbs)
 
     def list_repr(self) -> list[str]:
         if self.required_scope is None:
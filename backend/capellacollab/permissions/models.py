@@ -7,6 +7,7 @@ import typing as t
 import pydantic
 
 from capellacollab.core import pydantic as core_pydantic
+from capellacollab.permissions import bitmask
 from capellacollab.users import models as users_models
 
 
@@ -217,22 +218,23 @@ class GlobalScopes(core_pydantic.BaseModelStrict):
             raise TypeError(
                 f"unsupported operand type(s) for &: '{type(self)}' and '{type(other)}'"
             )
-        derived_scope = self.model_dump()
-        for scope_name, scope in other:
-            for attribute, verbs in scope:
-                derived_scope[scope_name][attribute] &= verbs
-        return self.model_validate(derived_scope)
+        return GLOBAL_SCOPES_BITMASK.to_model(
+            GLOBAL_SCOPES_BITMASK.to_mask(self)
+            & GLOBAL_SCOPES_BITMASK.to_mask(other)
+        )
 
     def __or__(self: t.Self, other: "GlobalScopes"):
         if not isinstance(other, GlobalScopes):
             raise TypeError(
                 f"unsupported operand type(s) for |: '{type(self)}' and '{type(other)}'"
             )
-        derived_scope = self.model_dump()
-        for scope_name, scope in other:
-            for attribute, verbs in scope:
-                derived_scope[scope_name][attribute] |= verbs
-        return self.model_validate(derived_scope)
+        return GLOBAL_SCOPES_BITMASK.to_model(
+            GLOBAL_SCOPES_BITMASK.to_mask(self)
+            | GLOBAL_SCOPES_BITMASK.to_mask(other)
+        )
+
+
+GLOBAL_SCOPES_BITMASK = bitmask.ScopeBitmask(GlobalScopes)
 
 
 USER_TOKEN_SCOPE = UserScopes(
@@ -329,3 +331,8 @@ ROLE_MAPPING = {
         ),
     ),
 }
+
+ROLE_MASKS = {
+    role: GLOBAL_SCOPES_BITMASK.to_mask(scope)
+    for role, scope in ROLE_MAPPING.items()
+}
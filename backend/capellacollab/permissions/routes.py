@@ -47,8 +47,8 @@ def validate_permissions(
             example=["admin.users:get", "admin.users:create"],
         ),
     ],
-    actual_scope: t.Annotated[
-        models.GlobalScopes, fastapi.Depends(injectables.get_scope)
+    actual_scope_mask: t.Annotated[
+        int, fastapi.Depends(injectables.get_scope_mask)
     ],
     logger: t.Annotated[
         logging.LoggerAdapter,
@@ -64,7 +64,7 @@ def validate_permissions(
         merged_required_scopes |= scope
 
     injectables.PermissionValidation(required_scope=merged_required_scopes)(
-        actual_scope=actual_scope
+        actual_scope_mask=actual_scope_mask
     )
 
 
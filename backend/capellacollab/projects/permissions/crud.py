@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import abc
+
 import sqlalchemy as sa
 from sqlalchemy import orm
 
@@ -34,3 +36,18 @@ def get_personal_access_token_link(
         .where(models.DatabaseProjectPATAssociation.project == project)
         .where(models.DatabaseProjectPATAssociation.token == token)
     ).scalar_one_or_none()
+
+
+def get_personal_access_token_links_for_token(
+    db: orm.Session,
+    token: tokens_models.DatabaseUserToken,
+) -> abc.Sequence[models.DatabaseProjectPATAssociation]:
+    return (
+        db.execute(
+            sa.select(models.DatabaseProjectPATAssociation).where(
+                models.DatabaseProjectPATAssociation.token_id == token.id
+            )
+        )
+        .scalars()
+        .all()
+    )
@@ -3,6 +3,7 @@
 
 import dataclasses
 import typing as t
+from collections import abc
 
 import fastapi
 from sqlalchemy import orm
@@ -21,7 +22,7 @@ from capellacollab.users.tokens import models as tokens_models
 from . import crud, exceptions, models, permissions
 
 
-def get_scope(
+def get_scope_mask(
     user: t.Annotated[
         users_models.DatabaseUser,
         fastapi.Depends(users_injectables.get_own_user),
@@ -30,63 +31,158 @@ def get_scope(
         tokens_models.DatabaseUserToken | None,
         fastapi.Depends(auth_injectables.get_auth_pat),
     ],
-    global_scope: t.Annotated[
-        permissions_models.GlobalScopes,
-        fastapi.Depends(permissions_injectables.get_scope),
+    global_scope_mask: t.Annotated[
+        int,
+        fastapi.Depends(permissions_injectables.get_scope_mask),
     ],
     project: t.Annotated[
         projects_models.DatabaseProject,
         fastapi.Depends(projects_injectables.get_existing_project),
     ],
     db: t.Annotated[orm.Session, fastapi.Depends(database.get_db)],
-) -> models.ProjectUserScopes:
-    inherited_global_scope = permissions.inherit_global_permissions(
-        global_scope
+) -> int:
+    """Return the project scope of the user as bitmask.
+
+    See `models.PROJECT_SCOPES_BITMASK` for the conversion.
+    """
+    inherited_global_mask = permissions.inherit_global_permissions(
+        global_scope_mask
     )
 
     project_user = projects_users_crud.get_project_user_association(
         db, project, user
     )
-    derived_project_scope = permissions.derive_project_permissions_from_role(
+    derived_project_mask = permissions.derive_project_permissions_from_role(
         project, project_user, user
     )
 
     if token:
         project_token = crud.get_personal_access_token_link(db, project, token)
         if not project_token:
-            return inherited_global_scope
+            return inherited_global_mask
 
-        return inherited_global_scope | (
-            project_token.scope & derived_project_scope
+        return inherited_global_mask | (
+            models.PROJECT_SCOPES_BITMASK.to_mask(project_token.scope)
+            & derived_project_mask
         )
 
-    return inherited_global_scope | derived_project_scope
+    return inherited_global_mask | derived_project_mask
+
+
+def get_scope(
+    user: t.Annotated[
+        users_models.DatabaseUser,
+        fastapi.Depends(users_injectables.get_own_user),
+    ],
+    token: t.Annotated[
+        tokens_models.DatabaseUserToken | None,
+        fastapi.Depends(auth_injectables.get_auth_pat),
+    ],
+    global_scope: t.Annotated[
+        permissions_models.GlobalScopes,
+        fastapi.Depends(permissions_injectables.get_scope),
+    ],
+    project: t.Annotated[
+        projects_models.DatabaseProject,
+        fastapi.Depends(projects_injectables.get_existing_project),
+    ],
+    db: t.Annotated[orm.Session, fastapi.Depends(database.get_db)],
+) -> models.ProjectUserScopes:
+    return models.PROJECT_SCOPES_BITMASK.to_model(
+        get_scope_mask(
+            user,
+            token,
+            permissions_models.GLOBAL_SCOPES_BITMASK.to_mask(global_scope),
+            project,
+            db,
+        )
+    )
+
+
+def get_scope_masks_for_projects(
+    user: users_models.DatabaseUser,
+    token: tokens_models.DatabaseUserToken | None,
+    global_scope_mask: int,
+    projects: abc.Sequence[projects_models.DatabaseProject],
+    db: orm.Session,
+) -> dict[int, int]:
+    """Evaluate the project scope masks for a list of projects at once.
+
+    Equivalent to calling `get_scope_mask` for each project, but the project
+    memberships of the user and the project links of the token
+    are loaded with one query each.
+    """
+    inherited_global_mask = permissions.inherit_global_permissions(
+        global_scope_mask
+    )
+
+    project_users = {
+        association.project_id: association
+        for association in (
+            projects_users_crud.get_project_user_associations_for_user(
+                db, user
+            )
+        )
+    }
+    project_token_masks = (
+        {
+            link.project_id: models.PROJECT_SCOPES_BITMASK.to_mask(link.scope)
+            for link in crud.get_personal_access_token_links_for_token(
+                db, token
+            )
+        }
+        if token
+        else {}
+    )
+
+    masks = {}
+    for project in projects:
+        derived_project_mask = (
+            permissions.derive_project_permissions_from_role(
+                project, project_users.get(project.id), user
+            )
+        )
+
+        if not token:
+            masks[project.id] = inherited_global_mask | derived_project_mask
+        elif (
+            project_token_mask := project_token_masks.get(project.id)
+        ) is not None:
+            masks[project.id] = inherited_global_mask | (
+                project_token_mask & derived_project_mask
+            )
+        else:
+            masks[project.id] = inherited_global_mask
+
+    return masks
 
 
 @dataclasses.dataclass(eq=False)
 class ProjectPermissionValidation:
     required_scope: models.ProjectUserScopes
 
+    def __post_init__(self):
+        self._required_mask = models.PROJECT_SCOPES_BITMASK.to_mask(
+            self.required_scope
+        )
+
     def __call__(
         self,
-        project_scope: t.Annotated[
-            models.ProjectUserScopes, fastapi.Depends(get_scope)
-        ],
+        project_scope_mask: t.Annotated[int, fastapi.Depends(get_scope_mask)],
         project: t.Annotated[
             projects_models.DatabaseProject,
             fastapi.Depends(projects_injectables.get_existing_project),
         ],
     ) -> None:
-        actual_scope = project_scope.model_dump()
-
-        for resource, verbs in self.required_scope:
-            for verb in verbs:
-                if verb not in actual_scope[resource]:
-                    raise exceptions.InsufficientProjectPermissionError(
-                        resource,
-                        verbs,
-                        project_name=project.name,
-                    )
+        if missing := models.PROJECT_SCOPES_BITMASK.find_missing(
+            self._required_mask, project_scope_mask
+        ):
+            (resource,), verbs = missing
+            raise exceptions.InsufficientProjectPermissionError(
+                resource,
+                verbs,
+                project_name=project.name,
+            )
 
     def list_repr(self) -> list[str]:
         required_permissions = []
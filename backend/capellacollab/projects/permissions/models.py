@@ -10,6 +10,7 @@ from sqlalchemy import orm
 from capellacollab.core import database
 from capellacollab.core import pydantic as core_pydantic
 from capellacollab.core.database import decorator as database_decorator
+from capellacollab.permissions import bitmask as permissions_bitmask
 from capellacollab.permissions import models as permissions_models
 
 if t.TYPE_CHECKING:
@@ -189,20 +190,23 @@ class ProjectUserScopes(core_pydantic.BaseModel):
             raise TypeError(
                 f"unsupported operand type(s) for &: '{type(self)}' and '{type(other)}'"
             )
-        derived_scope = self.model_dump()
-        for attribute, verbs in other:
-            derived_scope[attribute] &= verbs
-        return self.model_validate(derived_scope)
+        return PROJECT_SCOPES_BITMASK.to_model(
+            PROJECT_SCOPES_BITMASK.to_mask(self)
+            & PROJECT_SCOPES_BITMASK.to_mask(other)
+        )
 
     def __or__(self: t.Self, other: "ProjectUserScopes"):
         if not isinstance(other, ProjectUserScopes):
             raise TypeError(
                 f"unsupported operand type(s) for |: '{type(self)}' and '{type(other)}'"
             )
-        derived_scope = self.model_dump()
-        for attribute, verbs in other:
-            derived_scope[attribute] |= verbs
-        return self.model_validate(derived_scope)
+        return PROJECT_SCOPES_BITMASK.to_model(
+            PROJECT_SCOPES_BITMASK.to_mask(self)
+            | PROJECT_SCOPES_BITMASK.to_mask(other)
+        )
+
+
+PROJECT_SCOPES_BITMASK = permissions_bitmask.ScopeBitmask(ProjectUserScopes)
 
 
 class DatabaseProjectPATAssociation(database.Base):
@@ -9,119 +9,125 @@ from capellacollab.users import models as users_models
 
 from . import models
 
+READ_ONLY_PERMISSIONS = models.ProjectUserScopes(
+    root={permissions_models.UserTokenVerb.GET},
+    diagram_cache={permissions_models.UserTokenVerb.GET},
+    git_model_links={permissions_models.UserTokenVerb.GET},
+    tool_models={permissions_models.UserTokenVerb.GET},
+    used_tools={permissions_models.UserTokenVerb.GET},
+    provisioning={
+        permissions_models.UserTokenVerb.GET,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    shared_volumes={
+        permissions_models.UserTokenVerb.GET,
+    },
+)
+WRITE_PERMISSIONS = READ_ONLY_PERMISSIONS | models.ProjectUserScopes(
+    t4c_access={permissions_models.UserTokenVerb.UPDATE},
+    restrictions={permissions_models.UserTokenVerb.GET},
+    shared_volumes={
+        permissions_models.UserTokenVerb.UPDATE,
+    },
+)
+PROJECT_LEAD_PERMISSIONS = WRITE_PERMISSIONS | models.ProjectUserScopes(
+    root={
+        permissions_models.UserTokenVerb.UPDATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    pipelines={
+        permissions_models.UserTokenVerb.GET,
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.UPDATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    pipeline_runs={
+        permissions_models.UserTokenVerb.GET,
+        permissions_models.UserTokenVerb.CREATE,
+    },
+    t4c_model_links={
+        permissions_models.UserTokenVerb.GET,
+        permissions_models.UserTokenVerb.UPDATE,
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    git_model_links={
+        permissions_models.UserTokenVerb.UPDATE,
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    tool_models={
+        permissions_models.UserTokenVerb.UPDATE,
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    used_tools={
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    project_users={
+        permissions_models.UserTokenVerb.GET,
+        permissions_models.UserTokenVerb.UPDATE,
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+    access_log={permissions_models.UserTokenVerb.GET},
+    restrictions={permissions_models.UserTokenVerb.UPDATE},
+    shared_volumes={
+        permissions_models.UserTokenVerb.CREATE,
+        permissions_models.UserTokenVerb.DELETE,
+    },
+)
+
+READ_ONLY_MASK = models.PROJECT_SCOPES_BITMASK.to_mask(READ_ONLY_PERMISSIONS)
+WRITE_MASK = models.PROJECT_SCOPES_BITMASK.to_mask(WRITE_PERMISSIONS)
+PROJECT_LEAD_MASK = models.PROJECT_SCOPES_BITMASK.to_mask(
+    PROJECT_LEAD_PERMISSIONS
+)
+
+# Pairs of an admin.projects bit and the project scope mask it grants
+_INHERITED_MASKS = [
+    (
+        permissions_models.GLOBAL_SCOPES_BITMASK.bit(
+            "admin", "projects", verb=verb
+        ),
+        models.PROJECT_SCOPES_BITMASK.verb_mask(verb),
+    )
+    for verb in permissions_models.UserTokenVerb
+]
 
-def inherit_global_permissions(
-    global_scope: permissions_models.GlobalScopes,
-) -> models.ProjectUserScopes:
-    """When admin.projects permission is set, inherit the permissions to all projects"""
-
-    scope = models.ProjectUserScopes().model_dump()
-
-    for attribute in scope:
-        for verb in global_scope.admin.projects:
-            type_annotations = models.ProjectUserScopes.model_fields[
-                attribute
-            ].annotation
-            assert type_annotations
 
-            # Assuming a type of structure set[t.Literal[UserTokenVerb.X, UserTokenVerb.Y]]
-            if verb in type_annotations.__args__[0].__args__:
-                scope[attribute].add(verb)
+def inherit_global_permissions(global_scope_mask: int) -> int:
+    """When admin.projects permission is set, inherit the permissions to all projects"""
 
-    return models.ProjectUserScopes.model_validate(scope)
+    mask = 0
+    for global_bit, project_mask in _INHERITED_MASKS:
+        if global_scope_mask & global_bit:
+            mask |= project_mask
+    return mask
 
 
 def derive_project_permissions_from_role(
     project: projects_models.DatabaseProject,
     project_user: projects_users_models.DatabaseProjectUserAssociation | None,
     user: users_models.DatabaseUser,
-) -> models.ProjectUserScopes:
-    read_only_permissions = models.ProjectUserScopes(
-        root={permissions_models.UserTokenVerb.GET},
-        diagram_cache={permissions_models.UserTokenVerb.GET},
-        git_model_links={permissions_models.UserTokenVerb.GET},
-        tool_models={permissions_models.UserTokenVerb.GET},
-        used_tools={permissions_models.UserTokenVerb.GET},
-        provisioning={
-            permissions_models.UserTokenVerb.GET,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        shared_volumes={
-            permissions_models.UserTokenVerb.GET,
-        },
-    )
-    write_permissions = read_only_permissions | models.ProjectUserScopes(
-        t4c_access={permissions_models.UserTokenVerb.UPDATE},
-        restrictions={permissions_models.UserTokenVerb.GET},
-        shared_volumes={
-            permissions_models.UserTokenVerb.UPDATE,
-        },
-    )
-    project_lead_permissions = write_permissions | models.ProjectUserScopes(
-        root={
-            permissions_models.UserTokenVerb.UPDATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        pipelines={
-            permissions_models.UserTokenVerb.GET,
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.UPDATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        pipeline_runs={
-            permissions_models.UserTokenVerb.GET,
-            permissions_models.UserTokenVerb.CREATE,
-        },
-        t4c_model_links={
-            permissions_models.UserTokenVerb.GET,
-            permissions_models.UserTokenVerb.UPDATE,
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        git_model_links={
-            permissions_models.UserTokenVerb.UPDATE,
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        tool_models={
-            permissions_models.UserTokenVerb.UPDATE,
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        used_tools={
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        project_users={
-            permissions_models.UserTokenVerb.GET,
-            permissions_models.UserTokenVerb.UPDATE,
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-        access_log={permissions_models.UserTokenVerb.GET},
-        restrictions={permissions_models.UserTokenVerb.UPDATE},
-        shared_volumes={
-            permissions_models.UserTokenVerb.CREATE,
-            permissions_models.UserTokenVerb.DELETE,
-        },
-    )
-
+) -> int:
     if user.role == users_models.Role.ADMIN:
-        return project_lead_permissions
+        return PROJECT_LEAD_MASK
 
     if project_user:
         if project_user.role == projects_users_models.ProjectUserRole.MANAGER:
-            return project_lead_permissions
+            return PROJECT_LEAD_MASK
 
         if project_user.role == projects_users_models.ProjectUserRole.USER:
             if (
                 project_user.permission
                 == projects_users_models.ProjectUserPermission.WRITE
             ):
-                return write_permissions
-            return read_only_permissions
+                return WRITE_MASK
+            return READ_ONLY_MASK
 
     if project.visibility == projects_models.ProjectVisibility.INTERNAL:
-        return read_only_permissions
+        return READ_ONLY_MASK
 
-    return models.ProjectUserScopes()
+    return 0
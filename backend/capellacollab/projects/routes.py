@@ -43,6 +43,13 @@ from . import crud, exceptions, models
 
 router = fastapi.APIRouter()
 
+ROOT_GET = projects_permissions_models.PROJECT_SCOPES_BITMASK.bit(
+    "root", verb=permissions_models.UserTokenVerb.GET
+)
+ROOT_UPDATE = projects_permissions_models.PROJECT_SCOPES_BITMASK.bit(
+    "root", verb=permissions_models.UserTokenVerb.UPDATE
+)
+
 
 @router.get(
     "",
@@ -56,9 +63,9 @@ router = fastapi.APIRouter()
 )
 def get_projects(
     db: t.Annotated[orm.Session, fastapi.Depends(database.get_db)],
-    global_scope: t.Annotated[
-        permissions_models.GlobalScopes,
-        fastapi.Depends(permissions_injectables.get_scope),
+    global_scope_mask: t.Annotated[
+        int,
+        fastapi.Depends(permissions_injectables.get_scope_mask),
     ],
     user: t.Annotated[
         users_models.DatabaseUser,
@@ -78,12 +85,16 @@ def get_projects(
     """
     projects = []
 
-    for project in crud.get_projects(db):
-        project_scope = projects_permissions_injectables.get_scope(
-            user, token, global_scope, project, db
+    all_projects = crud.get_projects(db)
+    project_scope_masks = (
+        projects_permissions_injectables.get_scope_masks_for_projects(
+            user, token, global_scope_mask, all_projects, db
         )
+    )
+    for project in all_projects:
+        project_scope_mask = project_scope_masks[project.id]
 
-        if permissions_models.UserTokenVerb.GET in project_scope.root:
+        if project_scope_mask & ROOT_GET:
             if minimum_role in (
                 projects_users_models.ProjectUserRole.ADMIN,
                 projects_users_models.ProjectUserRole.MANAGER,
@@ -92,10 +103,7 @@ def get_projects(
                 # to the removed ProjectRoleVerification
                 # (project_scope.root, UPDATE) is only available admins & project leads
 
-                if (
-                    permissions_models.UserTokenVerb.UPDATE
-                    in project_scope.root
-                ):
+                if project_scope_mask & ROOT_UPDATE:
                     projects.append(project)
             else:
                 projects.append(project)
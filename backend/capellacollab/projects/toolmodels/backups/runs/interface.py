@@ -3,7 +3,6 @@
 
 import datetime
 import logging
-import time
 
 from kubernetes import client
 from kubernetes import client as k8s_client
@@ -32,21 +31,41 @@ POLL_INTERVAL = 5
 
 
 def run_job_in_kubernetes(run_id: int):  # pragma: no cover
-    """Run a job in the Kubernetes cluster and wait until completion."""
+    """Schedule a job in the Kubernetes cluster.
+
+    The job is not awaited here. Once scheduled, the pipeline run
+    supervisor keeps track of the job until completion.
+    """
 
     with database.SessionLocal() as db:
         run = crud.get_pipeline_run_by_id(db, run_id)
         assert run is not None
         _schedule_job(db, run)
-        while True:
-            time.sleep(POLL_INTERVAL)
-            _update_status_of_job_run(db, run)
-            _fetch_events_of_job_run(db, run)
-            _fetch_logs_of_job_run(db, run)
-            if _job_is_finished(run.status):
-                _terminate_job(run)
-                alerting.send_alert_on_failed_pipeline_run(db, run)
-                break
+        if _job_is_finished(run.status):
+            run.end_time = datetime.datetime.now(datetime.UTC)
+            db.commit()
+            alerting.send_alert_on_failed_pipeline_run(db, run)
+
+
+def supervise_job_run(run_id: int):
+    """Update the status, events and logs of a scheduled or running job.
+
+    Finished jobs are removed from the cluster and
+    an alert is sent if the run has failed.
+    """
+
+    with database.SessionLocal() as db:
+        run = crud.get_pipeline_run_by_id(db, run_id)
+        if not run or not run.reference_id or _job_is_finished(run.status):
+            return
+
+        _update_status_of_job_run(db, run)
+        _fetch_events_of_job_run(db, run)
+        _fetch_logs_of_job_run(db, run)
+        if _job_is_finished(run.status):
+            _terminate_job(run)
+            db.commit()
+            alerting.send_alert_on_failed_pipeline_run(db, run)
 
 
 def _schedule_job(db: orm.Session, run: models.DatabasePipelineRun):
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing as t
+
+import anyio
+import asyncer
+
+from capellacollab.configuration.app import config
+from capellacollab.core import database
+from capellacollab.sessions import operators
+from capellacollab.sessions.operators import informer
+
+from . import crud, interface
+
+log = logging.getLogger(__name__)
+
+PIPELINE_RUN_LABEL = "app.capellacollab/pipelineRunID"
+
+
+class PipelineRunSupervisor:
+    """Supervise all scheduled and running pipeline runs from one event loop.
+
+    Events of the job and pod informers of the operator trigger an update
+    of the corresponding pipeline run. In addition, all
+    unfinished runs are updated every `interface.POLL_INTERVAL` seconds
+    to collect new logs and to detect timeouts.
+
+    Updates are executed in worker threads, limited by
+    `pipelines.concurrentUpdates`. No thread is blocked while a job is
+    running in the cluster.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._task: asyncio.Task | None = None
+        self._informers: list[informer.Informer] = []
+
+        self._pending: set[int] = set()
+        self._in_progress: set[int] = set()
+        self._updates: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the supervisor in the running event loop."""
+        if self._task and not self._task.done():
+            return
+
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        await asyncio.gather(*self._updates, return_exceptions=True)
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._limiter = anyio.CapacityLimiter(
+            config.pipelines.concurrent_updates
+        )
+
+        self._add_event_handlers()
+        last_poll = -float(interface.POLL_INTERVAL)
+        try:
+            while True:
+                timeout = last_poll + interface.POLL_INTERVAL
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        timeout=max(0, timeout - self._loop.time()),
+                    )
+                self._wakeup.clear()
+
+                run_ids, self._pending = self._pending, set()
+                if self._loop.time() >= timeout:
+                    last_poll = self._loop.time()
+                    run_ids |= await self._get_unfinished_run_ids()
+
+                for run_id in run_ids:
+                    self._schedule_update(run_id)
+        finally:
+            self._remove_event_handlers()
+
+    def notify(self, event_type: str, resource: t.Any) -> None:
+        """Handle a job or pod event from the watch threads."""
+        del event_type
+
+        labels = resource.metadata.labels or {}
+        if not (run_id := labels.get(PIPELINE_RUN_LABEL)):
+            return
+
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._mark_pending, int(run_id))
+
+    def _mark_pending(self, run_id: int) -> None:
+        self._pending.add(run_id)
+        if self._wakeup:
+            self._wakeup.set()
+
+    def _schedule_update(self, run_id: int) -> None:
+        if run_id in self._in_progress:
+            # Update again once the current update has finished
+            self._pending.add(run_id)
+            return
+
+        self._in_progress.add(run_id)
+        task = asyncio.create_task(self._update(run_id))
+        self._updates.add(task)
+        task.add_done_callback(self._updates.discard)
+
+    async def _update(self, run_id: int) -> None:
+        try:
+            await asyncer.asyncify(
+                interface.supervise_job_run, limiter=self._limiter
+            )(run_id)
+        except Exception:
+            log.exception("Supervision of pipeline run %s failed", run_id)
+        finally:
+            self._in_progress.discard(run_id)
+            if run_id in self._pending and self._wakeup:
+                self._wakeup.set()
+
+    async def _get_unfinished_run_ids(self) -> set[int]:
+        try:
+            return await asyncer.asyncify(
+                _get_unfinished_run_ids, limiter=self._limiter
+            )()
+        except Exception:
+            log.exception("Fetching unfinished pipeline runs failed")
+            return set()
+
+    def _add_event_handlers(self) -> None:
+        """Receive job and pod events from the informers of the operator.
+
+        The informers are shared with the operator, therefore no additional
+        watch streams are opened. Events of other workloads are ignored
+        in `notify`.
+        """
+        operator = operators.get_operator()
+        self._informers = [operator.job_informer, operator.pod_informer]
+        for _informer in self._informers:
+            _informer.add_event_handler(self.notify)
+
+    def _remove_event_handlers(self) -> None:
+        for _informer in self._informers:
+            _informer.remove_event_handler(self.notify)
+        self._informers = []
+
+
+def _get_unfinished_run_ids() -> set[int]:
+    with database.SessionLocal() as db:
+        return {run.id for run in crud.get_scheduled_or_running_pipelines(db)}
+
+
+supervisor = PipelineRunSupervisor()
+
+
+def start_supervisor() -> None:  # pragma: no cover
+    """Start the pipeline run supervisor in the running event loop.
+
+    Only one supervisor should run at a time. It runs next to the
+    scheduler, i.e., in the backend or in the standalone scheduler process.
+    """
+    supervisor.start()
+
+
+async def stop_supervisor() -> None:  # pragma: no cover
+    await supervisor.stop()
@@ -1,9 +1,21 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import collections
+import dataclasses
 import datetime
+import io
+import json
 import logging
+import threading
+import zipfile
+from collections import abc
+from urllib import parse
 
+import aiohttp
+import asyncer
+import cachetools
 import requests
 from sqlalchemy import orm
 
@@ -14,6 +26,9 @@ from capellacollab.projects.toolmodels.modelsources.git import (
 from capellacollab.projects.toolmodels.modelsources.git import (
     models as git_models,
 )
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    exceptions as git_handler_exceptions,
+)
 from capellacollab.projects.toolmodels.modelsources.git.handler import (
     factory as git_handler_factory,
 )
@@ -22,7 +37,13 @@ from capellacollab.projects.toolmodels.modelsources.git.handler import (
 )
 from capellacollab.sessions import util as sessions_util
 
-from . import exceptions
+from . import exceptions, models
+
+INDEX_PATH = "diagram_cache/index.json"
+
+
+def get_diagram_path(diagram_uuid: str) -> str:
+    return f"diagram_cache/{parse.quote(diagram_uuid, safe='')}.svg"
 
 
 async def fetch_diagram_cache_metadata(
@@ -32,7 +53,7 @@ async def fetch_diagram_cache_metadata(
 ) -> tuple[str | None, datetime.datetime, bytes]:
     try:
         return await handler.get_file_or_artifact(
-            trusted_file_path="diagram_cache/index.json",
+            trusted_file_path=INDEX_PATH,
             logger=logger,
             job_name="update_capella_diagram_cache",
             file_revision=f"diagram-cache/{handler.revision}",
@@ -47,6 +68,210 @@ async def fetch_diagram_cache_metadata(
         raise exceptions.DiagramCacheNotConfiguredProperlyError() from e
 
 
+@dataclasses.dataclass(frozen=True)
+class DiagramCacheIndex:
+    """Parsed diagram cache index
+
+    Attributes
+    ----------
+    job_id : str | None
+        ID of the job which generated the diagram cache.
+        None, if the index was loaded from the diagram cache branch.
+    last_updated : datetime.datetime
+        Last update of the index.
+    diagrams : list[models.DiagramMetadata]
+        All diagrams in the order of the index.
+    diagrams_by_uuid : dict[str, models.DiagramMetadata]
+        Mapping of diagram UUIDs to their metadata.
+    """
+
+    job_id: str | None
+    last_updated: datetime.datetime
+    diagrams: list[models.DiagramMetadata]
+    diagrams_by_uuid: dict[str, models.DiagramMetadata]
+
+
+# Parsed indices by (git model, job ID or revision, last update)
+diagram_cache_indices: cachetools.LRUCache[
+    tuple[int, str, datetime.datetime | None], DiagramCacheIndex
+] = cachetools.LRUCache(maxsize=64)
+_diagram_cache_indices_lock = threading.Lock()
+
+
+async def get_diagram_cache_index(
+    logger: logging.LoggerAdapter,
+    handler: git_handler.GitHandler,
+    job_id: str | None = None,
+) -> DiagramCacheIndex:
+    """Load and parse the diagram cache index.
+
+    Parsed indices are kept in memory. Artifacts of a job don't change,
+    so an index of a known job is returned without fetching it again.
+    """
+    if job_id and (
+        index := _get_cached_index((handler.git_model_id, job_id, None))
+    ):
+        return index
+
+    (
+        job_id,
+        last_updated,
+        index_content,
+    ) = await fetch_diagram_cache_metadata(logger, handler, job_id)
+
+    if job_id:
+        key: tuple[int, str, datetime.datetime | None] = (
+            handler.git_model_id,
+            job_id,
+            None,
+        )
+    else:
+        key = (
+            handler.git_model_id,
+            f"diagram-cache/{handler.revision}",
+            last_updated,
+        )
+
+    if index := _get_cached_index(key):
+        return index
+
+    diagrams = [
+        models.DiagramMetadata.model_validate(diagram_metadata)
+        for diagram_metadata in json.loads(index_content)
+    ]
+    diagrams_by_uuid: dict[str, models.DiagramMetadata] = {}
+    for diagram in diagrams:
+        diagrams_by_uuid.setdefault(diagram.uuid, diagram)
+
+    index = DiagramCacheIndex(
+        job_id=job_id,
+        last_updated=last_updated,
+        diagrams=diagrams,
+        diagrams_by_uuid=diagrams_by_uuid,
+    )
+    with _diagram_cache_indices_lock:
+        diagram_cache_indices[key] = index
+    return index
+
+
+def _get_cached_index(
+    key: tuple[int, str, datetime.datetime | None],
+) -> DiagramCacheIndex | None:
+    with _diagram_cache_indices_lock:
+        return diagram_cache_indices.get(key)
+
+
+# Number of diagrams fetched ahead while streaming an archive
+ARCHIVE_PREFETCH = 8
+
+
+class _ArchiveBuffer(io.RawIOBase):
+    """Unseekable sink which collects the written archive chunks."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def fetch_diagram(
+    logger: logging.LoggerAdapter,
+    handler: git_handler.GitHandler,
+    diagram_uuid: str,
+    job_id: str | None = None,
+) -> bytes:
+    _, _, data = await handler.get_file_or_artifact(
+        trusted_file_path=get_diagram_path(diagram_uuid),
+        logger=logger,
+        job_name="update_capella_diagram_cache",
+        job_id=job_id,
+        file_revision=f"diagram-cache/{handler.revision}",
+    )
+    return data
+
+
+async def stream_diagram_archive(
+    logger: logging.LoggerAdapter,
+    handler: git_handler.GitHandler,
+    index: DiagramCacheIndex,
+    diagrams: list[models.DiagramMetadata],
+) -> abc.AsyncIterator[bytes]:
+    """Stream the SVGs of the diagrams as zip archive.
+
+    The archive is written diagram by diagram, only one diagram is held
+    in memory at a time. Up to `ARCHIVE_PREFETCH` diagrams are fetched
+    ahead and compressed in a worker thread. Diagrams which can't be
+    fetched are skipped, because the response status is already sent
+    at that point.
+    """
+    buffer = _ArchiveBuffer()
+    pending: collections.deque[
+        tuple[models.DiagramMetadata, asyncio.Task[bytes]]
+    ] = collections.deque()
+    remaining = iter(diagrams)
+
+    def prefetch() -> None:
+        while len(pending) < ARCHIVE_PREFETCH and (
+            diagram := next(remaining, None)
+        ):
+            pending.append(
+                (
+                    diagram,
+                    asyncio.create_task(
+                        fetch_diagram(
+                            logger, handler, diagram.uuid, index.job_id
+                        )
+                    ),
+                )
+            )
+
+    try:
+        with zipfile.ZipFile(
+            buffer, mode="w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            prefetch()
+            while pending:
+                diagram, task = pending.popleft()
+                prefetch()
+                try:
+                    content = await task
+                except (
+                    aiohttp.ClientError,
+                    requests.HTTPError,
+                    git_exceptions.GitBaseError,
+                    git_handler_exceptions.GitInstanceRateLimitedError,
+                ):
+                    logger.warning(
+                        "Skipping diagram %s in archive",
+                        diagram.uuid,
+                        exc_info=True,
+                    )
+                    continue
+
+                # Compress in a worker thread to not block the event loop
+                await asyncer.asyncify(archive.writestr)(
+                    f"{diagram.uuid}.svg", content
+                )
+                yield buffer.pop()
+        yield buffer.pop()
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(
+            *(task for _, task in pending), return_exceptions=True
+        )
+
+
 async def build_diagram_cache_api_url(
     logger: logging.LoggerAdapter,
     git_repository: git_models.DatabaseGitModel,
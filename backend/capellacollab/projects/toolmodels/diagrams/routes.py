@@ -3,11 +3,9 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import pathlib
 import typing as t
-from urllib import parse
 
 import fastapi
 import requests
@@ -31,6 +29,8 @@ from . import core, exceptions
 
 router = fastapi.APIRouter()
 
+IMMUTABLE_CACHE_CONTROL = "max-age=604800, immutable"
+
 
 @router.get(
     "",
@@ -54,21 +54,92 @@ async def get_diagram_metadata(
         logging.LoggerAdapter,
         fastapi.Depends(logging_injectables.get_request_logger),
     ],
+    request: fastapi.Request,
+    response: fastapi.Response,
 ):
-    (
-        job_id,
-        last_updated,
-        diagram_metadata_entries,
-    ) = await core.fetch_diagram_cache_metadata(logger, handler)
+    # Identifies the index, if it's stored in the diagram cache branch
+    if head_commit := await handler.get_cached_head_commit(
+        f"diagram-cache/{handler.revision}", logger
+    ):
+        file_etag = responses.make_etag(head_commit, core.INDEX_PATH)
+        if responses.is_not_modified(request, file_etag):
+            return responses.NotModifiedResponse(
+                headers=responses.get_validator_headers(file_etag)
+            )
+
+    index = await core.get_diagram_cache_index(logger, handler)
+
+    etag: str | None = None
+    if index.job_id:
+        etag = responses.make_etag(index.job_id, core.INDEX_PATH)
+    elif file_commit := handler.get_file_commit(
+        core.INDEX_PATH, f"diagram-cache/{handler.revision}"
+    ):
+        etag = responses.make_etag(file_commit, core.INDEX_PATH)
+    headers = responses.get_validator_headers(
+        etag, index.last_updated, stale=handler.served_stale
+    )
+    if responses.is_not_modified(request, etag, index.last_updated):
+        return responses.NotModifiedResponse(headers=headers)
 
-    diagram_metadata_entries = json.loads(diagram_metadata_entries)
+    response.headers.update(headers)
     return models.DiagramCacheMetadata(
-        diagrams=[
-            models.DiagramMetadata.model_validate(diagram_metadata)
-            for diagram_metadata in diagram_metadata_entries
-        ],
-        last_updated=last_updated,
-        job_id=job_id,
+        diagrams=index.diagrams,
+        last_updated=index.last_updated,
+        job_id=index.job_id,
+    )
+
+
+@router.get(
+    "/-/archive",
+    response_class=fastapi.responses.Response,
+    responses=responses.ZIPFileResponse.responses,
+    dependencies=[
+        fastapi.Depends(
+            projects_permissions_injectables.ProjectPermissionValidation(
+                required_scope=projects_permissions_models.ProjectUserScopes(
+                    diagram_cache={permissions_models.UserTokenVerb.GET}
+                )
+            )
+        )
+    ],
+)
+async def get_diagram_archive(
+    handler: t.Annotated[
+        git_handler.GitHandler,
+        fastapi.Depends(git_injectables.get_git_handler),
+    ],
+    logger: t.Annotated[
+        logging.LoggerAdapter,
+        fastapi.Depends(logging_injectables.get_request_logger),
+    ],
+    job_id: str | None = None,
+    uuids: t.Annotated[list[str] | None, fastapi.Query()] = None,
+):
+    """Download the SVGs of multiple diagrams as zip archive.
+
+    If no UUIDs are provided, all successfully rendered diagrams are included.
+    """
+    index = await core.get_diagram_cache_index(logger, handler, job_id)
+
+    if uuids is None:
+        diagrams = [diagram for diagram in index.diagrams if diagram.success]
+    else:
+        diagrams = []
+        for diagram_uuid in dict.fromkeys(uuids):
+            if not (diagram := index.diagrams_by_uuid.get(diagram_uuid)):
+                raise exceptions.DiagramNotFoundError(diagram_uuid)
+            if not diagram.success:
+                raise exceptions.DiagramNotSuccessfulError(diagram_uuid)
+            diagrams.append(diagram)
+
+    headers = {"Content-Disposition": 'attachment; filename="diagrams.zip"'}
+    if job_id:
+        headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+
+    return responses.ZIPFileResponse(
+        core.stream_diagram_archive(logger, handler, index, diagrams),
+        headers=headers,
     )
 
 
@@ -96,52 +167,43 @@ async def get_diagram(
         logging.LoggerAdapter,
         fastapi.Depends(logging_injectables.get_request_logger),
     ],
+    request: fastapi.Request,
     job_id: str | None = None,
 ):
-    fileextension = pathlib.PurePosixPath(diagram_uuid_or_filename).suffix
-    if fileextension and fileextension.lower() != ".svg":
-        raise exceptions.FileExtensionNotSupportedError(fileextension)
-
-    diagram_uuid = pathlib.PurePosixPath(diagram_uuid_or_filename).stem
+    diagram_uuid = _get_diagram_uuid(diagram_uuid_or_filename)
 
-    (
-        job_id,
-        _,
-        diagram_metadata_entries,
-    ) = await core.fetch_diagram_cache_metadata(logger, handler, job_id)
+    # Artifacts of a job don't change, no need to load the index
+    if job_id:
+        etag = responses.make_etag(job_id, diagram_uuid)
+        if responses.is_not_modified(request, etag):
+            return responses.NotModifiedResponse(
+                headers=responses.get_validator_headers(
+                    etag, cache_control=IMMUTABLE_CACHE_CONTROL
+                )
+            )
 
-    diagrams = [
-        models.DiagramMetadata.model_validate(diagram_metadata)
-        for diagram_metadata in json.loads(diagram_metadata_entries)
-    ]
+    index = await core.get_diagram_cache_index(logger, handler, job_id)
+    job_id = index.job_id
 
-    try:
-        diagram = next(
-            diagram for diagram in diagrams if diagram.uuid == diagram_uuid
-        )
-    except StopIteration:
-        raise exceptions.DiagramNotFoundError(diagram_uuid) from None
+    if not (diagram := index.diagrams_by_uuid.get(diagram_uuid)):
+        raise exceptions.DiagramNotFoundError(diagram_uuid)
 
     if not diagram.success:
         raise exceptions.DiagramNotSuccessfulError(diagram_uuid)
 
-    file_path = f"diagram_cache/{parse.quote(diagram_uuid, safe='')}.svg"
-
-    try:
-        _, _, data = await handler.get_file_or_artifact(
-            trusted_file_path=file_path,
-            logger=logger,
-            job_name="update_capella_diagram_cache",
-            job_id=job_id,
-            file_revision=f"diagram-cache/{handler.revision}",
+    head_commit = None
+    if not job_id:
+        head_commit = await handler.get_cached_head_commit(
+            f"diagram-cache/{handler.revision}", logger
         )
+    headers = _get_diagram_headers(index, diagram_uuid, head_commit)
+    if responses.is_not_modified(
+        request, headers.get("ETag"), index.last_updated
+    ):
+        return responses.NotModifiedResponse(headers=headers)
 
-        return responses.SVGResponse(
-            content=data,
-            headers={"Cache-Control": "max-age=604800, immutable"}
-            if job_id
-            else None,
-        )
+    try:
+        data = await core.fetch_diagram(logger, handler, diagram_uuid, job_id)
     except requests.HTTPError as e:
         logger.info(
             "Failed fetching diagram file or artifact %s for %s.",
@@ -150,3 +212,49 @@ async def get_diagram(
             exc_info=True,
         )
         raise exceptions.DiagramCacheNotConfiguredProperlyError() from e
+
+    # The diagram might have been validated at another commit
+    headers = _get_diagram_headers(
+        index,
+        diagram_uuid,
+        handler.get_file_commit(
+            core.get_diagram_path(diagram_uuid),
+            f"diagram-cache/{handler.revision}",
+        ),
+        handler.served_stale,
+    )
+    if responses.is_not_modified(
+        request, headers.get("ETag"), index.last_updated
+    ):
+        return responses.NotModifiedResponse(headers=headers)
+    return responses.SVGResponse(content=data, headers=headers)
+
+
+def _get_diagram_uuid(diagram_uuid_or_filename: str) -> str:
+    fileextension = pathlib.PurePosixPath(diagram_uuid_or_filename).suffix
+    if fileextension and fileextension.lower() != ".svg":
+        raise exceptions.FileExtensionNotSupportedError(fileextension)
+
+    return pathlib.PurePosixPath(diagram_uuid_or_filename).stem
+
+
+def _get_diagram_headers(
+    index: core.DiagramCacheIndex,
+    diagram_uuid: str,
+    file_commit: str | None,
+    stale: bool = False,
+) -> dict[str, str]:
+    if index.job_id:
+        return responses.get_validator_headers(
+            responses.make_etag(index.job_id, diagram_uuid),
+            index.last_updated,
+            cache_control=IMMUTABLE_CACHE_CONTROL,
+        )
+
+    return responses.get_validator_headers(
+        responses.make_etag(file_commit, diagram_uuid)
+        if file_commit
+        else None,
+        index.last_updated,
+        stale=stale,
+    )
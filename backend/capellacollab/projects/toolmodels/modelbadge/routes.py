@@ -18,12 +18,17 @@ from capellacollab.projects.permissions import (
 from capellacollab.projects.permissions import (
     models as projects_permissions_models,
 )
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    exceptions as git_handler_exceptions,
+)
 from capellacollab.projects.toolmodels.modelsources.git.handler import handler
 
 from . import exceptions
 
 router = fastapi.APIRouter()
 
+BADGE_PATH = "model-complexity-badge.svg"
+
 
 @router.get(
     "",
@@ -47,14 +52,26 @@ async def get_model_complexity_badge(
         logging.LoggerAdapter,
         fastapi.Depends(logging_injectables.get_request_logger),
     ],
+    request: fastapi.Request,
 ):
+    # Identifies the badge, if it's stored in the repository
+    if head_commit := await git_handler.get_cached_head_commit(
+        git_handler.revision, logger
+    ):
+        file_etag = responses.make_etag(head_commit, BADGE_PATH)
+        if responses.is_not_modified(request, file_etag):
+            return responses.NotModifiedResponse(
+                headers=responses.get_validator_headers(file_etag)
+            )
+
     try:
-        file_or_artifact = await git_handler.get_file_or_artifact(
-            trusted_file_path="model-complexity-badge.svg",
+        job_id, last_updated, content = await git_handler.get_file_or_artifact(
+            trusted_file_path=BADGE_PATH,
             job_name="generate-model-badge",
             logger=logger,
         )
-        return responses.SVGResponse(content=file_or_artifact[2])
+    except git_handler_exceptions.GitInstanceRateLimitedError:
+        raise
     except Exception as e:
         logger.debug(
             "Failed fetching model badge file or artifact for %s on revision %s.",
@@ -63,3 +80,15 @@ async def get_model_complexity_badge(
             exc_info=True,
         )
         raise exceptions.ModelBadgeNotConfiguredProperlyError() from e
+
+    etag: str | None = None
+    if job_id:
+        etag = responses.make_etag(job_id, BADGE_PATH)
+    elif file_commit := git_handler.get_file_commit(BADGE_PATH):
+        etag = responses.make_etag(file_commit, BADGE_PATH)
+    headers = responses.get_validator_headers(
+        etag, last_updated, stale=git_handler.served_stale
+    )
+    if responses.is_not_modified(request, etag, last_updated):
+        return responses.NotModifiedResponse(headers=headers)
+    return responses.SVGResponse(content=content, headers=headers)
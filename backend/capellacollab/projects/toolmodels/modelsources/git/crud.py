@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import abc
+
 import sqlalchemy as sa
 from sqlalchemy import orm
 
@@ -94,3 +96,19 @@ def update_git_model_repository_id(
 def delete_git_model(db: orm.Session, git_model: models.DatabaseGitModel):
     db.delete(git_model)
     db.commit()
+
+
+def get_git_models_with_projects(
+    db: orm.Session,
+) -> abc.Sequence[models.DatabaseGitModel]:
+    return (
+        db.execute(
+            sa.select(models.DatabaseGitModel).options(
+                orm.selectinload(models.DatabaseGitModel.model).joinedload(
+                    toolsmodels_models.DatabaseToolModel.project
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
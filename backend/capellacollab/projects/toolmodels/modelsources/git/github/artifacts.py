@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import tempfile
+import threading
+import typing as t
+import zipfile
+from collections import abc
+
+import asyncer
+import cachetools
+
+# Number of downloaded artifact archives kept on disk
+MAX_ARCHIVES = 8
+
+type ArchiveKey = tuple[str, ...]
+
+
+class ArtifactArchive:
+    """Downloaded artifact zip file with an index of its members.
+
+    The archive is stored in an anonymous temporary file, which is removed
+    by the operating system once the archive is garbage collected.
+    """
+
+    def __init__(self, file: t.BinaryIO):
+        self._file = file
+        self._zip_file = zipfile.ZipFile(file)
+        self._members = {
+            member.filename: member for member in self._zip_file.infolist()
+        }
+
+    def read(self, name: str) -> bytes | None:
+        """Read a member of the archive. Returns None if it doesn't exist."""
+        if not (member := self._members.get(name)):
+            return None
+        return self._zip_file.read(member)
+
+
+class ArtifactArchiveCache:
+    """Download each artifact archive once and serve members from disk.
+
+    Concurrent requests for the same archive share one download.
+    """
+
+    def __init__(self, maxsize: int = MAX_ARCHIVES):
+        self._archives: cachetools.LRUCache[ArchiveKey, ArtifactArchive] = (
+            cachetools.LRUCache(maxsize=maxsize)
+        )
+        self._downloads: dict[ArchiveKey, asyncio.Task[ArtifactArchive]] = {}
+        self._lock = threading.Lock()
+
+    async def get(
+        self,
+        key: ArchiveKey,
+        download: abc.Callable[[t.BinaryIO], abc.Awaitable[None]],
+    ) -> ArtifactArchive:
+        """Get the archive, download it into the file if it's unknown."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if archive := self._archives.get(key):
+                return archive
+
+            task = self._downloads.get(key)
+            if not task or task.get_loop() is not loop:
+                task = loop.create_task(self._download(key, download))
+                self._downloads[key] = task
+
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._archives.clear()
+
+    async def _download(
+        self,
+        key: ArchiveKey,
+        download: abc.Callable[[t.BinaryIO], abc.Awaitable[None]],
+    ) -> ArtifactArchive:
+        # The file is owned by the archive and closed with it
+        file = tempfile.TemporaryFile()  # noqa: SIM115
+        try:
+            await download(file)
+            archive = await asyncer.asyncify(ArtifactArchive)(file)
+            with self._lock:
+                self._archives[key] = archive
+            return archive
+        except BaseException:
+            file.close()
+            raise
+        finally:
+            with self._lock:
+                if self._downloads.get(key) is asyncio.current_task():
+                    del self._downloads[key]
+
+
+artifact_archives = ArtifactArchiveCache()
@@ -3,18 +3,19 @@
 
 import base64
 import datetime
-import io
+import functools
+import hashlib
 import typing as t
-import zipfile
 from urllib import parse
 
 import aiohttp
 import asyncer
 
-from capellacollab.configuration.app import config
-
 from .. import exceptions as git_exceptions
 from ..handler import handler
+from . import artifacts
+
+ARTIFACT_CHUNK_SIZE = 1024 * 1024
 
 
 class GitHubHandler(handler.GitHandler):
@@ -50,14 +51,12 @@ class GitHubHandler(handler.GitHandler):
         t.Any
             File content as json
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/repos/{self.repository_id}/contents/{parse.quote(trusted_file_path)}?ref={parse.quote(revision, safe='')}",
-                timeout=config.requests.timeout,
-                headers=headers,
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/contents/{parse.quote(trusted_file_path)}?ref={parse.quote(revision, safe='')}",
+            headers=headers,
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
 
     async def get_file_from_repository(
         self, trusted_file_path: str, revision: str | None = None
@@ -75,6 +74,7 @@ class GitHubHandler(handler.GitHandler):
                     revision=revision or self.revision,
                     headers=self.__get_headers(),
                 )
+                return base64.b64decode(json["content"])
             except aiohttp.ClientResponseError as e:
                 if e.status == 404:
                     raise git_exceptions.GitRepositoryFileNotFoundError(
@@ -96,80 +96,86 @@ class GitHubHandler(handler.GitHandler):
         return base64.b64decode(json["content"])
 
     async def get_last_pipeline_runs(self) -> t.Any:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/repos/{self.repository_id}/actions/runs?branch={parse.quote(self.revision, safe='')}&per_page=20",
-                headers=(self.__get_headers() if self.password else None),
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                return (await response.json())["workflow_runs"]
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/actions/runs?branch={parse.quote(self.revision, safe='')}&per_page=20",
+            headers=(self.__get_headers() if self.password else None),
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())["workflow_runs"]
 
     async def get_artifact_from_job(
         self, job_id: str, trusted_path_to_artifact: str
     ) -> bytes:
+        archive = await artifacts.artifact_archives.get(
+            (
+                self.api_url,
+                self.repository_id,
+                job_id,
+                hashlib.sha256(self.password.encode()).hexdigest(),
+            ),
+            functools.partial(self.__download_latest_artifact, job_id),
+        )
+
+        content = await asyncer.asyncify(archive.read)(
+            trusted_path_to_artifact.split("/")[-1]
+        )
+        if content is None:
+            raise git_exceptions.GitRepositoryFileNotFoundError(
+                filename=trusted_path_to_artifact
+            )
+        return content
+
+    async def __download_latest_artifact(
+        self, job_id: str, file: t.BinaryIO
+    ) -> None:
         artifact = await self.__get_latest_artifact_metadata(job_id)
         artifact_id = artifact["id"]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/repos/{self.repository_id}/actions/artifacts/{artifact_id}/zip",
-                headers=self.__get_headers(),
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                content = await response.content.read()
-
-                return await asyncer.asyncify(self.__get_file_content)(
-                    content, trusted_path_to_artifact
-                )
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/actions/artifacts/{artifact_id}/zip",
+            headers=self.__get_headers(),
+        ) as response:
+            response.raise_for_status()
+            write = asyncer.asyncify(file.write)
+            async for chunk in response.content.iter_chunked(
+                ARTIFACT_CHUNK_SIZE
+            ):
+                await write(chunk)
 
     async def get_last_updated_for_file(
         self, file_path: str, revision: str | None = None
     ) -> datetime.datetime:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/repos/{self.repository_id}/commits?path={file_path}&sha={revision or self.revision}",
-                headers=(self.__get_headers() if self.password else None),
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                json = await response.json()
-                if len(json) == 0:
-                    raise git_exceptions.GitRepositoryFileNotFoundError(
-                        filename=file_path
-                    )
-                return datetime.datetime.fromisoformat(
-                    json[0]["commit"]["author"]["date"]
-                )
-
-    async def get_started_at_for_job(self, job_id: str) -> datetime.datetime:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/repos/{self.repository_id}/actions/runs/{parse.quote(job_id, safe='')}",
-                headers=self.__get_headers(),
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                return datetime.datetime.fromisoformat(
-                    (await response.json())["created_at"]
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/commits?path={file_path}&sha={revision or self.revision}",
+            headers=(self.__get_headers() if self.password else None),
+        ) as response:
+            response.raise_for_status()
+            json = await response.json()
+            if len(json) == 0:
+                raise git_exceptions.GitRepositoryFileNotFoundError(
+                    filename=file_path
                 )
+            return datetime.datetime.fromisoformat(
+                json[0]["commit"]["author"]["date"]
+            )
 
-    def __get_file_content(
-        self, content: bytes, trusted_file_path: str
-    ) -> bytes:
-        with zipfile.ZipFile(io.BytesIO(content)) as zip_file:
-            file_list = zip_file.namelist()
-
-            try:
-                file_index = file_list.index(trusted_file_path.split("/")[-1])
-            except ValueError as e:
-                raise git_exceptions.GitRepositoryFileNotFoundError(
-                    filename=trusted_file_path
-                ) from e
+    async def get_head_commit_for_revision(self, revision: str) -> str:
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/commits/{parse.quote(revision)}",
+            headers=(self.__get_headers() if self.password else None),
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())["sha"]
 
-            with zip_file.open(file_list[file_index], "r") as file:
-                return file.read()
+    async def get_started_at_for_job(self, job_id: str) -> datetime.datetime:
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/actions/runs/{parse.quote(job_id, safe='')}",
+            headers=self.__get_headers(),
+        ) as response:
+            response.raise_for_status()
+            return datetime.datetime.fromisoformat(
+                (await response.json())["created_at"]
+            )
 
     def __get_latest_successful_job(
         self, jobs: list, job_name: str
@@ -188,17 +194,15 @@ class GitHubHandler(handler.GitHandler):
         )
 
     async def __get_latest_artifact_metadata(self, job_id: str):
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/repos/{self.repository_id}/actions/runs/{parse.quote(job_id, safe='')}/artifacts",
-                headers=self.__get_headers(),
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                artifact = (await response.json())["artifacts"][0]
-                if artifact["expired"] == "true":
-                    raise git_exceptions.GitHubArtifactExpiredError()
-                return artifact
+        async with self._get(
+            f"{self.api_url}/repos/{self.repository_id}/actions/runs/{parse.quote(job_id, safe='')}/artifacts",
+            headers=self.__get_headers(),
+        ) as response:
+            response.raise_for_status()
+            artifact = (await response.json())["artifacts"][0]
+            if artifact["expired"] == "true":
+                raise git_exceptions.GitHubArtifactExpiredError()
+            return artifact
 
     def __get_headers(self, include_credentials: bool = True) -> dict:
         headers = {
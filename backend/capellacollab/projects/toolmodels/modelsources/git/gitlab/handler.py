@@ -1,11 +1,15 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import base64
 import datetime
+import hashlib
+import threading
 from urllib import parse
 
 import aiohttp
+import cachetools
 
 from capellacollab.configuration.app import config
 
@@ -13,6 +17,16 @@ from .. import exceptions as git_exceptions
 from ..handler import handler
 from . import exceptions
 
+# Number of pipelines whose jobs are fetched concurrently
+PIPELINE_JOBS_CONCURRENCY = 5
+
+# The last successful job changes rarely, but is needed for every diagram,
+# model badge and session provisioning request.
+last_successful_job_runs: cachetools.TTLCache[
+    tuple[str, str, str, str, str], tuple[str, datetime.datetime]
+] = cachetools.TTLCache(maxsize=1024, ttl=30)
+_last_successful_job_runs_lock = threading.Lock()
+
 
 class GitLabHandler(handler.GitHandler):
     @classmethod
@@ -42,11 +56,52 @@ class GitLabHandler(handler.GitHandler):
     async def get_last_successful_job_run(
         self, job_name: str
     ) -> tuple[str, datetime.datetime]:
-        for pipeline_id in await self.__get_last_pipeline_run_ids():
-            if job := await self.__get_job_id_for_job_name(
-                pipeline_id, job_name
-            ):
-                return (str(job[0]), job[1])
+        key = (
+            self.api_url,
+            self.repository_id,
+            self.revision,
+            job_name,
+            hashlib.sha256(self.password.encode()).hexdigest(),
+        )
+        with _last_successful_job_runs_lock:
+            if job_run := last_successful_job_runs.get(key):
+                return job_run
+
+        job_run = await self.__find_last_successful_job_run(job_name)
+        with _last_successful_job_runs_lock:
+            last_successful_job_runs[key] = job_run
+        return job_run
+
+    async def __find_last_successful_job_run(
+        self, job_name: str
+    ) -> tuple[str, datetime.datetime]:
+        """Search the job in the last pipelines, starting with the newest.
+
+        The jobs of the pipelines are fetched concurrently, but evaluated in
+        order. Remaining requests are cancelled once the job is found.
+        """
+        semaphore = asyncio.Semaphore(PIPELINE_JOBS_CONCURRENCY)
+
+        async def get_job(
+            pipeline_id: str,
+        ) -> tuple[str, datetime.datetime] | None:
+            async with semaphore:
+                return await self.__get_job_id_for_job_name(
+                    pipeline_id, job_name
+                )
+
+        tasks = [
+            asyncio.create_task(get_job(pipeline_id))
+            for pipeline_id in await self.__get_last_pipeline_run_ids()
+        ]
+        try:
+            for task in tasks:
+                if job := await task:
+                    return (str(job[0]), job[1])
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         raise git_exceptions.GitPipelineJobNotFoundError(
             job_name=job_name, revision=self.revision
@@ -55,103 +110,97 @@ class GitLabHandler(handler.GitHandler):
     async def get_last_updated_for_file(
         self, file_path: str, revision: str | None = None
     ) -> datetime.datetime:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/projects/{self.repository_id}/repository/commits?ref_name={revision or self.revision}&path={file_path}",
-                headers={"PRIVATE-TOKEN": self.password},
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                json = await response.json()
-                if len(json) == 0:
-                    raise git_exceptions.GitRepositoryFileNotFoundError(
-                        filename=file_path
-                    )
-                return datetime.datetime.fromisoformat(
-                    json[0]["authored_date"]
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/repository/commits?ref_name={revision or self.revision}&path={file_path}",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            response.raise_for_status()
+            json = await response.json()
+            if len(json) == 0:
+                raise git_exceptions.GitRepositoryFileNotFoundError(
+                    filename=file_path
                 )
+            return datetime.datetime.fromisoformat(json[0]["authored_date"])
+
+    async def get_head_commit_for_revision(self, revision: str) -> str:
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/repository/commits/{parse.quote(revision, safe='')}",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())["id"]
 
     async def get_started_at_for_job(self, job_id: str) -> datetime.datetime:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/projects/{self.repository_id}/jobs/{parse.quote(job_id, safe='')}",
-                headers={"PRIVATE-TOKEN": self.password},
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-                return datetime.datetime.fromisoformat(
-                    (await response.json())["started_at"]
-                )
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/jobs/{parse.quote(job_id, safe='')}",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            response.raise_for_status()
+            return datetime.datetime.fromisoformat(
+                (await response.json())["started_at"]
+            )
 
     async def __get_last_pipeline_run_ids(self) -> list[str]:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/projects/{self.repository_id}/pipelines?ref={parse.quote(self.revision, safe='')}&per_page=20",
-                headers={"PRIVATE-TOKEN": self.password},
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/pipelines?ref={parse.quote(self.revision, safe='')}&per_page=20",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            response.raise_for_status()
 
-                return [pipeline["id"] for pipeline in await response.json()]
+            return [pipeline["id"] for pipeline in await response.json()]
 
     async def __get_job_id_for_job_name(
         self, pipeline_id: str, job_name: str
     ) -> tuple[str, datetime.datetime] | None:
         """Search for a job by name in a pipeline"""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/projects/{self.repository_id}/pipelines/{pipeline_id}/jobs",
-                headers={"PRIVATE-TOKEN": self.password},
-                timeout=config.requests.timeout,
-            ) as response:
-                response.raise_for_status()
-
-                for job in await response.json():
-                    if job["name"] == job_name:
-                        if job["status"] == "success":
-                            started_at = datetime.datetime.fromisoformat(
-                                job["started_at"]
-                            )
-                            return job["id"], started_at
-                        if job["status"] == "failed":
-                            raise git_exceptions.GitPipelineJobUnsuccessfulError(
-                                job_name, "failed"
-                            )
-
-                return None
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/pipelines/{pipeline_id}/jobs",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            response.raise_for_status()
+
+            for job in await response.json():
+                if job["name"] == job_name:
+                    if job["status"] == "success":
+                        started_at = datetime.datetime.fromisoformat(
+                            job["started_at"]
+                        )
+                        return job["id"], started_at
+                    if job["status"] == "failed":
+                        raise git_exceptions.GitPipelineJobUnsuccessfulError(
+                            job_name, "failed"
+                        )
+
+            return None
 
     async def get_artifact_from_job(
         self, job_id: str, trusted_path_to_artifact: str
     ) -> bytes:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/projects/{self.repository_id}/jobs/{parse.quote(job_id, safe='')}/artifacts/{trusted_path_to_artifact}",
-                headers={"PRIVATE-TOKEN": self.password},
-                timeout=config.requests.timeout,
-            ) as response:
-                if response.status == 404:
-                    raise git_exceptions.GitRepositoryFileNotFoundError(
-                        filename=trusted_path_to_artifact
-                    )
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/jobs/{parse.quote(job_id, safe='')}/artifacts/{trusted_path_to_artifact}",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            if response.status == 404:
+                raise git_exceptions.GitRepositoryFileNotFoundError(
+                    filename=trusted_path_to_artifact
+                )
 
-                response.raise_for_status()
-                return await response.content.read()
+            response.raise_for_status()
+            return await response.content.read()
 
     async def get_file_from_repository(
         self, trusted_file_path: str, revision: str | None = None
     ) -> bytes:
         branch = revision if revision else self.revision
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.api_url}/projects/{self.repository_id}/repository/files/{parse.quote(trusted_file_path, safe='')}?ref={parse.quote(branch, safe='')}",
-                headers={"PRIVATE-TOKEN": self.password},
-                timeout=config.requests.timeout,
-            ) as response:
-                if response.status == 404:
-                    raise git_exceptions.GitRepositoryFileNotFoundError(
-                        filename=trusted_file_path
-                    )
-                response.raise_for_status()
+        async with self._get(
+            f"{self.api_url}/projects/{self.repository_id}/repository/files/{parse.quote(trusted_file_path, safe='')}?ref={parse.quote(branch, safe='')}",
+            headers={"PRIVATE-TOKEN": self.password},
+        ) as response:
+            if response.status == 404:
+                raise git_exceptions.GitRepositoryFileNotFoundError(
+                    filename=trusted_file_path
+                )
+            response.raise_for_status()
 
-                return base64.b64decode((await response.json())["content"])
+            return base64.b64decode((await response.json())["content"])
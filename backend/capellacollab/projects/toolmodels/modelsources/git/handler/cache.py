@@ -1,56 +1,176 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
 import datetime
+import gzip
 import logging
+import time
+from collections import abc
 
+import asyncer
 import valkey.exceptions
 
+from capellacollab.configuration.app import config
 from capellacollab.core import database
 
+from . import local_cache, metrics
+
 DEFAULT_TTL = datetime.timedelta(days=90)
+HEAD_COMMIT_TTL = datetime.timedelta(seconds=30)
+
+# Number of least recently used entries loaded per eviction round
+EVICTION_BATCH_SIZE = 32
+
+# Locks are released automatically if the holder doesn't release them
+LOCK_TIMEOUT = datetime.timedelta(minutes=2)
+
+# Update a field of an entry only if the entry still exists. Otherwise,
+# a partial entry without TTL, which isn't tracked, would be created.
+HSET_IF_EXISTS_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return redis.call('hset', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+# Larger contents are (de)compressed in a worker thread
+# to not block the event loop
+COMPRESSION_OFFLOAD_THRESHOLD = 64 * 1024
 
 
 class GitValkeyCache:
+    """Valkey cache for files and artifacts of one git model.
+
+    Contents above `valkey.gitCacheCompressionThreshold` bytes are stored
+    gzip-compressed. All keys of a git model are tracked in a sorted set,
+    scored by the time of their last access. Together with the stored
+    size of each entry, the least recently used entries are evicted once
+    the git model exceeds `valkey.gitCacheQuota` bytes. The accounting is
+    approximate when multiple replicas write concurrently.
+
+    Small contents are additionally kept in the in-process
+    `local_cache.local_cache` for a short time.
+    """
+
     def __init__(
         self,
         git_model_id: int,
     ) -> None:
-        self._valkey = database.get_valkey()
+        self._valkey = database.get_valkey(decode_responses=False)
+        self._hset_if_exists = self._valkey.register_script(
+            HSET_IF_EXISTS_SCRIPT
+        )
         self.git_model_id = git_model_id
         super().__init__()
 
     async def get_file_data(
         self, file_path: str, revision: str, logger: logging.LoggerAdapter
-    ) -> tuple[datetime.datetime, bytes] | None:
+    ) -> (
+        tuple[datetime.datetime, bytes, str | None, datetime.datetime | None]
+        | None
+    ):
+        """Return the last update, the content, the head commit
+        of the revision at which the file was last validated
+        and the time of the last validation.
+        """
+        key = self._get_file_key(file_path, revision)
+        if local_file_data := local_cache.local_cache.get(key):
+            return local_file_data
+
         try:
-            file_data = await self._valkey.hmget(
-                name=self._get_file_key(file_path, revision),
-                keys=["last_updated", "content"],
-            )
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "get_file_data"
+            ).time():
+                file_data = await self._get_entry(
+                    key,
+                    [
+                        "last_updated",
+                        "content",
+                        "head_commit",
+                        "encoding",
+                        "validated_at",
+                    ],
+                )
         except valkey.exceptions.ValkeyError:
             logger.exception("Failed to load file data from valkey")
             return None
         if (last_update := file_data[0]) and (content := file_data[1]):
-            last_update = datetime.datetime.fromisoformat(last_update)
-            return last_update, content
+            result = (
+                datetime.datetime.fromisoformat(last_update.decode()),
+                await _decompress(content, file_data[3]),
+                file_data[2].decode() if file_data[2] else None,
+                datetime.datetime.fromisoformat(file_data[4].decode())
+                if file_data[4]
+                else None,
+            )
+            local_cache.local_cache.put(key, result)
+            return result
 
         return None
 
+    async def get_head_commit(
+        self, revision: str, logger: logging.LoggerAdapter
+    ) -> str | None:
+        key = self._get_head_commit_key(revision)
+        if local_head_commit := local_cache.local_cache.get(key):
+            return local_head_commit[0]
+
+        try:
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "get_head_commit"
+            ).time():
+                head_commit = await self._valkey.get(key)
+        except valkey.exceptions.ValkeyError:
+            logger.exception("Failed to load head commit from valkey")
+            return None
+
+        if not head_commit:
+            return None
+
+        local_cache.local_cache.put(key, (head_commit.decode(),))
+        return head_commit.decode()
+
+    async def put_head_commit(
+        self, revision: str, head_commit: str, logger: logging.LoggerAdapter
+    ) -> None:
+        key = self._get_head_commit_key(revision)
+        local_cache.local_cache.put(key, (head_commit,))
+        try:
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "put_head_commit"
+            ).time():
+                async with self._valkey.pipeline(transaction=False) as pipe:
+                    pipe.set(key, head_commit, ex=HEAD_COMMIT_TTL)
+                    pipe.zadd(self._keys_key, {key: time.time()})
+                    await pipe.execute()
+        except valkey.exceptions.ValkeyError:
+            logger.exception("Failed to save head commit to valkey")
+
     async def get_artifact_data(
         self, job_id: str, file_path: str, logger: logging.LoggerAdapter
     ) -> tuple[datetime.datetime, bytes] | None:
+        key = self._get_artifact_key(job_id, file_path)
+        if local_artifact_data := local_cache.local_cache.get(key):
+            return local_artifact_data
+
         try:
-            artifact_data = await self._valkey.hmget(
-                name=self._get_artifact_key(job_id, file_path),
-                keys=["started_at", "content"],
-            )
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "get_artifact_data"
+            ).time():
+                artifact_data = await self._get_entry(
+                    key, ["started_at", "content", "encoding"]
+                )
         except valkey.exceptions.ValkeyError:
             logger.exception("Failed to load artifact data from valkey")
             return None
         if (started_at := artifact_data[0]) and (content := artifact_data[1]):
-            started_at = datetime.datetime.fromisoformat(started_at)
-            return started_at, content
+            result = (
+                datetime.datetime.fromisoformat(started_at.decode()),
+                await _decompress(content, artifact_data[2]),
+            )
+            local_cache.local_cache.put(key, result)
+            return result
 
         return None
 
@@ -61,21 +181,52 @@ class GitValkeyCache:
         content: bytes,
         revision: str,
         logger: logging.LoggerAdapter,
+        head_commit: str | None = None,
     ) -> None:
+        key = self._get_file_key(file_path, revision)
+        validated_at = datetime.datetime.now(datetime.UTC)
+        local_cache.local_cache.put(
+            key, (last_updated, content, head_commit, validated_at)
+        )
         try:
-            await self._valkey.hset(
-                name=self._get_file_key(file_path, revision),
-                mapping={
-                    "last_updated": last_updated.isoformat(),
-                    "content": content,
-                },
-            )
-            await self._valkey.expire(
-                name=self._get_file_key(file_path, revision), time=DEFAULT_TTL
-            )
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "put_file_data"
+            ).time():
+                await self._put_entry(
+                    key,
+                    {
+                        "last_updated": last_updated.isoformat(),
+                        "head_commit": head_commit or "",
+                        "validated_at": validated_at.isoformat(),
+                    },
+                    content,
+                )
         except valkey.exceptions.ValkeyError:
             logger.exception("Failed to save file data to valkey")
 
+    async def touch_file_data(
+        self, file_path: str, revision: str, logger: logging.LoggerAdapter
+    ) -> None:
+        """Mark the cached file as validated now.
+
+        Entries, which were evicted in the meantime, aren't recreated.
+        """
+        key = self._get_file_key(file_path, revision)
+        local_cache.local_cache.pop(key)
+        try:
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "touch_file_data"
+            ).time():
+                await self._hset_if_exists(
+                    keys=[key],
+                    args=[
+                        "validated_at",
+                        datetime.datetime.now(datetime.UTC).isoformat(),
+                    ],
+                )
+        except valkey.exceptions.ValkeyError:
+            logger.exception("Failed to save file validation to valkey")
+
     async def put_artifact_data(
         self,
         job_id: str,
@@ -84,30 +235,184 @@ class GitValkeyCache:
         content: bytes,
         logger: logging.LoggerAdapter,
     ) -> None:
+        key = self._get_artifact_key(job_id, file_path)
+        local_cache.local_cache.put(key, (started_at, content))
         try:
-            await self._valkey.hset(
-                name=self._get_artifact_key(job_id, file_path),
-                mapping={
-                    "started_at": started_at.isoformat(),
-                    "content": content,
-                },
-            )
-            await self._valkey.expire(
-                name=self._get_artifact_key(job_id, file_path),
-                time=DEFAULT_TTL,
-            )
+            with metrics.CACHE_OPERATION_SECONDS.labels(
+                "put_artifact_data"
+            ).time():
+                await self._put_entry(
+                    key,
+                    {"started_at": started_at.isoformat()},
+                    content,
+                )
         except valkey.exceptions.ValkeyError:
             logger.exception("Failed to save artifact data to valkey")
 
     async def clear(self) -> None:
-        async for key in self._valkey.scan_iter(
-            match=f"{self.git_model_id}:*"
-        ):
-            await self._valkey.delete(key)
+        """Delete all tracked keys of the git model.
+
+        Entries of previous versions aren't tracked. They are searched by
+        their prefix once, on the first clear of the git model.
+        """
+        keys = [
+            *await self._valkey.zrange(self._keys_key, 0, -1),
+            self._keys_key,
+            self._sizes_key,
+            self._bytes_key,
+        ]
+        if await self._valkey.set(self._legacy_keys_cleared_key, 1, nx=True):
+            keys += [
+                key
+                async for key in self._valkey.scan_iter(
+                    match=f"{self.git_model_id}:*", count=1000
+                )
+                if key.decode() != self._legacy_keys_cleared_key
+            ]
+        for i in range(0, len(keys), 1000):
+            await self._valkey.delete(*keys[i : i + 1000])
+        metrics.CACHE_BYTES.remove(str(self.git_model_id))
+        await local_cache.publish_invalidation(self.git_model_id)
+
+    def lock_file_data(
+        self, file_path: str, revision: str, logger: logging.LoggerAdapter
+    ) -> contextlib.AbstractAsyncContextManager[bool]:
+        return self._lock(self._get_file_key(file_path, revision), logger)
+
+    def lock_artifact_data(
+        self, job_id: str, file_path: str, logger: logging.LoggerAdapter
+    ) -> contextlib.AbstractAsyncContextManager[bool]:
+        return self._lock(self._get_artifact_key(job_id, file_path), logger)
+
+    @contextlib.asynccontextmanager
+    async def _lock(
+        self, key: str, logger: logging.LoggerAdapter
+    ) -> abc.AsyncIterator[bool]:
+        """Hold a lock across replicas while an entry is loaded.
+
+        Only active if `valkey.gitCacheLocks` is enabled. Yields whether
+        another replica held the lock before, i.e., whether the entry
+        should be loaded from the cache again. If the lock can't be
+        acquired within the request timeout, the entry is loaded anyway.
+        """
+        if not config.valkey.git_cache_locks:
+            yield False
+            return
+
+        lock = self._valkey.lock(
+            f"{key}:lock",
+            timeout=LOCK_TIMEOUT.total_seconds(),
+            blocking_timeout=config.requests.timeout,
+        )
+        acquired = waited = False
+        try:
+            if not (acquired := await lock.acquire(blocking=False)):
+                waited = True
+                acquired = await lock.acquire()
+        except valkey.exceptions.ValkeyError:
+            logger.exception("Failed to acquire lock '%s' in valkey", key)
+
+        try:
+            yield waited
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except valkey.exceptions.ValkeyError:
+                    logger.warning(
+                        "Failed to release lock '%s' in valkey",
+                        key,
+                        exc_info=True,
+                    )
+
+    async def _get_entry(self, key: str, fields: list[str]) -> list:
+        """Load the fields of an entry and mark it as recently used."""
+        async with self._valkey.pipeline(transaction=False) as pipe:
+            pipe.hmget(name=key, keys=fields)
+            pipe.zadd(self._keys_key, {key: time.time()}, xx=True)
+            values, _ = await pipe.execute()
+        return values
+
+    async def _put_entry(
+        self, key: str, fields: dict[str, str | bytes], content: bytes
+    ) -> None:
+        fields["content"], fields["encoding"] = await _compress(content)
+        size = len(key) + sum(
+            len(name) + len(value) for name, value in fields.items()
+        )
+
+        (previous_size,) = await self._valkey.hmget(self._sizes_key, [key])
+        async with self._valkey.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(name=key, mapping=fields)
+            pipe.expire(name=key, time=DEFAULT_TTL)
+            pipe.zadd(self._keys_key, {key: time.time()})
+            pipe.hset(self._sizes_key, key, str(size))
+            pipe.incrby(self._bytes_key, size - int(previous_size or 0))
+            for index_key in (
+                self._keys_key,
+                self._sizes_key,
+                self._bytes_key,
+            ):
+                pipe.expire(index_key, DEFAULT_TTL)
+            total_size = (await pipe.execute())[5]
+
+        metrics.CACHE_BYTES.labels(str(self.git_model_id)).set(total_size)
+        if total_size > config.valkey.git_cache_quota:
+            await self._evict(total_size - config.valkey.git_cache_quota)
+
+    async def _evict(self, excess: int) -> None:
+        """Remove least recently used entries until `excess` bytes are freed."""
+        while excess > 0:
+            keys = await self._valkey.zrange(
+                self._keys_key, 0, EVICTION_BATCH_SIZE - 1
+            )
+            if not keys:
+                await self._valkey.delete(self._bytes_key)
+                metrics.CACHE_BYTES.remove(str(self.git_model_id))
+                return
+
+            sizes = await self._valkey.hmget(self._sizes_key, keys)
+            evicted_keys, evicted_size = [], 0
+            for key, size in zip(keys, sizes, strict=True):
+                evicted_keys.append(key)
+                evicted_size += int(size or 0)
+                if evicted_size >= excess:
+                    break
+
+            async with self._valkey.pipeline(transaction=True) as pipe:
+                pipe.delete(*evicted_keys)
+                pipe.zrem(self._keys_key, *evicted_keys)
+                pipe.hdel(self._sizes_key, *evicted_keys)
+                pipe.decrby(self._bytes_key, evicted_size)
+                total_size = (await pipe.execute())[3]
+
+            metrics.CACHE_BYTES.labels(str(self.git_model_id)).set(total_size)
+
+            excess -= evicted_size
+
+    @property
+    def _keys_key(self) -> str:
+        return f"{self.git_model_id}:keys"
+
+    @property
+    def _sizes_key(self) -> str:
+        return f"{self.git_model_id}:sizes"
+
+    @property
+    def _bytes_key(self) -> str:
+        return f"{self.git_model_id}:bytes"
+
+    @property
+    def _legacy_keys_cleared_key(self) -> str:
+        return f"{self.git_model_id}:legacy-keys-cleared"
 
     def _get_file_key(self, file_path: str, revision: str) -> str:
         return f"{self.git_model_id}:f:{self._escape_string(revision)}:{self._escape_string(file_path)}"
 
+    def _get_head_commit_key(self, revision: str) -> str:
+        return f"{self.git_model_id}:h:{self._escape_string(revision)}"
+
     def _get_artifact_key(self, job_id: str, file_path: str) -> str:
         return (
             f"{self.git_model_id}:a:{job_id}:{self._escape_string(file_path)}"
@@ -115,3 +420,42 @@ class GitValkeyCache:
 
     def _escape_string(self, string: str) -> str:
         return string.replace(":", "-")
+
+
+async def get_cached_bytes(git_model_ids: list[int]) -> dict[int, int]:
+    """Return the number of bytes stored in the cache per git model."""
+    if not git_model_ids:
+        return {}
+
+    sizes = await database.get_valkey(decode_responses=False).mget(
+        [f"{git_model_id}:bytes" for git_model_id in git_model_ids]
+    )
+    return {
+        git_model_id: int(size or 0)
+        for git_model_id, size in zip(git_model_ids, sizes, strict=True)
+    }
+
+
+async def _compress(content: bytes) -> tuple[bytes, str]:
+    if len(content) < config.valkey.git_cache_compression_threshold:
+        return content, ""
+
+    if len(content) < COMPRESSION_OFFLOAD_THRESHOLD:
+        compressed = gzip.compress(content, compresslevel=6)
+    else:
+        compressed = await asyncer.asyncify(gzip.compress)(
+            content, compresslevel=6
+        )
+
+    if len(compressed) >= len(content):
+        return content, ""
+    return compressed, "gzip"
+
+
+async def _decompress(content: bytes, encoding: bytes | None) -> bytes:
+    if encoding != b"gzip":
+        return content
+
+    if len(content) < COMPRESSION_OFFLOAD_THRESHOLD:
+        return gzip.decompress(content)
+    return await asyncer.asyncify(gzip.decompress)(content)
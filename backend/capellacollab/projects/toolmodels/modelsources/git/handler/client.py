@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+
+import aiohttp
+
+from capellacollab.configuration.app import config
+
+log = logging.getLogger(__name__)
+
+
+class GitClientSessionPool:
+    """Application-wide HTTP client sessions for Git instance APIs.
+
+    One `aiohttp.ClientSession` is kept per API URL, so that connections
+    (including the TLS handshake) and DNS lookups are reused between the
+    requests of all Git handlers. The sessions are bound to the event loop
+    in which the pool was opened. In any other event loop, no session is
+    returned and the handlers fall back to a short-lived session.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+
+    def open(self) -> None:
+        """Start handing out sessions in the running event loop."""
+        self._loop = asyncio.get_running_loop()
+
+    async def close(self) -> None:
+        sessions, self._sessions = self._sessions, {}
+        self._loop = None
+        for session in sessions.values():
+            await session.close()
+
+    def get(self, api_url: str) -> aiohttp.ClientSession | None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        if loop is not self._loop:
+            return None
+
+        session = self._sessions.get(api_url)
+        if session is None or session.closed:
+            log.debug("Opening HTTP client session for '%s'", api_url)
+            session = self._sessions[api_url] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=config.requests.connection_limit_per_host,
+                    keepalive_timeout=config.requests.keepalive_timeout,
+                    ttl_dns_cache=config.requests.dns_cache_ttl,
+                ),
+            )
+        return session
+
+
+session_pool = GitClientSessionPool()
+
+
+def open_session_pool() -> None:  # pragma: no cover
+    session_pool.open()
+
+
+async def close_session_pool() -> None:  # pragma: no cover
+    await session_pool.close()
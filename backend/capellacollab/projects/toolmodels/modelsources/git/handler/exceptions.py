@@ -37,6 +37,24 @@ class NoMatchingGitInstanceError(core_exceptions.BaseError):
         return cls()
 
 
+class GitInstanceRateLimitedError(core_exceptions.BaseError):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            title="Git instance rate limit exceeded",
+            reason=(
+                "The request limit of the Git instance is exhausted. "
+                f"Please try again in {retry_after} seconds."
+            ),
+            err_code="GIT_INSTANCE_RATE_LIMITED",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    @classmethod
+    def openapi_example(cls) -> "GitInstanceRateLimitedError":
+        return cls(60)
+
+
 class GitInstanceAPIEndpointNotFoundError(core_exceptions.BaseError):
     def __init__(self):
         super().__init__(
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import aiohttp
 import asyncer
 from sqlalchemy import orm
 
@@ -12,7 +13,7 @@ import capellacollab.settings.modelsources.git.models as settings_git_models
 
 from ..github import handler as github_handler
 from ..gitlab import handler as gitlab_handler
-from . import exceptions, handler
+from . import client, exceptions, handler
 
 
 class GitHandlerFactory:
@@ -70,6 +71,7 @@ class GitHandlerFactory:
             git_instance.api_url,
             git_instance.type,
             revision,
+            client.session_pool.get(git_instance.api_url),
         )
 
     @staticmethod
@@ -117,6 +119,7 @@ class GitHandlerFactory:
         git_instance_api_url: str,
         git_instance_type: settings_git_models.GitType,
         revision: str,
+        client_session: aiohttp.ClientSession | None = None,
     ) -> handler.GitHandler:
         match git_instance_type:
             case settings_git_models.GitType.GITLAB:
@@ -127,6 +130,7 @@ class GitHandlerFactory:
                     git_model.password,
                     git_instance_api_url,
                     git_model_repository_id,
+                    client_session,
                 )
             case settings_git_models.GitType.GITHUB:
                 return github_handler.GitHubHandler(
@@ -136,6 +140,7 @@ class GitHandlerFactory:
                     git_model.password,
                     git_instance_api_url,
                     git_model_repository_id,
+                    client_session,
                 )
             case _:
                 raise exceptions.GitInstanceUnsupportedError(
@@ -4,13 +4,35 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import contextlib
 import datetime
+import hashlib
 import logging
+import typing as t
+from collections import abc as collections_abc
 
+import aiohttp
 import requests
 
+from capellacollab.configuration.app import config
+
 from .. import exceptions as git_exceptions
-from . import cache
+from . import cache, exceptions, metrics, ratelimit, singleflight
+
+# Errors of requests to the Git instance, during which cached data is used
+UPSTREAM_ERRORS = (
+    aiohttp.ClientError,
+    TimeoutError,
+    exceptions.GitInstanceRateLimitedError,
+)
+
+type FileData = tuple[
+    datetime.datetime, bytes, str | None, datetime.datetime | None
+]
+
+# Strong references to running background refreshes
+_background_refreshes: set[asyncio.Task] = set()
 
 
 class GitHandler:
@@ -22,13 +44,90 @@ class GitHandler:
         password: str,
         api_url: str,
         repository_id: str,
+        client_session: aiohttp.ClientSession | None = None,
     ) -> None:
+        self.git_model_id = git_model_id
         self.path = path
         self.revision = revision
         self.password = password
         self.api_url = api_url
         self.repository_id = repository_id
+        self.client_session = client_session
         self.cache = cache.GitValkeyCache(git_model_id)
+        # Head commits at which the returned files were validated
+        self._file_commits: dict[tuple[str, str], str] = {}
+        # Whether a cached file was served without validation
+        self.served_stale = False
+
+    @contextlib.asynccontextmanager
+    async def _get(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> collections_abc.AsyncIterator[aiohttp.ClientResponse]:
+        """Send a GET request via the shared client session.
+
+        If no shared session is available, a short-lived session is used.
+        The rate limit budget of the token is checked before the request
+        and updated from the response.
+        """
+        headers = headers or {}
+        await ratelimit.rate_limiter.acquire(self.api_url, headers)
+        async with contextlib.AsyncExitStack() as stack:
+            if self.client_session:
+                session = self.client_session
+            else:
+                session = await stack.enter_async_context(
+                    aiohttp.ClientSession()
+                )
+
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=config.requests.timeout),
+            ) as response:
+                if ratelimit.rate_limiter.update(
+                    self.api_url, headers, response.status, response.headers
+                ):
+                    raise exceptions.GitInstanceRateLimitedError(
+                        ratelimit.rate_limiter.get_retry_after(
+                            self.api_url, headers
+                        )
+                    )
+                yield response
+
+    async def _call_upstream[**P, T](
+        self,
+        method: collections_abc.Callable[P, collections_abc.Awaitable[T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Call a method requesting the Git instance and time it."""
+        with metrics.observe_upstream_request(
+            self.git_model_id, self.api_url, method.__name__
+        ):
+            return await method(*args, **kwargs)
+
+    async def _coalesce[T](
+        self,
+        name: str,
+        key: tuple[str, ...],
+        call: collections_abc.Callable[
+            [], collections_abc.Coroutine[t.Any, t.Any, T]
+        ],
+    ) -> T:
+        """Share the call with concurrent identical calls in this process."""
+        result, shared = await singleflight.flights.do(
+            (
+                name,
+                self.api_url,
+                self.repository_id,
+                hashlib.sha256(self.password.encode()).hexdigest(),
+                *key,
+            ),
+            call,
+        )
+        if shared:
+            metrics.COALESCED_CALLS.labels(name).inc()
+        return result
 
     @classmethod
     @abc.abstractmethod
@@ -132,6 +231,22 @@ class GitHandler:
             If the file does not exist in the revision.
         """
 
+    @abc.abstractmethod
+    async def get_head_commit_for_revision(self, revision: str) -> str:
+        """
+        Retrieve the commit hash the specified revision points to.
+
+        Args
+        ----
+        revision : str
+            The branch, tag or commit.
+
+        Returns
+        -------
+        str
+            The hash of the head commit of the revision.
+        """
+
     @abc.abstractmethod
     async def get_started_at_for_job(self, job_id: str) -> datetime.datetime:
         """
@@ -154,31 +269,270 @@ class GitHandler:
         logger: logging.LoggerAdapter,
         revision: str | None = None,
     ) -> tuple[datetime.datetime, bytes]:
+        """Get a file of the repository.
+
+        Cached files are served without waiting for the Git instance
+        while they were validated within the maximum staleness. In that
+        case, the file is refreshed in the background and the handler
+        is marked via `served_stale`. The same applies if the file can't
+        be validated, because the Git instance is unavailable.
+        """
         if not revision:
             revision = self.revision
 
-        last_updated = await self.get_last_updated_for_file(
-            trusted_file_path, revision
+        last_updated, content, head_commit, stale = await self._coalesce(
+            "get_file",
+            (revision, trusted_file_path),
+            lambda: self._get_file(trusted_file_path, logger, revision),
+        )
+        if stale:
+            self.served_stale = True
+        if head_commit:
+            self._file_commits[(revision, trusted_file_path)] = head_commit
+        return last_updated, content
+
+    def get_file_commit(
+        self, trusted_file_path: str, revision: str | None = None
+    ) -> str | None:
+        """Return the head commit at which a file returned by this
+        handler was last validated, if known.
+
+        Together with the path, it identifies the content of the file.
+        """
+        return self._file_commits.get(
+            (revision or self.revision, trusted_file_path)
+        )
+
+    async def _get_file(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        revision: str,
+    ) -> tuple[datetime.datetime, bytes, str | None, bool]:
+        file_data = await self.cache.get_file_data(
+            trusted_file_path, revision, logger
+        )
+        if not file_data:
+            return await self._validate_file(
+                trusted_file_path, logger, revision, file_data
+            )
+
+        head_commit = await self.cache.get_head_commit(revision, logger)
+        if head_commit and file_data[2] == head_commit:
+            return await self._use_cached_file(
+                trusted_file_path, logger, revision, file_data
+            )
+
+        # The head commit is unknown or has moved
+        if _is_within_max_staleness(file_data[3]):
+            logger.debug(
+                "Serving stale file '%s' of revision '%s' from cache",
+                trusted_file_path,
+                revision,
+            )
+            metrics.CACHE_LOOKUPS.labels("file", "served_stale").inc()
+            self._refresh_file_in_background(
+                trusted_file_path, logger, revision
+            )
+            return file_data[0], file_data[1], file_data[2], True
+
+        return await self._validate_file(
+            trusted_file_path, logger, revision, file_data
         )
 
-        if file_data := await self.cache.get_file_data(
+    async def _validate_file(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        revision: str,
+        file_data: FileData | None,
+    ) -> tuple[datetime.datetime, bytes, str | None, bool]:
+        head_commit = await self.get_head_commit(revision, logger)
+        if file_data and head_commit and file_data[2] == head_commit:
+            return await self._use_cached_file(
+                trusted_file_path, logger, revision, file_data
+            )
+
+        async with self.cache.lock_file_data(
             trusted_file_path, revision, logger
-        ):
+        ) as waited:
+            if waited:
+                # Another replica might have loaded the file meanwhile
+                file_data = await self.cache.get_file_data(
+                    trusted_file_path, revision, logger
+                )
+                if file_data and head_commit and file_data[2] == head_commit:
+                    metrics.CACHE_LOOKUPS.labels("file", "hit").inc()
+                    return file_data[0], file_data[1], head_commit, False
+
+            try:
+                last_updated, content = await self._load_file(
+                    trusted_file_path, logger, revision, head_commit, file_data
+                )
+            except UPSTREAM_ERRORS:
+                if not file_data:
+                    raise
+
+                logger.warning(
+                    "Couldn't validate file '%s' of revision '%s',"
+                    " serving it from cache",
+                    trusted_file_path,
+                    revision,
+                    exc_info=True,
+                )
+                metrics.CACHE_LOOKUPS.labels("file", "served_stale").inc()
+                return file_data[0], file_data[1], file_data[2], True
+
+            return last_updated, content, head_commit, False
+
+    async def _use_cached_file(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        revision: str,
+        file_data: FileData,
+    ) -> tuple[datetime.datetime, bytes, str | None, bool]:
+        logger.debug(
+            "Found file '%s' in cache, revision '%s' is unchanged",
+            trusted_file_path,
+            revision,
+        )
+        metrics.CACHE_LOOKUPS.labels("file", "hit").inc()
+
+        # Keep the time of the last validation recent enough
+        # to serve the file while the head commit is unknown.
+        validated_at = file_data[3]
+        if not validated_at or _get_age(validated_at) > cache.HEAD_COMMIT_TTL:
+            await self.cache.touch_file_data(
+                trusted_file_path, revision, logger
+            )
+
+        return file_data[0], file_data[1], file_data[2], False
+
+    def _refresh_file_in_background(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        revision: str,
+    ) -> None:
+        async def refresh() -> None:
+            try:
+                with ratelimit.background_priority():
+                    await self._coalesce(
+                        "refresh_file",
+                        (revision, trusted_file_path),
+                        lambda: self._refresh_file(
+                            trusted_file_path, logger, revision
+                        ),
+                    )
+            except exceptions.GitInstanceRateLimitedError:
+                logger.debug(
+                    "Postponed refresh of file '%s' because of rate limits",
+                    trusted_file_path,
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to refresh file '%s' of revision '%s'",
+                    trusted_file_path,
+                    revision,
+                    exc_info=True,
+                )
+
+        task = asyncio.create_task(refresh())
+        _background_refreshes.add(task)
+        task.add_done_callback(_background_refreshes.discard)
+
+    async def _refresh_file(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        revision: str,
+    ) -> None:
+        file_data = await self.cache.get_file_data(
+            trusted_file_path, revision, logger
+        )
+        await self._validate_file(
+            trusted_file_path, logger, revision, file_data
+        )
+
+    async def _load_file(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        revision: str,
+        head_commit: str | None,
+        file_data: FileData | None,
+    ) -> tuple[datetime.datetime, bytes]:
+        last_updated = await self._call_upstream(
+            self.get_last_updated_for_file, trusted_file_path, revision
+        )
+
+        if file_data:
             logger.debug("Found file '%s' in cache", trusted_file_path)
-            last_updated_cache, content_cache = file_data
+            last_updated_cache, content_cache, _, _ = file_data
 
             if last_updated == last_updated_cache:
+                await self.cache.put_file_data(
+                    trusted_file_path,
+                    last_updated_cache,
+                    content_cache,
+                    revision,
+                    logger,
+                    head_commit,
+                )
+                metrics.CACHE_LOOKUPS.labels("file", "revalidated").inc()
                 return last_updated_cache, content_cache
 
-        content = await self.get_file_from_repository(
-            trusted_file_path, revision
+            metrics.CACHE_LOOKUPS.labels("file", "stale").inc()
+        else:
+            metrics.CACHE_LOOKUPS.labels("file", "miss").inc()
+
+        content = await self._call_upstream(
+            self.get_file_from_repository, trusted_file_path, revision
         )
         await self.cache.put_file_data(
-            trusted_file_path, last_updated, content, revision, logger
+            trusted_file_path,
+            last_updated,
+            content,
+            revision,
+            logger,
+            head_commit,
         )
 
         return last_updated, content
 
+    async def get_cached_head_commit(
+        self, revision: str, logger: logging.LoggerAdapter
+    ) -> str | None:
+        """Get the head commit of the revision if it's cached."""
+        return await self.cache.get_head_commit(revision, logger)
+
+    async def get_head_commit(
+        self, revision: str, logger: logging.LoggerAdapter
+    ) -> str | None:
+        """Get the head commit of the revision, cached for a short time.
+
+        Files in the cache are up to date as long as the head commit of
+        their revision doesn't change.
+        """
+        if head_commit := await self.cache.get_head_commit(revision, logger):
+            return head_commit
+
+        try:
+            head_commit = await self._call_upstream(
+                self.get_head_commit_for_revision, revision
+            )
+        except UPSTREAM_ERRORS:
+            logger.debug(
+                "Couldn't resolve head commit of revision '%s'",
+                revision,
+                exc_info=True,
+            )
+            return None
+
+        await self.cache.put_head_commit(revision, head_commit, logger)
+        return head_commit
+
     async def get_artifact(
         self,
         trusted_file_path: str,
@@ -188,10 +542,30 @@ class GitHandler:
     ) -> tuple[str, datetime.datetime, bytes]:
         started_at = None
         if not job_id:
-            job_id, started_at = await self.get_last_successful_job_run(
-                job_name
+            last_job_run = await self._coalesce(
+                "get_last_successful_job_run",
+                (job_name,),
+                lambda: self._call_upstream(
+                    self.get_last_successful_job_run, job_name
+                ),
             )
+            job_id, started_at = last_job_run
+
+        return await self._coalesce(
+            "get_artifact",
+            (job_id, trusted_file_path),
+            lambda: self._get_artifact(
+                trusted_file_path, logger, job_id, started_at
+            ),
+        )
 
+    async def _get_artifact(
+        self,
+        trusted_file_path: str,
+        logger: logging.LoggerAdapter,
+        job_id: str,
+        started_at: datetime.datetime | None,
+    ) -> tuple[str, datetime.datetime, bytes]:
         if artifact_data := await self.cache.get_artifact_data(
             job_id, trusted_file_path, logger
         ):
@@ -200,12 +574,41 @@ class GitHandler:
                 trusted_file_path,
                 job_id,
             )
+            metrics.CACHE_LOOKUPS.labels("artifact", "hit").inc()
             return job_id, artifact_data[0], artifact_data[1]
 
+        async with self.cache.lock_artifact_data(
+            job_id, trusted_file_path, logger
+        ) as waited:
+            # Another replica might have loaded the artifact meanwhile
+            if waited and (
+                artifact_data := await self.cache.get_artifact_data(
+                    job_id, trusted_file_path, logger
+                )
+            ):
+                metrics.CACHE_LOOKUPS.labels("artifact", "hit").inc()
+                return job_id, artifact_data[0], artifact_data[1]
+
+            return await self._load_artifact(
+                trusted_file_path, job_id, started_at, logger
+            )
+
+    async def _load_artifact(
+        self,
+        trusted_file_path: str,
+        job_id: str,
+        started_at: datetime.datetime | None,
+        logger: logging.LoggerAdapter,
+    ) -> tuple[str, datetime.datetime, bytes]:
+        metrics.CACHE_LOOKUPS.labels("artifact", "miss").inc()
         if not started_at:
-            started_at = await self.get_started_at_for_job(job_id)
+            started_at = await self._call_upstream(
+                self.get_started_at_for_job, job_id
+            )
 
-        content = await self.get_artifact_from_job(job_id, trusted_file_path)
+        content = await self._call_upstream(
+            self.get_artifact_from_job, job_id, trusted_file_path
+        )
         await self.cache.put_artifact_data(
             job_id, trusted_file_path, started_at, content, logger
         )
@@ -235,3 +638,15 @@ class GitHandler:
         return await self.get_artifact(
             trusted_file_path, job_name, logger, job_id
         )
+
+
+def _get_age(timestamp: datetime.datetime) -> datetime.timedelta:
+    return datetime.datetime.now(datetime.UTC) - timestamp
+
+
+def _is_within_max_staleness(validated_at: datetime.datetime | None) -> bool:
+    return bool(
+        validated_at
+        and _get_age(validated_at)
+        <= datetime.timedelta(seconds=config.valkey.git_cache_max_staleness)
+    )
@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import logging
+import threading
+import typing as t
+
+import cachetools
+import valkey.exceptions
+
+from capellacollab.core import database
+
+from . import metrics
+
+log = logging.getLogger(__name__)
+
+# Entries are only kept for a short time. Changes by other replicas,
+# which are not announced via the invalidation channel, become visible
+# after this time.
+LOCAL_TTL = 10
+MAX_ENTRIES = 1024
+MAX_BYTES = 32 * 1024 * 1024
+# Larger contents are only cached in Valkey
+MAX_ENTRY_SIZE = 256 * 1024
+
+INVALIDATION_CHANNEL = "git-cache-invalidations"
+RECONNECT_INTERVAL = 5
+
+
+def _get_size(value: tuple) -> int:
+    return 1 + sum(
+        len(item) for item in value if isinstance(item, str | bytes)
+    )
+
+
+class LocalGitCache:
+    """In-process LRU cache in front of the Valkey git cache.
+
+    Entries are keyed by their Valkey key and bounded by the number of
+    entries and their total size. Only small contents are stored, which
+    are requested on most pages (e.g. READMEs and badges). When the cache
+    of a git model is cleared, all replicas are notified via a Valkey
+    pub/sub channel and drop the entries of the git model.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MAX_ENTRIES,
+        maxbytes: int = MAX_BYTES,
+        ttl: int = LOCAL_TTL,
+    ):
+        self._entries: cachetools.TTLCache[str, tuple] = cachetools.TTLCache(
+            maxsize=maxbytes, ttl=ttl, getsizeof=_get_size
+        )
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple | None:
+        with self._lock:
+            value = self._entries.get(key)
+
+        metrics.LOCAL_CACHE_LOOKUPS.labels(
+            "hit" if value is not None else "miss"
+        ).inc()
+        return value
+
+    def put(self, key: str, value: tuple) -> None:
+        with self._lock:
+            if _get_size(value) > MAX_ENTRY_SIZE:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = value
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem()
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, git_model_id: int) -> None:
+        prefix = f"{git_model_id}:"
+        with self._lock:
+            for key in [
+                key for key in self._entries if key.startswith(prefix)
+            ]:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalGitCache()
+
+
+async def publish_invalidation(git_model_id: int) -> None:
+    """Drop the entries of the git model in all replicas."""
+    local_cache.invalidate(git_model_id)
+    await database.get_valkey().publish(
+        INVALIDATION_CHANNEL, str(git_model_id)
+    )
+
+
+class InvalidationListener:
+    """Drop local entries when another replica clears the cache of a model."""
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except valkey.exceptions.ValkeyError:
+                log.warning(
+                    "Lost subscription to git cache invalidations, retrying",
+                    exc_info=True,
+                )
+            await asyncio.sleep(RECONNECT_INTERVAL)
+
+    async def _listen(self) -> None:
+        async with database.get_valkey().pubsub() as pubsub:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Invalidations might have been missed while disconnected
+            local_cache.clear()
+
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                self.handle_message(message["data"])
+
+    def handle_message(self, data: t.Any) -> None:
+        try:
+            git_model_id = int(data)
+        except ValueError:
+            log.warning("Ignoring invalid git cache invalidation %r", data)
+            return
+
+        local_cache.invalidate(git_model_id)
+
+
+invalidation_listener = InvalidationListener()
+
+
+def start_invalidation_listener() -> None:  # pragma: no cover
+    invalidation_listener.start()
+
+
+async def stop_invalidation_listener() -> None:  # pragma: no cover
+    await invalidation_listener.stop()
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import collections
+import contextlib
+import dataclasses
+import threading
+import time
+import urllib.parse
+from collections import abc
+
+import prometheus_client
+
+CACHE_LOOKUPS = prometheus_client.Counter(
+    "backend_git_cache_lookups",
+    "Lookups of files and artifacts in the git cache",
+    ("kind", "result"),
+)
+LOCAL_CACHE_LOOKUPS = prometheus_client.Counter(
+    "backend_git_local_cache_lookups",
+    "Lookups in the in-process cache in front of the git cache",
+    ("result",),
+)
+CACHE_OPERATION_SECONDS = prometheus_client.Histogram(
+    "backend_git_cache_operation_seconds",
+    "Duration of git cache operations in Valkey",
+    ("operation",),
+)
+CACHE_BYTES = prometheus_client.Gauge(
+    "backend_git_cache_bytes",
+    "Bytes stored in the git cache per git model",
+    ("git_model_id",),
+)
+COALESCED_CALLS = prometheus_client.Counter(
+    "backend_git_coalesced_calls",
+    "Git handler calls which joined an identical running call",
+    ("method",),
+)
+UPSTREAM_REQUEST_SECONDS = prometheus_client.Histogram(
+    "backend_git_upstream_request_seconds",
+    "Duration of requests to the API of Git instances",
+    ("instance", "method"),
+)
+UPSTREAM_RATE_LIMIT_REMAINING = prometheus_client.Gauge(
+    "backend_git_upstream_rate_limit_remaining",
+    "Remaining requests in the rate limit budget of a token for a Git instance",
+    ("instance", "token"),
+)
+UPSTREAM_RATE_LIMITED_REQUESTS = prometheus_client.Counter(
+    "backend_git_upstream_rate_limited_requests",
+    "Requests to Git instances which were delayed, rejected or limited"
+    " because of rate limits",
+    ("instance", "priority", "result"),
+)
+
+
+@dataclasses.dataclass
+class UpstreamUsage:
+    requests: int = 0
+    seconds: float = 0.0
+
+
+# Time spent in requests to Git instances per git model in this process
+upstream_usage: collections.defaultdict[int, UpstreamUsage] = (
+    collections.defaultdict(UpstreamUsage)
+)
+_upstream_usage_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def observe_upstream_request(
+    git_model_id: int, api_url: str, method: str
+) -> abc.Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        UPSTREAM_REQUEST_SECONDS.labels(
+            urllib.parse.urlparse(api_url).netloc, method
+        ).observe(duration)
+        with _upstream_usage_lock:
+            usage = upstream_usage[git_model_id]
+            usage.requests += 1
+            usage.seconds += duration
+
+
+def get_upstream_usage() -> dict[int, UpstreamUsage]:
+    with _upstream_usage_lock:
+        return {
+            git_model_id: dataclasses.replace(usage)
+            for git_model_id, usage in upstream_usage.items()
+        }
+
+
+def clear_upstream_usage() -> None:
+    with _upstream_usage_lock:
+        upstream_usage.clear()
@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import email.utils
+import enum
+import hashlib
+import math
+import threading
+import time
+import urllib.parse
+from collections import abc
+
+from capellacollab.configuration.app import config
+
+from . import exceptions, metrics
+
+# Backoff for rate limits without information about their reset,
+# e.g. the secondary rate limits of GitHub
+MIN_BACKOFF = 60
+MAX_BACKOFF = 15 * 60
+
+
+class RequestPriority(enum.StrEnum):
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    "git_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextlib.contextmanager
+def background_priority() -> abc.Iterator[None]:
+    """Send the requests to Git instances in this context as background
+    requests, which don't use the budget reserved for users.
+    """
+    token = _priority.set(RequestPriority.BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@dataclasses.dataclass
+class RateLimitBudget:
+    limit: int | None = None
+    remaining: int | None = None
+    # Timestamps in seconds since the epoch
+    reset_at: float | None = None
+    blocked_until: float = 0.0
+    backoff: float = 0.0
+
+
+class UpstreamRateLimiter:
+    """Track the rate limit budget of each token per Git instance API.
+
+    The budget is read from the `X-RateLimit-*` (GitHub) and `RateLimit-*`
+    (GitLab) headers of the responses. Once the Git instance rejects
+    requests, no further requests are sent until the time given by
+    `Retry-After` or the reset of the budget, otherwise with an
+    exponential backoff. Background requests leave a share of the budget
+    to interactive requests.
+    """
+
+    def __init__(self) -> None:
+        self._budgets: dict[tuple[str, str], RateLimitBudget] = {}
+        self._lock = threading.Lock()
+
+    async def acquire(self, api_url: str, headers: dict[str, str]) -> None:
+        """Wait until a request may be sent with the headers.
+
+        Interactive requests wait up to the request timeout, background
+        requests don't wait at all. Otherwise, the request is rejected.
+        """
+        priority = _priority.get()
+        key = _get_key(api_url, headers)
+        with self._lock:
+            delay = self._get_delay(key, priority)
+            budget = self._budgets.get(key)
+            if not delay and budget and budget.remaining is not None:
+                budget.remaining -= 1
+
+        if not delay:
+            return
+
+        instance = urllib.parse.urlparse(api_url).netloc
+        if (
+            priority == RequestPriority.BACKGROUND
+            or delay > config.requests.timeout
+        ):
+            metrics.UPSTREAM_RATE_LIMITED_REQUESTS.labels(
+                instance, priority.value, "rejected"
+            ).inc()
+            raise exceptions.GitInstanceRateLimitedError(math.ceil(delay))
+
+        metrics.UPSTREAM_RATE_LIMITED_REQUESTS.labels(
+            instance, priority.value, "delayed"
+        ).inc()
+        await asyncio.sleep(delay)
+
+    def _get_delay(
+        self, key: tuple[str, str], priority: RequestPriority
+    ) -> float:
+        if not (budget := self._budgets.get(key)):
+            return 0
+
+        now = time.time()
+        delay = max(budget.blocked_until - now, 0)
+        if (
+            budget.remaining is not None
+            and budget.reset_at
+            and budget.reset_at > now
+        ):
+            reserve = 0
+            if priority == RequestPriority.BACKGROUND and budget.limit:
+                reserve = math.ceil(
+                    budget.limit * config.requests.rate_limit_reserve
+                )
+            if budget.remaining <= reserve:
+                delay = max(delay, budget.reset_at - now)
+        return delay
+
+    def update(
+        self,
+        api_url: str,
+        headers: dict[str, str],
+        status: int,
+        response_headers: abc.Mapping[str, str],
+    ) -> bool:
+        """Update the budget from a response.
+
+        Returns whether the request was rejected because of a rate limit.
+        """
+        key = _get_key(api_url, headers)
+        limit = _get_int_header(response_headers, "RateLimit-Limit")
+        remaining = _get_int_header(response_headers, "RateLimit-Remaining")
+        reset_at = _get_int_header(response_headers, "RateLimit-Reset")
+        retry_after = _get_retry_after(response_headers)
+        limited = status == 429 or (
+            status == 403 and (remaining == 0 or retry_after is not None)
+        )
+
+        now = time.time()
+        with self._lock:
+            budget = self._budgets.setdefault(key, RateLimitBudget())
+            if remaining is not None:
+                budget.limit = limit
+                budget.remaining = remaining
+                budget.reset_at = reset_at
+
+            if not limited:
+                budget.backoff = 0
+            elif retry_after is not None:
+                budget.blocked_until = now + retry_after
+            elif remaining == 0 and reset_at:
+                budget.blocked_until = reset_at
+            else:
+                budget.backoff = min(
+                    max(budget.backoff * 2, MIN_BACKOFF), MAX_BACKOFF
+                )
+                budget.blocked_until = now + budget.backoff
+
+        instance = urllib.parse.urlparse(api_url).netloc
+        if remaining is not None:
+            metrics.UPSTREAM_RATE_LIMIT_REMAINING.labels(instance, key[1]).set(
+                remaining
+            )
+        if limited:
+            metrics.UPSTREAM_RATE_LIMITED_REQUESTS.labels(
+                instance, _priority.get().value, "limited"
+            ).inc()
+        return limited
+
+    def get_retry_after(self, api_url: str, headers: dict[str, str]) -> int:
+        with self._lock:
+            delay = self._get_delay(
+                _get_key(api_url, headers), RequestPriority.INTERACTIVE
+            )
+        return math.ceil(delay)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._budgets.clear()
+
+
+rate_limiter = UpstreamRateLimiter()
+
+
+def _get_key(api_url: str, headers: dict[str, str]) -> tuple[str, str]:
+    """Identify the budget by API URL and a short hash of the token."""
+    token = headers.get("Authorization") or headers.get("PRIVATE-TOKEN")
+    if not token:
+        return (api_url, "anonymous")
+    return (api_url, hashlib.sha256(token.encode()).hexdigest()[:8])
+
+
+def _get_int_header(headers: abc.Mapping[str, str], name: str) -> int | None:
+    value = headers.get(f"X-{name}", headers.get(name))
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _get_retry_after(headers: abc.Mapping[str, str]) -> float | None:
+    """Parse the `Retry-After` header, given in seconds or as HTTP date."""
+    if (value := headers.get("Retry-After")) is None:
+        return None
+
+    if value.isdigit():
+        return int(value)
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
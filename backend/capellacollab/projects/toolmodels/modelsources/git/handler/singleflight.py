@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import functools
+import threading
+import typing as t
+from collections import abc
+
+
+class SingleFlight:
+    """Share one execution between concurrent calls with the same key.
+
+    The first caller starts the call in a separate task, later callers
+    with the same key await the same task until it has finished. Results
+    are not kept afterwards. Cancelling a caller doesn't cancel the shared
+    call. Tasks are bound to their event loop, callers in other event
+    loops start their own call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[abc.Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    async def do[T](
+        self,
+        key: abc.Hashable,
+        call: abc.Callable[[], abc.Coroutine[t.Any, t.Any, T]],
+    ) -> tuple[T, bool]:
+        """Run the call or join a running call with the same key.
+
+        Returns the result and whether it was shared with another caller.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task: asyncio.Task[T] | None = self._calls.get(key)
+            shared = task is not None and task.get_loop() is loop
+            if not task or not shared:
+                task = loop.create_task(call())
+                self._calls[key] = task
+                task.add_done_callback(functools.partial(self._forget, key))
+
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: abc.Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._calls.get(key) is task:
+                del self._calls[key]
+
+        # Mark the exception as retrieved, all callers might be cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+flights = SingleFlight()
@@ -83,3 +83,29 @@ class ModelArtifactStatus(enum.Enum):
     FAILURE = "failure"
     UNCONFIGURED = "unconfigured"
     UNSUPPORTED = "unsupported"
+
+
+class GitModelCacheStatistics(core_pydantic.BaseModel):
+    git_model_id: int
+    project_slug: str
+    model_slug: str
+    cached_bytes: int = pydantic.Field(
+        description="Bytes stored in the git cache for the git model."
+    )
+    upstream_requests: int = pydantic.Field(
+        description=(
+            "Requests to the Git instance for the git model"
+            " since the start of the backend replica."
+        )
+    )
+    upstream_seconds: float = pydantic.Field(
+        description=(
+            "Time spent in requests to the Git instance for the git model"
+            " since the start of the backend replica."
+        )
+    )
+
+
+class GitCacheStatistics(core_pydantic.BaseModel):
+    largest_caches: list[GitModelCacheStatistics]
+    most_upstream_time: list[GitModelCacheStatistics]
@@ -45,6 +45,25 @@ async def get_readme(
         logging.LoggerAdapter,
         fastapi.Depends(logging_injectables.get_request_logger),
     ],
+    request: fastapi.Request,
 ):
-    _, file = await git_handler.get_file("README.md", logger, None)
-    return responses.MarkdownResponse(content=file)
+    if head_commit := await git_handler.get_cached_head_commit(
+        git_handler.revision, logger
+    ):
+        current_etag = responses.make_etag(head_commit, "README.md")
+        if responses.is_not_modified(request, current_etag):
+            return responses.NotModifiedResponse(
+                headers=responses.get_validator_headers(current_etag)
+            )
+
+    last_updated, file = await git_handler.get_file("README.md", logger, None)
+
+    etag = None
+    if file_commit := git_handler.get_file_commit("README.md"):
+        etag = responses.make_etag(file_commit, "README.md")
+    headers = responses.get_validator_headers(
+        etag, last_updated, stale=git_handler.served_stale
+    )
+    if responses.is_not_modified(request, etag, last_updated):
+        return responses.NotModifiedResponse(headers=headers)
+    return responses.MarkdownResponse(content=file, headers=headers)
@@ -283,14 +283,18 @@ def determine_new_project_to_move_model(
 
     new_project = projects_injectables.get_existing_project(project_slug, db)
 
-    project_scope = projects_permissions_injectables.get_scope(
-        user, token, global_scope, new_project, db
+    project_scope_mask = projects_permissions_injectables.get_scope_mask(
+        user,
+        token,
+        permissions_models.GLOBAL_SCOPES_BITMASK.to_mask(global_scope),
+        new_project,
+        db,
     )
     projects_permissions_injectables.ProjectPermissionValidation(
         required_scope=projects_permissions_models.ProjectUserScopes(
             tool_models={permissions_models.UserTokenVerb.CREATE}
         )
-    )(project_scope, new_project)
+    )(project_scope_mask, new_project)
 
     return new_project
 
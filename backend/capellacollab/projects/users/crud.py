@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import abc
+
 import sqlalchemy as sa
 from sqlalchemy import exc, orm
 
@@ -32,6 +34,20 @@ def get_project_user_association(
         return None
 
 
+def get_project_user_associations_for_user(
+    db: orm.Session, user: users_models.DatabaseUser
+) -> abc.Sequence[models.DatabaseProjectUserAssociation]:
+    return (
+        db.execute(
+            sa.select(models.DatabaseProjectUserAssociation).where(
+                models.DatabaseProjectUserAssociation.user_id == user.id
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+
 def add_user_to_project(
     db: orm.Session,
     project: projects_models.DatabaseProject,
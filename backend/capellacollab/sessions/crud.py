@@ -62,6 +62,24 @@ def get_session_by_id(
     ).scalar_one_or_none()
 
 
+def get_sessions_without_startup_phase(
+    db: orm.Session, phase: str, created_after: datetime.datetime
+) -> abc.Sequence[models.DatabaseSession]:
+    return (
+        db.execute(
+            sa.select(models.DatabaseSession)
+            .where(models.DatabaseSession.created_at >= created_after)
+            .where(
+                ~models.DatabaseSession.startup_timeline.has_key(
+                    sa.literal(str(phase), sa.Text)
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+
 def count_sessions(db: orm.Session) -> int:
     count = db.scalar(
         sa.select(sa.func.count()).select_from(models.DatabaseSession)
@@ -13,6 +13,7 @@ from requests import exceptions as requests_exceptions
 from capellacollab.configuration.app import config
 from capellacollab.core import credentials
 from capellacollab.sessions import exceptions as sessions_exceptions
+from capellacollab.sessions import launch
 
 from . import interface
 
@@ -30,6 +31,8 @@ class GuacamoleConfig(t.TypedDict):
 
 
 class GuacamoleIntegration(interface.HookRegistration):
+    parallel_safe = True
+
     _base_uri = config.extensions.guacamole.base_uri
     _prefix = f"{_base_uri}/api/session/data/postgresql"
     _headers = {"Content-Type": "application/x-www-form-urlencoded"}
@@ -61,16 +64,24 @@ class GuacamoleIntegration(interface.HookRegistration):
         guacamole_password = credentials.generate_password(length=64)
 
         guacamole_token = self._get_admin_token()
-        self._create_user(
-            guacamole_token, guacamole_username, guacamole_password
+        # The user and the connection only have to exist
+        # before the user is assigned to the connection.
+        results = launch.run_concurrently(
+            {
+                "guacamole_user": lambda: self._create_user(
+                    guacamole_token, guacamole_username, guacamole_password
+                ),
+                "guacamole_connection": lambda: self._create_connection(
+                    guacamole_token,
+                    request.db_session.environment[
+                        "CAPELLACOLLAB_SESSION_TOKEN"
+                    ],
+                    request.session["host"],
+                    request.session["port"],
+                ),
+            }
         )
-
-        guacamole_identifier = self._create_connection(
-            guacamole_token,
-            request.db_session.environment["CAPELLACOLLAB_SESSION_TOKEN"],
-            request.session["host"],
-            request.session["port"],
-        )["identifier"]
+        guacamole_identifier = results["guacamole_connection"]["identifier"]
 
         self._assign_user_to_connection(
             guacamole_token, guacamole_username, guacamole_identifier
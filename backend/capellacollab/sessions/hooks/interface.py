@@ -233,8 +233,19 @@ class HookRegistration(metaclass=abc.ABCMeta):  # noqa: B024
 
     Unnecessary hooks don't have to implemented and are skipped automatically.
     That's why the hooks in this interface are not abstract methods.
+
+    The configuration hooks of all integrations are scheduled concurrently.
+    Hooks that declare `parallel_safe` run in parallel to all other hooks.
+    They must not use the database session and may only read the already
+    loaded attributes of the database objects in the request.
+    All other hooks share the database session and run one at a time.
+    A hook only starts after the hooks listed in `depends_on` have finished,
+    if they are activated.
     """
 
+    parallel_safe: t.ClassVar[bool] = False
+    depends_on: t.ClassVar[tuple[type["HookRegistration"], ...]] = ()
+
     def configuration_hook(
         self,
         request: ConfigurationHookRequest,  # noqa: ARG002
@@ -264,7 +275,9 @@ class HookRegistration(metaclass=abc.ABCMeta):  # noqa: B024
         """Hook executed after session creation
 
         This hook is executed after a persistent session was created
-        by the operator.
+        by the operator. The hooks of all integrations run concurrently
+        in separate threads. They must not depend on each other
+        and must not use the database session.
         """
 
         return PostSessionCreationHookResult()
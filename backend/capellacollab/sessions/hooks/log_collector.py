@@ -16,6 +16,8 @@ log = logging.getLogger(__name__)
 
 
 class LogCollectorIntegration(interface.HookRegistration):
+    parallel_safe = True
+
     _loki_enabled: bool = config.k8s.promtail.loki_enabled
 
     def configuration_hook(self, request: interface.ConfigurationHookRequest):
@@ -24,6 +24,8 @@ class ResolvedSessionProvisioning(t.TypedDict):
 class ProjectScopeHook(interface.HookRegistration):
     """Makes sure to start the session with the correct workspace."""
 
+    parallel_safe = True
+
     @classmethod
     def configuration_hook(
         cls,
@@ -310,15 +310,20 @@ class ProvisionWorkspaceHook(interface.HookRegistration):
     ):
         """Verify the user has the required permissions for the requested models"""
 
+        global_scope_mask = permissions_models.GLOBAL_SCOPES_BITMASK.to_mask(
+            global_scope
+        )
         for entry in resolved_entries:
-            project_scope = projects_permissions_injectables.get_scope(
-                user, pat, global_scope, entry["project"], db
+            project_scope_mask = (
+                projects_permissions_injectables.get_scope_mask(
+                    user, pat, global_scope_mask, entry["project"], db
+                )
             )
             projects_permissions_injectables.ProjectPermissionValidation(
                 projects_permissions_models.ProjectUserScopes(
                     provisioning={permissions_models.UserTokenVerb.GET}
                 )
-            )(project_scope, entry["project"])
+            )(project_scope_mask, entry["project"])
 
     @classmethod
     async def _get_git_repos_json(
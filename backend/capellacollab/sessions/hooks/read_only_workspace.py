@@ -12,6 +12,8 @@ from . import interface
 class ReadOnlyWorkspaceHook(interface.HookRegistration):
     """Mounts an empty workspace to the container for read-only sessions."""
 
+    parallel_safe = True
+
     def configuration_hook(
         self, request: interface.ConfigurationHookRequest
     ) -> interface.ConfigurationHookResult:
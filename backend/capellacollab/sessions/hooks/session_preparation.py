@@ -15,6 +15,8 @@ class GitRepositoryCloningHook(interface.HookRegistration):
     The volume is used to clone Git repositories as preparation for the session.
     """
 
+    parallel_safe = True
+
     def configuration_hook(
         self,
         request: interface.ConfigurationHookRequest,
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from collections import abc
 
 import requests
 
@@ -14,10 +15,8 @@ log = logging.getLogger(__name__)
 
 def get_idle_state(sid: str) -> sessions_models2.IdleState:
     if core.LOCAL_DEVELOPMENT_MODE:
-        return sessions_models2.IdleState(
-            available=False,
-            unavailable_reason="Unavailable in local development mode",
-            terminate_after_minutes=config.sessions.timeout,
+        return _get_unavailable_idle_state(
+            "Unavailable in local development mode"
         )
 
     try:
@@ -28,25 +27,88 @@ def get_idle_state(sid: str) -> sessions_models2.IdleState:
         response.raise_for_status()
     except Exception:
         log.exception("Exception during fetching of idle state.")
-        return sessions_models2.IdleState(
-            available=False,
-            unavailable_reason="Exception during fetching of idle state",
-            terminate_after_minutes=config.sessions.timeout,
+        return _get_unavailable_idle_state(
+            "Exception during fetching of idle state"
         )
 
     if len(response.json()["data"]["result"]) > 0:
-        idle_for_minutes = int(
-            float(response.json()["data"]["result"][0]["value"][1])
-        )
-        return sessions_models2.IdleState(
-            available=True,
-            idle_for_minutes=idle_for_minutes,
-            terminate_after_minutes=config.sessions.timeout,
+        return _get_idle_state_from_value(
+            response.json()["data"]["result"][0]["value"][1]
         )
     log.debug("Couldn't find Prometheus metrics for session %s.", sid)
 
+    return _get_unavailable_idle_state("No metrics found for session")
+
+
+def get_idle_states(
+    session_ids: abc.Iterable[str],
+) -> dict[str, sessions_models2.IdleState]:
+    """Fetch the idle states of multiple sessions with a single query.
+
+    The result contains an entry for each of the passed session IDs.
+    """
+
+    session_ids = list(session_ids)
+    if not session_ids:
+        return {}
+
+    if core.LOCAL_DEVELOPMENT_MODE:
+        return {
+            session_id: _get_unavailable_idle_state(
+                "Unavailable in local development mode"
+            )
+            for session_id in session_ids
+        }
+
+    try:
+        response = requests.get(
+            f"{config.prometheus.url}/api/v1/query?query=idletime_minutes",
+            timeout=config.requests.timeout,
+        )
+        response.raise_for_status()
+    except Exception:
+        log.exception("Exception during fetching of idle states.")
+        return {
+            session_id: _get_unavailable_idle_state(
+                "Exception during fetching of idle state"
+            )
+            for session_id in session_ids
+        }
+
+    values: dict[str, str] = {
+        result["metric"]["session_id"]: result["value"][1]
+        for result in response.json()["data"]["result"]
+        if "session_id" in result.get("metric", {})
+    }
+
+    idle_states = {}
+    for session_id in session_ids:
+        if session_id in values:
+            idle_states[session_id] = _get_idle_state_from_value(
+                values[session_id]
+            )
+        else:
+            log.debug(
+                "Couldn't find Prometheus metrics for session %s.", session_id
+            )
+            idle_states[session_id] = _get_unavailable_idle_state(
+                "No metrics found for session"
+            )
+
+    return idle_states
+
+
+def _get_idle_state_from_value(value: str) -> sessions_models2.IdleState:
+    return sessions_models2.IdleState(
+        available=True,
+        idle_for_minutes=int(float(value)),
+        terminate_after_minutes=config.sessions.timeout,
+    )
+
+
+def _get_unavailable_idle_state(reason: str) -> sessions_models2.IdleState:
     return sessions_models2.IdleState(
         available=False,
-        unavailable_reason="No metrics found for session",
+        unavailable_reason=reason,
         terminate_after_minutes=config.sessions.timeout,
     )
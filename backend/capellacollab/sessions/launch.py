@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import concurrent.futures
+import contextlib
+import datetime
+import threading
+import time
+from collections import abc
+
+import prometheus_client
+
+LAUNCH_STEP_SECONDS = prometheus_client.Histogram(
+    "backend_session_launch_step_seconds",
+    "Duration of the steps of a session launch",
+    ("step",),
+)
+
+
+class LaunchTimings:
+    """Durations of the steps of one session launch.
+
+    In addition, the timestamps of the reached startup phases
+    are collected for the startup timeline of the session.
+    Steps may be timed from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.phases: dict[str, datetime.datetime] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, phase: str) -> None:
+        """Record that the phase was reached now"""
+        with self._lock:
+            self.phases[phase] = datetime.datetime.now(datetime.UTC)
+
+    @contextlib.contextmanager
+    def step(self, name: str) -> abc.Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.durations[name] = duration
+            LAUNCH_STEP_SECONDS.labels(name).observe(duration)
+
+    def format(self) -> str:
+        with self._lock:
+            return ", ".join(
+                f"{name}={duration * 1000:.0f}ms"
+                for name, duration in self.durations.items()
+            )
+
+
+def run_concurrently[T](
+    steps: dict[str, abc.Callable[[], T]],
+    timings: LaunchTimings | None = None,
+) -> dict[str, T]:
+    """Run independent blocking steps in parallel threads.
+
+    All steps are run to completion, even if one of them fails.
+    Afterwards, the first exception in the order of the steps is raised.
+    """
+    if timings is None:
+        timings = LaunchTimings()
+
+    def run(name: str, call: abc.Callable[[], T]) -> T:
+        with timings.step(name):
+            return call()
+
+    if len(steps) <= 1:
+        return {name: run(name, call) for name, call in steps.items()}
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(steps), thread_name_prefix="session-launch"
+    ) as executor:
+        futures = {
+            name: executor.submit(run, name, call)
+            for name, call in steps.items()
+        }
+
+    return {name: future.result() for name, future in futures.items()}
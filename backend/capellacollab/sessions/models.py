@@ -100,6 +100,21 @@ class SessionPreparationState(enum.Enum):
     UNKNOWN = "Unknown"
 
 
+class SessionStartupPhase(enum.StrEnum):
+    """Phases of the session startup, recorded in the startup timeline
+
+    In addition, the end of each configuration hook is recorded
+    as `configuration_hook:<name of the hook>`.
+    """
+
+    REQUEST_RECEIVED = "request_received"
+    POD_CREATED = "pod_created"
+    IMAGE_PULLED = "image_pulled"
+    SESSION_PREPARATION_FINISHED = "session_preparation_finished"
+    CONTAINER_RUNNING = "container_running"
+    FIRST_CONNECTION = "first_connection"
+
+
 class SessionState(enum.Enum):
     RUNNING = "Running"
     FAILED = "Failed"
@@ -109,6 +124,16 @@ class SessionState(enum.Enum):
     UNKNOWN = "Unknown"
 
 
+class SessionStatesContext(t.TypedDict):
+    """Pre-fetched states, passed as validation context of a `Session`.
+
+    If passed, the states are not fetched individually per session.
+    """
+
+    idle_states: dict[str, sessions_models2.IdleState]
+    states: dict[str, tuple[SessionPreparationState, SessionState]]
+
+
 class Session(core_pydantic.BaseModel):
     id: str
     type: SessionType
@@ -162,7 +187,13 @@ class Session(core_pydantic.BaseModel):
         return self
 
     @pydantic.model_validator(mode="after")
-    def add_states_and_idletime(self) -> t.Any:
+    def add_states_and_idletime(self, info: pydantic.ValidationInfo) -> t.Any:
+        context: SessionStatesContext | None = info.context
+        if context is not None:
+            self.idle_state = context["idle_states"][self.id]
+            self.preparation_state, self.state = context["states"][self.id]
+            return self
+
         self.idle_state = injection.get_idle_state(self.id)
         self.preparation_state, self.state = (
             operators.get_operator().get_session_state(self.id)
@@ -258,6 +289,11 @@ class DatabaseSession(database.Base):
         sa.Boolean, default=False, nullable=False, init=False
     )
 
+    # Timestamps in ISO format, indexed by `SessionStartupPhase`
+    startup_timeline: orm.Mapped[dict[str, str]] = orm.mapped_column(
+        nullable=False, default_factory=dict
+    )
+
 
 class DatabaseSharedSession(database.Base):
     __tablename__ = "shared_sessions"
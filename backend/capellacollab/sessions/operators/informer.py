@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import typing as t
+from collections import abc
+
+from kubernetes import watch
+
+log = logging.getLogger(__name__)
+
+
+class Informer:
+    """Watch-based in-memory cache for Kubernetes resources of one kind.
+
+    The informer lists all resources in the namespace once and keeps the
+    local copy up to date with a watch stream. Whenever the watch stream
+    ends or fails, all resources are listed again (resync) and the watch
+    continues from the new resource version.
+
+    Event handlers are called from the watch thread with the event type
+    and the resource after the cache was updated.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        list_function: t.Callable[..., t.Any],
+        namespace: str,
+        resync_interval: int,
+        label_selector: str | None = None,
+    ):
+        self.name = name
+        self.namespace = namespace
+        self.resync_interval = resync_interval
+        self.label_selector = label_selector
+        self._list_function = list_function
+
+        self._lock = threading.Lock()
+        self._objects: dict[str, t.Any] = {}
+        self._label_index: dict[tuple[str, str], set[str]] = (
+            collections.defaultdict(set)
+        )
+
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch: watch.Watch | None = None
+        self._thread: threading.Thread | None = None
+        self._event_handlers: list[t.Callable[[str, t.Any], None]] = []
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def add_event_handler(
+        self, handler: t.Callable[[str, t.Any], None]
+    ) -> None:
+        self._event_handlers.append(handler)
+
+    def remove_event_handler(
+        self, handler: t.Callable[[str, t.Any], None]
+    ) -> None:
+        if handler in self._event_handlers:
+            self._event_handlers.remove(handler)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"informer-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._synced.clear()
+        if self._watch:
+            self._watch.stop()
+
+    def get(self, name: str) -> t.Any | None:
+        """Return the cached resource with the given name.
+
+        Returns None if the informer is not synced or the resource is unknown.
+        """
+        if not self.synced:
+            return None
+
+        with self._lock:
+            return self._objects.get(name)
+
+    def list(self, label_selector: str | None) -> list[t.Any] | None:
+        """Return all cached resources matching the label selector.
+
+        Only equality-based selectors (`key=value,key2=value2`) are supported.
+        Returns None if the informer is not synced or
+        the selector can't be evaluated from the cache, e.g., because
+        it matches resources, which are excluded by the selector of
+        the informer.
+        """
+        if not self.synced:
+            return None
+
+        requirements = (
+            _parse_equality_selector(label_selector) if label_selector else []
+        )
+        if requirements is None or not self._covers(requirements):
+            return None
+
+        with self._lock:
+            if not requirements:
+                return list(self._objects.values())
+
+            names = set.intersection(
+                *(
+                    self._label_index.get(requirement, set())
+                    for requirement in requirements
+                )
+            )
+            return [self._objects[name] for name in names]
+
+    def _covers(self, requirements: abc.Sequence[tuple[str, str]]) -> bool:
+        """Check that all resources matching the requirements are cached"""
+        if not self.label_selector:
+            return True
+
+        for own_requirement in self.label_selector.split(","):
+            key, separator, value = own_requirement.replace(
+                "==", "="
+            ).partition("=")
+            if not any(
+                requirement_key == key.strip()
+                and (not separator or requirement_value == value.strip())
+                for requirement_key, requirement_value in requirements
+            ):
+                return False
+
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                resource_version = self._resync()
+                self._watch_events(resource_version)
+            except Exception:
+                log.warning(
+                    "Watch for %s in namespace %s failed, resyncing.",
+                    self.name,
+                    self.namespace,
+                    exc_info=True,
+                )
+                self._synced.clear()
+                self._stopped.wait(timeout=5)
+
+    def _resync(self) -> str:
+        resources = self._list_function(
+            namespace=self.namespace, label_selector=self.label_selector
+        )
+
+        with self._lock:
+            self._objects.clear()
+            self._label_index.clear()
+            for resource in resources.items:
+                self._add(resource)
+
+        self._synced.set()
+        log.debug(
+            "Synced %d %s from namespace %s",
+            len(resources.items),
+            self.name,
+            self.namespace,
+        )
+        return resources.metadata.resource_version
+
+    def _watch_events(self, resource_version: str) -> None:
+        self._watch = watch.Watch()
+        for event in self._watch.stream(
+            self._list_function,
+            namespace=self.namespace,
+            label_selector=self.label_selector,
+            resource_version=resource_version,
+            timeout_seconds=self.resync_interval,
+        ):
+            with self._lock:
+                match event["type"]:
+                    case "ADDED" | "MODIFIED":
+                        self._remove(event["object"].metadata.name)
+                        self._add(event["object"])
+                    case "DELETED":
+                        self._remove(event["object"].metadata.name)
+
+            for handler in self._event_handlers:
+                try:
+                    handler(event["type"], event["object"])
+                except Exception:
+                    log.exception(
+                        "Event handler of %s informer failed", self.name
+                    )
+
+    def _add(self, resource: t.Any) -> None:
+        name = resource.metadata.name
+        self._objects[name] = resource
+        for label in (resource.metadata.labels or {}).items():
+            self._label_index[label].add(name)
+
+    def _remove(self, name: str) -> None:
+        if not (resource := self._objects.pop(name, None)):
+            return
+
+        for label in (resource.metadata.labels or {}).items():
+            self._label_index[label].discard(name)
+            if not self._label_index[label]:
+                del self._label_index[label]
+
+
+def _parse_equality_selector(
+    label_selector: str,
+) -> list[tuple[str, str]] | None:
+    requirements = []
+    for requirement in label_selector.split(","):
+        if "!=" in requirement or "(" in requirement:
+            return None
+
+        key, separator, value = requirement.replace("==", "=").partition("=")
+        if not separator:
+            return None
+
+        requirements.append((key.strip(), value.strip()))
+
+    return requirements
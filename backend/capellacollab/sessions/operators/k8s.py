@@ -6,6 +6,7 @@ from __future__ import annotations
 import base64
 import binascii
 import datetime
+import hashlib
 import http
 import json
 import logging
@@ -15,6 +16,7 @@ import shlex
 import string
 import textwrap
 import typing as t
+from collections import abc
 
 import kubernetes
 import kubernetes.config
@@ -26,11 +28,12 @@ from kubernetes.client import exceptions
 
 from capellacollab.configuration.app import config
 from capellacollab.configuration.app import models as config_models
+from capellacollab.sessions import launch
 from capellacollab.sessions import models as sessions_models
 from capellacollab.sessions.files import exceptions as files_exceptions
 from capellacollab.tools import models as tools_models
 
-from . import helper, models
+from . import helper, informer, models
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +43,11 @@ SESSIONS_STARTED = prometheus_client.Counter(
 SESSIONS_KILLED = prometheus_client.Counter(
     "backend_sessions_killed", "Sessions killed, either by user or timeout"
 )
+WARM_POOL_CLAIMS = prometheus_client.Counter(
+    "backend_session_warm_pool_claims",
+    "Attempts to claim a placeholder pod from a warm pool",
+    ("result",),
+)
 
 cfg: config_models.K8sConfig = config.k8s
 
@@ -54,6 +62,27 @@ if _pod_security_context := cfg.cluster.pod_security_context:
     )
 
 
+SPEC_ANNOTATION = "capellacollab/spec"
+
+# Pods with the lowest deletion cost are deleted first on scale down
+POD_DELETION_COST_ANNOTATION = "controller.kubernetes.io/pod-deletion-cost"
+MIN_POD_DELETION_COST = -(2**31)
+
+# Concurrent claims of the same warm pool conflict when scaling it down
+WARM_POOL_SCALE_ATTEMPTS = 5
+
+
+def get_spec_hash(spec: t.Any) -> str:
+    """Identify the configuration of a managed resource
+
+    The Kubernetes API normalizes some fields, e.g. resource quantities,
+    so they can't be compared with the configuration directly.
+    """
+    return hashlib.sha256(
+        json.dumps(spec, sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+
 class Session(te.TypedDict):  # codespell:ignore te
     id: str
     port: int
@@ -71,6 +100,36 @@ class KubernetesOperator:
         self.v1_networking = client.NetworkingV1Api(api_client=self.client)
         self.v1_policy = client.PolicyV1Api(api_client=self.client)
 
+        self.pod_informer = informer.Informer(
+            "pods",
+            self.v1_core.list_namespaced_pod,
+            namespace=namespace,
+            resync_interval=cfg.informer.resync_interval,
+            label_selector="capellacollab/workload",
+        )
+        self.job_informer = informer.Informer(
+            "jobs",
+            self.v1_batch.list_namespaced_job,
+            namespace=namespace,
+            resync_interval=cfg.informer.resync_interval,
+        )
+
+    def start_informers(self) -> None:
+        """Start to watch pods and jobs in the sessions namespace.
+
+        Once synced, lookups of pods and jobs are served from memory.
+        The API server is only called on a cache miss.
+        """
+        if not cfg.informer.enabled:
+            return
+
+        self.pod_informer.start()
+        self.job_informer.start()
+
+    def stop_informers(self) -> None:
+        self.pod_informer.stop()
+        self.job_informer.stop()
+
     def load_config(self) -> None:
         if cfg.context:
             kubernetes.config.load_config(context=cfg.context)
@@ -100,36 +159,59 @@ class KubernetesOperator:
         labels: dict[str, str],
         prometheus_path="/metrics",
         prometheus_port=9118,
+        timings: launch.LaunchTimings | None = None,
+        node_name: str | None = None,
     ) -> Session:
+        """Create the pod, disruption budget and service of a session.
+
+        The resources only reference each other via labels,
+        so they are created concurrently. If the creation of one resource
+        fails, the other resources are deleted again. If a node is given,
+        e.g. of a claimed warm pool pod, the pod prefers this node.
+        """
         log.info(
             "Launching a %s session for user %s", session_type.value, username
         )
 
-        pod = self._create_session_pod(
-            image=image,
-            name=session_id,
-            environment=environment,
-            init_environment=init_environment,
-            ports=ports,
-            volumes=volumes,
-            init_volumes=init_volumes,
-            tool_resources=tool.config.resources,
-            annotations=annotations,
-            labels=labels,
-        )
-
-        self._create_session_disruption_budget(
-            session_id=session_id,
-        )
+        try:
+            resources = launch.run_concurrently(
+                {
+                    "kubernetes_pod": lambda: self._create_session_pod(
+                        image=image,
+                        name=session_id,
+                        environment=environment,
+                        init_environment=init_environment,
+                        ports=ports,
+                        volumes=volumes,
+                        init_volumes=init_volumes,
+                        tool_resources=tool.config.resources,
+                        annotations=annotations,
+                        labels=labels,
+                        node_name=node_name,
+                    ),
+                    "kubernetes_disruption_budget": lambda: (
+                        self._create_session_disruption_budget(
+                            session_id=session_id,
+                        )
+                    ),
+                    "kubernetes_service": lambda: self._create_session_service(
+                        session_id=session_id,
+                        ports=ports,
+                        prometheus_path=prometheus_path,
+                        prometheus_port=prometheus_port,
+                        annotations=annotations,
+                        labels=labels,
+                    ),
+                },
+                timings,
+            )
+        except Exception:
+            # The other steps have completed when the error is raised
+            self._delete_session_resources(session_id)
+            raise
 
-        service = self._create_session_service(
-            session_id=session_id,
-            ports=ports,
-            prometheus_path=prometheus_path,
-            prometheus_port=prometheus_port,
-            annotations=annotations,
-            labels=labels,
-        )
+        pod = t.cast(client.V1Pod, resources["kubernetes_pod"])
+        service = t.cast(client.V1Service, resources["kubernetes_service"])
 
         log.info(
             "Launched a %s session for user %s with id %s",
@@ -141,6 +223,20 @@ class KubernetesOperator:
 
         return self._export_attrs(pod, service, ports)
 
+    def _delete_session_resources(self, session_id: str) -> None:
+        for delete in (
+            self.delete_pod,
+            self._delete_disruptionbudget,
+            self._delete_service,
+        ):
+            try:
+                delete(session_id)
+            except exceptions.ApiException:
+                log.exception(
+                    "Couldn't delete resources of the failed session %s",
+                    session_id,
+                )
+
     def kill_session(self, _id: str):
         log.info("Terminating session %s", _id)
 
@@ -151,6 +247,8 @@ class KubernetesOperator:
         SESSIONS_KILLED.inc()
 
     def get_job_by_name(self, name: str) -> client.V1Job:
+        if job := self.job_informer.get(name):
+            return job
         return self.v1_batch.read_namespaced_job(name, namespace=namespace)
 
     def get_session_state(
@@ -168,6 +266,54 @@ class KubernetesOperator:
                 sessions_models.SessionState.UNKNOWN,
             )
 
+        return self._get_session_state_from_pod(pod)
+
+    def get_session_states(
+        self, session_ids: abc.Iterable[str]
+    ) -> dict[
+        str,
+        tuple[
+            sessions_models.SessionPreparationState,
+            sessions_models.SessionState,
+        ],
+    ]:
+        """Resolve the states of multiple sessions with a single list call.
+
+        The result contains an entry for each of the passed session IDs.
+        """
+
+        session_ids = list(session_ids)
+        if not session_ids:
+            return {}
+
+        try:
+            pods = self.get_pods(
+                label_selector="capellacollab/workload=session"
+            )
+        except exceptions.ApiException:
+            log.warning("Error while listing session pods", exc_info=True)
+            return dict.fromkeys(
+                session_ids,
+                (
+                    sessions_models.SessionPreparationState.UNKNOWN,
+                    sessions_models.SessionState.UNKNOWN,
+                ),
+            )
+
+        pods_by_name = {pod.metadata.name: pod for pod in pods}
+        return {
+            session_id: self._get_session_state_from_pod(
+                pods_by_name.get(session_id)
+            )
+            for session_id in session_ids
+        }
+
+    def _get_session_state_from_pod(
+        self, pod: client.V1Pod | None
+    ) -> tuple[
+        sessions_models.SessionPreparationState,
+        sessions_models.SessionState,
+    ]:
         if not pod:
             return (
                 sessions_models.SessionPreparationState.NOT_FOUND,
@@ -241,6 +387,76 @@ class KubernetesOperator:
 
         return sessions_models.SessionState.UNKNOWN
 
+    def get_session_startup_phases(
+        self, session_id: str
+    ) -> dict[str, datetime.datetime]:
+        """Get the startup phases, which the session pod has reached
+
+        The pull of the session image is only visible in the events of
+        the pod. They are only requested once the container is running.
+        """
+        try:
+            pod = self.get_pod_by_name(session_id)
+        except exceptions.ApiException:
+            log.warning("Error while getting session pod", exc_info=True)
+            return {}
+
+        if not pod:
+            return {}
+
+        phases: dict[str, datetime.datetime] = {}
+        status: client.V1PodStatus = pod.status
+        for init_container_status in status.init_container_statuses or []:
+            terminated = init_container_status.state.terminated
+            if (
+                init_container_status.name == "session-preparation"
+                and terminated
+                and terminated.reason == "Completed"
+                and terminated.finished_at
+            ):
+                phases[
+                    sessions_models.SessionStartupPhase.SESSION_PREPARATION_FINISHED
+                ] = terminated.finished_at
+
+        for container_status in status.container_statuses or []:
+            running = container_status.state.running
+            if (
+                container_status.name == "session"
+                and running
+                and running.started_at
+            ):
+                phases[
+                    sessions_models.SessionStartupPhase.CONTAINER_RUNNING
+                ] = running.started_at
+
+        if (
+            sessions_models.SessionStartupPhase.CONTAINER_RUNNING in phases
+            and (pulled_at := self._get_session_image_pulled_at(session_id))
+        ):
+            phases[sessions_models.SessionStartupPhase.IMAGE_PULLED] = (
+                pulled_at
+            )
+
+        return phases
+
+    def _get_session_image_pulled_at(
+        self, session_id: str
+    ) -> datetime.datetime | None:
+        try:
+            events = self.get_events_for_involved_object(session_id)
+        except exceptions.ApiException:
+            log.warning("Error while getting session events", exc_info=True)
+            return None
+
+        for event in events:
+            if (
+                event.reason == "Pulled"
+                and event.involved_object.field_path
+                == "spec.containers{session}"
+            ):
+                return event.first_timestamp or event.event_time
+        return None
+
     def get_job_logs(self, name: str, since: datetime.datetime) -> str | None:
         pod_name = self.get_pod_name_from_job_name(name)
         if not pod_name:
@@ -288,15 +504,16 @@ class KubernetesOperator:
         timeout: int = 18000,
     ) -> str:
         _id = self._generate_id()
+        job_labels = {"capellacollab/workload": "job", **labels}
 
         job: client.V1Job = client.V1Job(
             kind="Job",
             api_version="batch/v1",
-            metadata=client.V1ObjectMeta(name=_id),
+            metadata=client.V1ObjectMeta(name=_id, labels=job_labels),
             spec=self._create_job_spec(
                 name=_id,
                 image=image,
-                job_labels={"capellacollab/workload": "job", **labels},
+                job_labels=job_labels,
                 environment=environment,
                 tool_resources=tool_resources,
                 args=[command],
@@ -320,23 +537,24 @@ class KubernetesOperator:
             raise
 
     def get_pod_name_from_job_name(self, job_name: str) -> str | None:
-        return self._get_pod_id(label_selector=f"job-name={job_name}")
+        return self._get_pod_id(
+            label_selector=f"capellacollab/workload=job,job-name={job_name}"
+        )
 
     def get_pod_for_job(self, job_name: str) -> client.V1Pod:
-        pods = self.v1_core.list_namespaced_pod(
-            namespace=namespace, label_selector=f"job-name={job_name}"
+        pods = self.get_pods(
+            label_selector=f"capellacollab/workload=job,job-name={job_name}",
+            fallback_on_empty=True,
         )
-        if len(pods.items) == 1:
-            return pods.items[0]
+        if len(pods) == 1:
+            return pods[0]
         return None
 
     def _get_pod_id(self, label_selector: str) -> str | None:
         try:
-            pods = self.v1_core.list_namespaced_pod(
-                namespace=namespace, label_selector=label_selector
-            ).to_dict()
-
-            return pods["items"][0]["metadata"]["name"]
+            return self.get_pods(
+                label_selector=label_selector, fallback_on_empty=True
+            )[0].metadata.name
         except Exception:
             log.exception("Error fetching the Pod ID")
             return None
@@ -519,6 +737,7 @@ class KubernetesOperator:
         tool_resources: tools_models.Resources,
         annotations: dict[str, str],
         labels: dict[str, str],
+        node_name: str | None = None,
     ) -> client.V1Pod:
         k8s_volumes, k8s_volume_mounts = self._map_volumes_to_k8s_volumes(
             volumes
@@ -528,16 +747,7 @@ class KubernetesOperator:
             init_volumes
         )
 
-        resources = client.V1ResourceRequirements(
-            limits={
-                "cpu": tool_resources.cpu.limits,
-                "memory": tool_resources.memory.limits,
-            },
-            requests={
-                "cpu": tool_resources.cpu.requests,
-                "memory": tool_resources.memory.requests,
-            },
-        )
+        resources = self._get_session_resources(tool_resources)
 
         pod: client.V1Pod = client.V1Pod(
             metadata=client.V1ObjectMeta(
@@ -579,11 +789,52 @@ class KubernetesOperator:
                 ],
                 volumes=k8s_volumes,
                 restart_policy="Never",
+                affinity=self._get_node_affinity(node_name),
             ),
         )
 
         return self.v1_core.create_namespaced_pod(namespace, pod)
 
+    def _get_session_resources(
+        self, tool_resources: tools_models.Resources
+    ) -> client.V1ResourceRequirements:
+        return client.V1ResourceRequirements(
+            limits={
+                "cpu": tool_resources.cpu.limits,
+                "memory": tool_resources.memory.limits,
+            },
+            requests={
+                "cpu": tool_resources.cpu.requests,
+                "memory": tool_resources.memory.requests,
+            },
+        )
+
+    def _get_node_affinity(
+        self, node_name: str | None
+    ) -> client.V1Affinity | None:
+        """Prefer the node, but fall back to other nodes if it's full"""
+        if not node_name:
+            return None
+
+        return client.V1Affinity(
+            node_affinity=client.V1NodeAffinity(
+                preferred_during_scheduling_ignored_during_execution=[
+                    client.V1PreferredSchedulingTerm(
+                        weight=100,
+                        preference=client.V1NodeSelectorTerm(
+                            match_fields=[
+                                client.V1NodeSelectorRequirement(
+                                    key="metadata.name",
+                                    operator="In",
+                                    values=[node_name],
+                                )
+                            ]
+                        ),
+                    )
+                ]
+            )
+        )
+
     def create_secret(
         self, name: str, content: dict[str, bytes], overwrite: bool = False
     ) -> client.V1Secret:
@@ -680,6 +931,306 @@ class KubernetesOperator:
         )
         return self.v1_core.create_namespaced_service(namespace, service)
 
+    def get_warm_pools(self) -> dict[int, client.V1Deployment]:
+        """Get the warm pool deployments by tool version ID"""
+        deployments: list[client.V1Deployment] = (
+            self.v1_apps.list_namespaced_deployment(
+                namespace, label_selector="capellacollab/workload=warm-pool"
+            ).items
+        )
+        return {
+            int(deployment.metadata.labels["capellacollab/tool-version-id"]): (
+                deployment
+            )
+            for deployment in deployments
+        }
+
+    def apply_warm_pool(
+        self,
+        version_id: int,
+        image: str,
+        tool_resources: tools_models.Resources,
+        size: int,
+    ) -> client.V1Deployment:
+        """Create or update the warm pool of a tool version
+
+        The warm pool is a deployment of placeholder pods, which pull
+        the session image and reserve the resources of a session.
+        Claimed placeholder pods are replaced on the next reconciliation.
+        """
+        name = f"warm-pool-{version_id}"
+        labels = {
+            "capellacollab/workload": "warm-pool",
+            "capellacollab/tool-version-id": str(version_id),
+        }
+        resources = self._get_session_resources(tool_resources)
+
+        deployment = client.V1Deployment(
+            metadata=client.V1ObjectMeta(
+                name=name,
+                labels=labels,
+                annotations={
+                    SPEC_ANNOTATION: get_spec_hash(
+                        {
+                            "image": image,
+                            "resources": tool_resources.model_dump(),
+                        }
+                    )
+                },
+            ),
+            spec=client.V1DeploymentSpec(
+                replicas=size,
+                selector=client.V1LabelSelector(match_labels=labels),
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels=labels),
+                    spec=client.V1PodSpec(
+                        automount_service_account_token=False,
+                        security_context=pod_security_context,
+                        node_selector=cfg.cluster.node_selector,
+                        priority_class_name=cfg.warm_pool.priority_class_name,
+                        # Claimed pods have to free their resources immediately
+                        termination_grace_period_seconds=0,
+                        init_containers=[
+                            client.V1Container(
+                                name="session-preparation",
+                                image=config.docker.registry
+                                + "/session-preparation:"
+                                + config.docker.tag,
+                                command=["true"],
+                                resources=resources,
+                                image_pull_policy=image_pull_policy,
+                            )
+                        ],
+                        containers=[
+                            client.V1Container(
+                                name="placeholder",
+                                image=image,
+                                command=["sleep", "infinity"],
+                                resources=resources,
+                                image_pull_policy=image_pull_policy,
+                            )
+                        ],
+                    ),
+                ),
+            ),
+        )
+
+        try:
+            return self.v1_apps.create_namespaced_deployment(
+                namespace, deployment
+            )
+        except exceptions.ApiException as e:
+            if e.status != http.HTTPStatus.CONFLICT:
+                raise
+
+        return self.v1_apps.replace_namespaced_deployment(
+            name, namespace, deployment
+        )
+
+    def delete_warm_pool(self, version_id: int) -> client.V1Status | None:
+        try:
+            return self.v1_apps.delete_namespaced_deployment(
+                f"warm-pool-{version_id}", namespace
+            )
+        except exceptions.ApiException as e:
+            # Warm pool doesn't exist or was already deleted
+            # Nothing to do
+            if e.status == http.HTTPStatus.NOT_FOUND:
+                return None
+            raise
+
+    def claim_warm_pool_pod(self, version_id: int) -> str | None:
+        """Claim a running placeholder pod of the warm pool of a tool version
+
+        The warm pool is scaled down by one and the placeholder pod is
+        deleted to free its resources. If the pod was only deleted,
+        the deployment would replace it immediately and the replacement
+        could take the resources before the session pod is scheduled.
+        Returns the name of its node or None if no pod is available.
+        """
+        pods = self.get_pods(
+            label_selector=(
+                "capellacollab/workload=warm-pool,"
+                f"capellacollab/tool-version-id={version_id}"
+            )
+        )
+        for pod in pods:
+            if (
+                pod.metadata.deletion_timestamp
+                or pod.status.phase != "Running"
+                or not pod.spec.node_name
+                or POD_DELETION_COST_ANNOTATION
+                in (pod.metadata.annotations or {})
+            ):
+                continue
+
+            # The resource version ensures that no other request
+            # claimed the pod in the meantime
+            try:
+                self.v1_core.patch_namespaced_pod(
+                    pod.metadata.name,
+                    namespace,
+                    {
+                        "metadata": {
+                            "resourceVersion": pod.metadata.resource_version,
+                            "annotations": {
+                                POD_DELETION_COST_ANNOTATION: str(
+                                    MIN_POD_DELETION_COST
+                                )
+                            },
+                        }
+                    },
+                )
+            except exceptions.ApiException as e:
+                if e.status in (
+                    http.HTTPStatus.CONFLICT,
+                    http.HTTPStatus.NOT_FOUND,
+                ):
+                    continue
+                raise
+
+            try:
+                self._scale_down_warm_pool(version_id)
+            finally:
+                # The deployment deletes pending pods first on scale down
+                self.delete_pod(name=pod.metadata.name)
+
+            WARM_POOL_CLAIMS.labels("claimed").inc()
+            return pod.spec.node_name
+
+        WARM_POOL_CLAIMS.labels("empty").inc()
+        return None
+
+    def _scale_down_warm_pool(self, version_id: int) -> None:
+        name = f"warm-pool-{version_id}"
+        for attempt in range(WARM_POOL_SCALE_ATTEMPTS):
+            scale: client.V1Scale = (
+                self.v1_apps.read_namespaced_deployment_scale(name, namespace)
+            )
+            scale.spec.replicas = max(scale.spec.replicas - 1, 0)
+            try:
+                self.v1_apps.replace_namespaced_deployment_scale(
+                    name, namespace, scale
+                )
+                return
+            except exceptions.ApiException as e:
+                if (
+                    e.status != http.HTTPStatus.CONFLICT
+                    or attempt == WARM_POOL_SCALE_ATTEMPTS - 1
+                ):
+                    raise
+
+    def get_image_pre_pull(self) -> client.V1DaemonSet | None:
+        try:
+            return self.v1_apps.read_namespaced_daemon_set(
+                "image-pre-pull", namespace
+            )
+        except exceptions.ApiException as e:
+            if e.status == http.HTTPStatus.NOT_FOUND:
+                return None
+            raise
+
+    def apply_image_pre_pull(self, images: list[str]) -> client.V1DaemonSet:
+        """Create or update the DaemonSet, which pulls images on all nodes
+
+        Each image gets its own container, so that
+        an image which can't be pulled doesn't block the others.
+        The images don't need to provide any command, the containers
+        run a static busybox binary, which is copied into a shared volume.
+        """
+        name = "image-pre-pull"
+        labels = {"capellacollab/workload": "image-pre-pull"}
+        resources = client.V1ResourceRequirements(
+            limits={"cpu": "10m", "memory": "20Mi"},
+            requests={"cpu": "1m", "memory": "5Mi"},
+        )
+        volume_mount = client.V1VolumeMount(
+            name="busybox", mount_path="/image-pre-pull", read_only=True
+        )
+
+        daemon_set = client.V1DaemonSet(
+            metadata=client.V1ObjectMeta(
+                name=name,
+                labels=labels,
+                annotations={SPEC_ANNOTATION: get_spec_hash(images)},
+            ),
+            spec=client.V1DaemonSetSpec(
+                selector=client.V1LabelSelector(match_labels=labels),
+                template=client.V1PodTemplateSpec(
+                    metadata=client.V1ObjectMeta(labels=labels),
+                    spec=client.V1PodSpec(
+                        automount_service_account_token=False,
+                        security_context=pod_security_context,
+                        node_selector=cfg.cluster.node_selector,
+                        termination_grace_period_seconds=0,
+                        volumes=[
+                            client.V1Volume(
+                                name="busybox",
+                                empty_dir=client.V1EmptyDirVolumeSource(),
+                            )
+                        ],
+                        init_containers=[
+                            client.V1Container(
+                                name="copy-busybox",
+                                image=f"{config.docker.external_registry}/library/busybox:1.37",
+                                command=[
+                                    "cp",
+                                    "/bin/busybox",
+                                    "/image-pre-pull/busybox",
+                                ],
+                                resources=resources,
+                                volume_mounts=[
+                                    client.V1VolumeMount(
+                                        name="busybox",
+                                        mount_path="/image-pre-pull",
+                                    )
+                                ],
+                            )
+                        ],
+                        containers=[
+                            client.V1Container(
+                                name=f"image-{index}",
+                                image=image,
+                                command=[
+                                    "/image-pre-pull/busybox",
+                                    "sleep",
+                                    "2147483647",
+                                ],
+                                resources=resources,
+                                image_pull_policy=image_pull_policy,
+                                volume_mounts=[volume_mount],
+                            )
+                            for index, image in enumerate(images)
+                        ],
+                    ),
+                ),
+            ),
+        )
+
+        try:
+            return self.v1_apps.create_namespaced_daemon_set(
+                namespace, daemon_set
+            )
+        except exceptions.ApiException as e:
+            if e.status != http.HTTPStatus.CONFLICT:
+                raise
+
+        return self.v1_apps.replace_namespaced_daemon_set(
+            name, namespace, daemon_set
+        )
+
+    def delete_image_pre_pull(self) -> client.V1Status | None:
+        try:
+            return self.v1_apps.delete_namespaced_daemon_set(
+                "image-pre-pull", namespace
+            )
+        except exceptions.ApiException as e:
+            # DaemonSet doesn't exist or was already deleted
+            # Nothing to do
+            if e.status == http.HTTPStatus.NOT_FOUND:
+                return None
+            raise
+
     def persistent_volume_exists(self, name: str) -> bool:
         try:
             self.v1_core.read_namespaced_persistent_volume_claim(
@@ -878,12 +1429,28 @@ class KubernetesOperator:
                 return None
             raise
 
-    def get_pods(self, label_selector: str | None) -> list[client.V1Pod]:
+    def get_pods(
+        self, label_selector: str | None, fallback_on_empty: bool = False
+    ) -> list[client.V1Pod]:
+        """Return the pods matching the label selector.
+
+        The pods are read from the informer if it covers the selector.
+        With `fallback_on_empty`, the API server is asked if no pod was
+        found in the cache, e.g., because the pod was just created and
+        its watch event wasn't received yet.
+        """
+        pods = self.pod_informer.list(label_selector)
+        if pods or (pods is not None and not fallback_on_empty):
+            return pods
+
         return self.v1_core.list_namespaced_pod(
             namespace=namespace, label_selector=label_selector
         ).items
 
     def get_pod_by_name(self, name: str) -> client.V1Pod:
+        if pod := self.pod_informer.get(name):
+            return pod
+
         try:
             return self.v1_core.read_namespaced_pod(
                 namespace=namespace, name=name
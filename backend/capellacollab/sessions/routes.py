@@ -39,7 +39,18 @@ from capellacollab.users import injectables as users_injectables
 from capellacollab.users import models as users_models
 from capellacollab.users.tokens import models as tokens_models
 
-from . import auth, crud, exceptions, injectables, models, operators, util
+from . import (
+    auth,
+    crud,
+    exceptions,
+    injectables,
+    launch,
+    models,
+    operators,
+    startup,
+    util,
+    warmpool,
+)
 from .operators import k8s
 from .operators import models as operators_models
 
@@ -104,6 +115,8 @@ async def request_session(
     If requested with a project slug (required for read-only sessions),
     the requesting user must have the permissions `provisioning:get` in the project.
     """
+    timings = launch.LaunchTimings()
+    timings.mark(models.SessionStartupPhase.REQUEST_RECEIVED)
     logger.info(
         "Starting %s session for user %s", body.session_type, user.name
     )
@@ -139,8 +152,12 @@ async def request_session(
                 provisioning={permissions_models.UserTokenVerb.GET}
             )
         )(
-            await asyncify(projects_permissions_injectables.get_scope)(
-                user, token, global_scope, project_scope, db
+            await asyncify(projects_permissions_injectables.get_scope_mask)(
+                user,
+                token,
+                permissions_models.GLOBAL_SCOPES_BITMASK.to_mask(global_scope),
+                project_scope,
+                db,
             ),
             project_scope,
         )
@@ -171,9 +188,12 @@ async def request_session(
         logger=logger,
     )
 
-    for hook_result in await util.schedule_configuration_hooks(
-        hook_request, tool
-    ):
+    with timings.step("configuration_hooks"):
+        hook_results = await util.schedule_configuration_hooks(
+            hook_request, tool, timings
+        )
+
+    for hook_result in hook_results:
         environment |= hook_result.get("environment", {})
         init_environment |= hook_result.get("init_environment", {})
         volumes += hook_result.get("volumes", [])
@@ -225,6 +245,11 @@ async def request_session(
         "capellacollab/owner-id": str(user.id),
     }
 
+    with timings.step("warm_pool_claim"):
+        node_name = await asyncify(warmpool.claim_warm_pool_pod)(
+            operator, version, docker_image, logger
+        )
+
     session = await asyncify(operator.start_session)(
         session_id=session_id,
         image=docker_image,
@@ -240,43 +265,49 @@ async def request_session(
         labels=labels,
         prometheus_path=tool.config.monitoring.prometheus.path,
         prometheus_port=connection_method.ports.metrics,
+        timings=timings,
+        node_name=node_name,
     )
+    timings.mark(models.SessionStartupPhase.POD_CREATED)
 
-    db_session = await asyncify(crud.create_session)(
-        db,
-        models.DatabaseSession(
-            id=session_id,
-            tool=tool,
-            version=version,
-            owner=user,
-            type=body.session_type,
-            environment=environment,
-            config={
-                "port": str(session["port"]),
-                "host": str(session["host"]),
-            },
-            created_at=session["created_at"],
-            connection_method_id=connection_method.id,
-            project=project_scope,
-        ),
+    db_session = models.DatabaseSession(
+        id=session_id,
+        tool=tool,
+        version=version,
+        owner=user,
+        type=body.session_type,
+        environment=environment,
+        config={
+            "port": str(session["port"]),
+            "host": str(session["host"]),
+        },
+        created_at=session["created_at"],
+        connection_method_id=connection_method.id,
+        project=project_scope,
     )
-
-    for hook in sessions_hooks.get_activated_integration_hooks(tool):
-        result = await asyncify(hook.post_session_creation_hook)(
-            hooks_interface.PostSessionCreationHookRequest(
-                session_id=session_id,
-                operator=operator,
-                user=user,
-                session=session,
-                db_session=db_session,
-                connection_method=connection_method,
-                db=db,
-            )
-        )
-
+    startup.record_startup_phases(db_session, timings.phases)
+
+    with timings.step("database"):
+        db_session = await asyncify(crud.create_session)(db, db_session)
+
+    # The post session creation hooks need the service of the session
+    for result in await asyncify(util.run_post_session_creation_hooks)(
+        hooks_interface.PostSessionCreationHookRequest(
+            session_id=session_id,
+            operator=operator,
+            user=user,
+            session=session,
+            db_session=db_session,
+            connection_method=connection_method,
+            db=db,
+        ),
+        tool,
+        timings,
+    ):
         hook_config |= result.get("config", {})
 
     await asyncify(crud.update_session_config)(db, db_session, hook_config)
+    logger.info("Launched session %s: %s", session_id, timings.format())
 
     response = models.Session.model_validate(db_session)
     response.warnings += warnings
@@ -302,7 +333,7 @@ async def request_session(
 def get_all_sessions(
     db: t.Annotated[orm.Session, fastapi.Depends(database.get_db)],
 ):
-    return crud.get_sessions(db)
+    return util.validate_sessions(crud.get_sessions(db))
 
 
 @router.get(
@@ -463,6 +494,16 @@ def get_session_connection_information(
             t4c_token = hook_result["t4c_token"]
         warnings += hook_result.get("warnings", [])
 
+    if startup.record_startup_phases(
+        session,
+        {
+            models.SessionStartupPhase.FIRST_CONNECTION: datetime.datetime.now(
+                datetime.UTC
+            )
+        },
+    ):
+        db.commit()
+
     for c_key, c_value in cookies.items():
         responses.set_secure_cookie(
             response=response,
@@ -607,6 +648,7 @@ def get_sessions_for_user(
     ):
         raise exceptions.SessionForbiddenError()
 
-    return user.sessions + list(
-        crud.get_shared_sessions_for_user(db, current_user)
+    return util.validate_sessions(
+        user.sessions
+        + list(crud.get_shared_sessions_for_user(db, current_user))
     )
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+
+import prometheus_client
+
+from capellacollab import scheduling
+from capellacollab.core import database
+
+from . import crud, models, operators
+
+# Kubernetes keeps the events, which contain the image pulls, for an hour
+STARTUP_TIMEOUT = datetime.timedelta(hours=1)
+
+SESSION_STARTUP_SECONDS = prometheus_client.Histogram(
+    "backend_session_startup_seconds",
+    "Time from the session request until a startup phase was reached",
+    ("phase", "tool", "version"),
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600, 1800, 3600),
+)
+
+
+def record_startup_phases(
+    session: models.DatabaseSession,
+    phases: dict[str, datetime.datetime],
+) -> bool:
+    """Add the phases, which weren't reached before, to the startup timeline
+
+    For each new phase, the time since the request is observed.
+    Returns whether the timeline has changed.
+    """
+    timeline = dict(session.startup_timeline)
+    new_phases = {
+        phase: timestamp
+        for phase, timestamp in phases.items()
+        if phase not in timeline
+    }
+    if not new_phases:
+        return False
+
+    session.startup_timeline = timeline | {
+        str(phase): timestamp.isoformat()
+        for phase, timestamp in new_phases.items()
+    }
+
+    received_at = session.startup_timeline.get(
+        models.SessionStartupPhase.REQUEST_RECEIVED
+    )
+    if not received_at:
+        # The session was requested before the timeline was introduced
+        return True
+
+    for phase, timestamp in new_phases.items():
+        if phase == models.SessionStartupPhase.REQUEST_RECEIVED:
+            continue
+
+        duration = timestamp - datetime.datetime.fromisoformat(received_at)
+        SESSION_STARTUP_SECONDS.labels(
+            phase, session.tool.name, session.version.name
+        ).observe(max(duration.total_seconds(), 0))
+
+    return True
+
+
+def record_pod_startup_phases() -> None:
+    """Record the startup phases of the pods of starting sessions
+
+    The timestamps are taken from the pods,
+    so that they don't depend on the interval of the job.
+    """
+    operator = operators.get_operator()
+    created_after = datetime.datetime.now(datetime.UTC) - STARTUP_TIMEOUT
+
+    with database.SessionLocal() as db:
+        for session in crud.get_sessions_without_startup_phase(
+            db, models.SessionStartupPhase.CONTAINER_RUNNING, created_after
+        ):
+            record_startup_phases(
+                session, operator.get_session_startup_phases(session.id)
+            )
+        db.commit()
+
+
+def record_pod_startup_phases_in_background():  # pragma: no cover
+    scheduling.scheduler.add_job(
+        record_pod_startup_phases,
+        "interval",
+        seconds=30,
+        id="record_session_startup_phases",
+        replace_existing=True,
+    )
@@ -2,12 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import functools
+import graphlib
 import json
 import logging
 import random
 import string
 import typing as t
+from collections import abc
 
+import sqlalchemy as sa
 from asyncer import asyncify
 from sqlalchemy import orm
 
@@ -19,7 +23,7 @@ from capellacollab.sessions.hooks import interface as hooks_interface
 from capellacollab.tools import models as tools_models
 from capellacollab.users import models as users_models
 
-from . import crud, exceptions, hooks, models
+from . import crud, exceptions, hooks, injection, launch, models, operators
 from .operators import k8s
 
 log = logging.getLogger(__name__)
@@ -51,6 +55,29 @@ def terminate_session(
     operator.kill_session(session.id)
 
 
+def validate_sessions(
+    sessions: abc.Iterable[models.DatabaseSession],
+) -> list[models.Session]:
+    """Validate multiple sessions and resolve their states in bulk.
+
+    Instead of querying Kubernetes and Prometheus once per session,
+    all states are fetched with one request each and joined in memory.
+    """
+
+    sessions = list(sessions)
+    session_ids = [session.id for session in sessions]
+
+    context = models.SessionStatesContext(
+        idle_states=injection.get_idle_states(session_ids),
+        states=operators.get_operator().get_session_states(session_ids),
+    )
+
+    return [
+        models.Session.model_validate(session, context=context)
+        for session in sessions
+    ]
+
+
 def generate_id() -> str:
     return "".join(random.choices(string.ascii_lowercase, k=25))
 
@@ -243,22 +270,191 @@ def is_session_shared_with_user(
 async def schedule_configuration_hooks(
     request: hooks_interface.ConfigurationHookRequest,
     tool: tools_models.DatabaseTool,
+    timings: launch.LaunchTimings | None = None,
 ) -> list[hooks_interface.ConfigurationHookResult]:
     """Schedule sync and async configuration hooks
 
-    Schedule async hooks, then schedule the sync hooks
-    and finally collect the async hook results
+    Run the sync hooks according to their dependencies,
+    then run the async hooks concurrently.
+    The results are returned in the order of the activated hooks,
+    async hook results first, so that they are merged deterministically.
+    The end of each hook is marked in the timings.
     """
 
+    if timings is None:
+        timings = launch.LaunchTimings()
+
     activated_hooks = hooks.get_activated_integration_hooks(tool)
 
-    async_hooks = [
-        hook.async_configuration_hook(request) for hook in activated_hooks
-    ]
+    sync_hooks = await run_configuration_hooks(
+        request, activated_hooks, timings
+    )
 
-    sync_hooks = [
-        await asyncify(hook.configuration_hook)(request)
-        for hook in activated_hooks
-    ]
+    async def run_async(
+        hook: hooks_interface.HookRegistration,
+    ) -> hooks_interface.ConfigurationHookResult:
+        result = await hook.async_configuration_hook(request)
+        timings.mark(_get_configuration_hook_phase(hook))
+        return result
+
+    async_hooks = await asyncio.gather(
+        *[run_async(hook) for hook in activated_hooks]
+    )
+
+    return async_hooks + sync_hooks
+
+
+async def run_configuration_hooks(
+    request: hooks_interface.ConfigurationHookRequest,
+    activated_hooks: list[hooks_interface.HookRegistration],
+    timings: launch.LaunchTimings | None = None,
+) -> list[hooks_interface.ConfigurationHookResult]:
+    """Run the sync configuration hooks concurrently
+
+    Each hook is started once its dependencies have finished. Hooks that
+    aren't parallel safe share the database session and run one at a time.
+    The database objects of the request are loaded beforehand and not
+    expired by commits of other hooks, so that parallel safe hooks
+    don't access the database session.
+    """
+
+    sorter = _sort_configuration_hooks(activated_hooks)
+
+    _load_instances(
+        request.db,
+        request.user,
+        request.tool,
+        request.tool_version,
+        request.project_scope,
+    )
+
+    if timings is None:
+        timings = launch.LaunchTimings()
+
+    database_lock = asyncio.Lock()
+
+    async def run(
+        hook: hooks_interface.HookRegistration,
+    ) -> hooks_interface.ConfigurationHookResult:
+        if hook.parallel_safe:
+            result = await asyncify(hook.configuration_hook)(request)
+        else:
+            async with database_lock:
+                result = await asyncify(hook.configuration_hook)(request)
+        timings.mark(_get_configuration_hook_phase(hook))
+        return result
+
+    expire_on_commit = request.db.expire_on_commit
+    request.db.expire_on_commit = False
+    try:
+        results = await _run_in_dependency_order(sorter, activated_hooks, run)
+    finally:
+        request.db.expire_on_commit = expire_on_commit
+
+    return [results[index] for index in range(len(activated_hooks))]
+
+
+async def _run_in_dependency_order[T, R](
+    sorter: graphlib.TopologicalSorter[int],
+    items: list[T],
+    run: abc.Callable[[T], abc.Awaitable[R]],
+) -> dict[int, R]:
+    """Start each item once its dependencies are done
+
+    After a failure, no further items are started, but the running items
+    are awaited, since they might still use the database session.
+    Then, the first exception is raised.
+    """
+
+    results: dict[int, R] = {}
+    running: dict[asyncio.Task[R], int] = {}
+    error: BaseException | None = None
+
+    while running or (error is None and sorter.is_active()):
+        if error is None:
+            for index in sorted(sorter.get_ready()):
+                running[asyncio.ensure_future(run(items[index]))] = index
+
+        done, _ = await asyncio.wait(
+            running, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in sorted(done, key=running.__getitem__):
+            index = running.pop(task)
+            if (exception := task.exception()) is not None:
+                error = error or exception
+                continue
+            results[index] = task.result()
+            sorter.done(index)
+
+    if error is not None:
+        raise error
+
+    return results
+
+
+def _get_configuration_hook_phase(
+    hook: hooks_interface.HookRegistration,
+) -> str:
+    return f"configuration_hook:{type(hook).__name__}"
+
+
+def _sort_configuration_hooks(
+    activated_hooks: list[hooks_interface.HookRegistration],
+) -> graphlib.TopologicalSorter[int]:
+    sorter = graphlib.TopologicalSorter(
+        {
+            index: {
+                dependency_index
+                for dependency_index, dependency in enumerate(activated_hooks)
+                if dependency is not hook
+                and isinstance(dependency, hook.depends_on)
+            }
+            for index, hook in enumerate(activated_hooks)
+        }
+    )
+    sorter.prepare()
+    return sorter
+
+
+def _load_instances(db: orm.Session, *instances: t.Any) -> None:
+    """Load the attributes of the instances, which are persistent
+
+    Transient and detached instances can't be refreshed and are skipped.
+    """
+    for instance in instances:
+        if instance is not None and sa.inspect(instance).persistent:
+            db.refresh(instance)
+
+
+def run_post_session_creation_hooks(
+    request: hooks_interface.PostSessionCreationHookRequest,
+    tool: tools_models.DatabaseTool,
+    timings: launch.LaunchTimings | None = None,
+) -> list[hooks_interface.PostSessionCreationHookResult]:
+    """Run the post session creation hooks concurrently
+
+    The hooks of different integrations don't depend on each other.
+    The database objects of the request are loaded beforehand,
+    so that the hooks don't access the database session concurrently.
+    """
+
+    _load_instances(
+        request.db,
+        request.db_session,
+        request.db_session.version,
+        request.user,
+        tool,
+    )
+
+    steps: dict[
+        str, abc.Callable[[], hooks_interface.PostSessionCreationHookResult]
+    ] = {}
+    for hook in hooks.get_activated_integration_hooks(tool):
+        name = f"post_session_creation_hook:{type(hook).__name__}"
+        if name in steps:
+            name += f"#{len(steps)}"
+        steps[name] = functools.partial(
+            hook.post_session_creation_hook, request
+        )
 
-    return await asyncio.gather(*async_hooks) + sync_hooks
+    return list(launch.run_concurrently(steps, timings).values())
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import dataclasses
+import logging
+
+from kubernetes import client
+from kubernetes.client import exceptions
+
+from capellacollab import scheduling
+from capellacollab.configuration.app import config
+from capellacollab.core import database
+from capellacollab.tools import crud as tools_crud
+from capellacollab.tools import models as tools_models
+
+from . import operators
+from .operators import k8s
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class WarmPool:
+    image: str
+    resources: tools_models.Resources
+    size: int
+
+
+def get_warm_pool_image(version: tools_models.DatabaseVersion) -> str | None:
+    """Get the image of the placeholder pods of a tool version
+
+    Warm pools only use the regular image, beta testers
+    don't use the warm pool if a beta image is configured.
+    """
+    template = version.config.sessions.persistent.image.regular
+    if not template:
+        return None
+    return template.format(version=version.name)
+
+
+def get_desired_warm_pools(
+    versions: list[tools_models.DatabaseVersion],
+) -> dict[int, WarmPool]:
+    warm_pools = {}
+    for version in versions:
+        size = version.config.sessions.warm_pool.size
+        if not size or not (image := get_warm_pool_image(version)):
+            continue
+
+        warm_pools[version.id] = WarmPool(
+            image=image, resources=version.tool.config.resources, size=size
+        )
+    return warm_pools
+
+
+def is_up_to_date(
+    deployment: client.V1Deployment, warm_pool: WarmPool
+) -> bool:
+    annotations = deployment.metadata.annotations or {}
+    return deployment.spec.replicas == warm_pool.size and annotations.get(
+        k8s.SPEC_ANNOTATION
+    ) == k8s.get_spec_hash(
+        {
+            "image": warm_pool.image,
+            "resources": warm_pool.resources.model_dump(),
+        }
+    )
+
+
+def reconcile_warm_pools() -> None:
+    """Keep the warm pools in line with the tool version configuration
+
+    The deployments recreate claimed placeholder pods on their own.
+    The reconciler only creates, updates and deletes the deployments.
+    Without a lower priority, the recreated placeholder pods would compete
+    with the sessions for the claimed capacity. Therefore, warm pools are
+    only created if a PriorityClass is configured.
+    """
+    operator = operators.get_operator()
+
+    with database.SessionLocal() as db:
+        desired = get_desired_warm_pools(list(tools_crud.get_versions(db)))
+
+    if desired and not config.k8s.warm_pool.priority_class_name:
+        log.warning(
+            "Warm pools are configured, but no PriorityClass for the"
+            " placeholder pods is set in k8s.warmPool.priorityClassName."
+            " The warm pools are not created."
+        )
+        desired = {}
+
+    existing = operator.get_warm_pools()
+
+    for version_id, warm_pool in desired.items():
+        deployment = existing.get(version_id)
+        if deployment and is_up_to_date(deployment, warm_pool):
+            continue
+
+        log.info(
+            "Updating the warm pool of tool version %s to %d pods",
+            version_id,
+            warm_pool.size,
+        )
+        try:
+            operator.apply_warm_pool(
+                version_id,
+                image=warm_pool.image,
+                tool_resources=warm_pool.resources,
+                size=warm_pool.size,
+            )
+        except exceptions.ApiException:
+            log.exception(
+                "Couldn't update the warm pool of tool version %s", version_id
+            )
+
+    for version_id in existing.keys() - desired.keys():
+        log.info("Deleting the warm pool of tool version %s", version_id)
+        try:
+            operator.delete_warm_pool(version_id)
+        except exceptions.ApiException:
+            log.exception(
+                "Couldn't delete the warm pool of tool version %s", version_id
+            )
+
+
+def reconcile_warm_pools_in_background():  # pragma: no cover
+    scheduling.scheduler.add_job(
+        reconcile_warm_pools,
+        "interval",
+        seconds=config.k8s.warm_pool.reconcile_interval,
+        id="reconcile_warm_pools",
+        replace_existing=True,
+    )
+
+
+def claim_warm_pool_pod(
+    operator: k8s.KubernetesOperator,
+    version: tools_models.DatabaseVersion,
+    image: str,
+    logger: logging.LoggerAdapter,
+) -> str | None:
+    """Claim a placeholder pod for a session with the image
+
+    Returns the node of the placeholder pod, on which the image is
+    already present. Sessions are still started without a warm pool.
+    """
+    if not version.config.sessions.warm_pool.size:
+        return None
+
+    if image != get_warm_pool_image(version):
+        return None
+
+    try:
+        node_name = operator.claim_warm_pool_pod(version.id)
+    except exceptions.ApiException:
+        logger.warning("Couldn't claim a warm pool pod", exc_info=True)
+        return None
+
+    if node_name:
+        logger.info("Claimed a warm pool pod on node %s", node_name)
+    return node_name
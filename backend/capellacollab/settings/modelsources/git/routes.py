@@ -4,12 +4,25 @@
 import typing as t
 from collections import abc
 
+import asyncer
 import fastapi
 from sqlalchemy import orm
 
 from capellacollab.core import database
 from capellacollab.permissions import injectables as permissions_injectables
 from capellacollab.permissions import models as permissions_models
+from capellacollab.projects.toolmodels.modelsources.git import (
+    crud as git_models_crud,
+)
+from capellacollab.projects.toolmodels.modelsources.git import (
+    models as git_models_models,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    cache as git_cache,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    metrics as git_metrics,
+)
 from capellacollab.settings.modelsources.git import core as instances_git_core
 
 from . import crud, injectables, models, util
@@ -169,3 +182,60 @@ def validate_path(
         return True
     except Exception:
         return False
+
+
+@router.get(
+    "/-/cache-statistics",
+    response_model=git_models_models.GitCacheStatistics,
+    dependencies=[
+        fastapi.Depends(
+            permissions_injectables.PermissionValidation(
+                required_scope=permissions_models.GlobalScopes(
+                    admin=permissions_models.AdminScopes(
+                        monitoring={permissions_models.UserTokenVerb.GET}
+                    )
+                )
+            ),
+        )
+    ],
+)
+async def get_git_cache_statistics(
+    db: t.Annotated[orm.Session, fastapi.Depends(database.get_db)],
+    limit: t.Annotated[int, fastapi.Query(ge=1, le=100)] = 10,
+) -> git_models_models.GitCacheStatistics:
+    """Report the git models with the largest caches
+    and the most time spent in requests to the Git instance.
+
+    The upstream time is only tracked in the replica handling the request.
+    """
+    git_models = {
+        git_model.id: git_model
+        for git_model in await asyncer.asyncify(
+            git_models_crud.get_git_models_with_projects
+        )(db)
+    }
+    cached_bytes = await git_cache.get_cached_bytes(list(git_models))
+    upstream_usage = git_metrics.get_upstream_usage()
+
+    statistics = []
+    for git_model_id, git_model in git_models.items():
+        usage = upstream_usage.get(git_model_id, git_metrics.UpstreamUsage())
+        statistics.append(
+            git_models_models.GitModelCacheStatistics(
+                git_model_id=git_model_id,
+                project_slug=git_model.model.project.slug,
+                model_slug=git_model.model.slug,
+                cached_bytes=cached_bytes[git_model_id],
+                upstream_requests=usage.requests,
+                upstream_seconds=usage.seconds,
+            )
+        )
+
+    return git_models_models.GitCacheStatistics(
+        largest_caches=sorted(
+            statistics, key=lambda s: s.cached_bytes, reverse=True
+        )[:limit],
+        most_upstream_time=sorted(
+            statistics, key=lambda s: s.upstream_seconds, reverse=True
+        )[:limit],
+    )
@@ -476,10 +476,28 @@ class ToolBackupConfiguration(core_pydantic.BaseModel):
     )
 
 
+class WarmPoolSessionToolConfiguration(core_pydantic.BaseModel):
+    size: int = pydantic.Field(
+        default=0,
+        ge=0,
+        le=20,
+        description=(
+            "Number of placeholder pods, which are kept running with the image of this tool version. "
+            "Sessions are started on the node of a placeholder pod, "
+            "where the image is already pulled and the resources are reserved. "
+            "If set to 0, no warm pool is kept for this tool version."
+        ),
+        examples=[0, 2],
+    )
+
+
 class SessionToolConfiguration(core_pydantic.BaseModel):
     persistent: PersistentSessionToolConfiguration = pydantic.Field(
         default=PersistentSessionToolConfiguration()
     )
+    warm_pool: WarmPoolSessionToolConfiguration = pydantic.Field(
+        default=WarmPoolSessionToolConfiguration()
+    )
 
 
 class ToolVersionConfiguration(core_pydantic.BaseModelStrict):
@@ -649,3 +667,25 @@ class MinimalToolVersionWithTool(core_pydantic.BaseModel):
 class ToolNature(core_pydantic.BaseModel):
     id: int
     name: str
+
+
+class ImagePullState(enum.Enum):
+    PULLING = "Pulling"
+    PULLED = "Pulled"
+    FAILED = "Failed"
+
+
+class NodeImagePullState(core_pydantic.BaseModel):
+    node: str
+    state: ImagePullState
+    reason: str | None = None
+
+
+class PrePulledImage(core_pydantic.BaseModel):
+    image: str
+    nodes: list[NodeImagePullState]
+
+
+class ImagePrePullStatus(core_pydantic.BaseModel):
+    enabled: bool
+    images: list[PrePulledImage]
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from collections import abc
+
+from kubernetes import client
+
+from capellacollab import scheduling
+from capellacollab.configuration.app import config
+from capellacollab.core import database
+from capellacollab.sessions import operators
+from capellacollab.sessions.operators import k8s
+
+from . import crud, models
+
+log = logging.getLogger(__name__)
+
+PULL_FAILURE_REASONS = {
+    "ErrImagePull",
+    "ImagePullBackOff",
+    "InvalidImageName",
+    "ErrImageNeverPull",
+}
+
+
+def get_pre_pull_images(
+    versions: abc.Iterable[models.DatabaseVersion],
+) -> list[str]:
+    """Get the session images of all tool versions, which aren't deprecated
+
+    The session preparation image is pulled as well,
+    since it's required by every session.
+    """
+    images = {
+        config.docker.registry + "/session-preparation:" + config.docker.tag
+    }
+    for version in versions:
+        if version.config.is_deprecated:
+            continue
+
+        configured_images = version.config.sessions.persistent.image
+        for template in (configured_images.regular, configured_images.beta):
+            if template:
+                images.add(template.format(version=version.name))
+
+    return sorted(images)
+
+
+def reconcile_image_pre_pull() -> None:
+    """Keep the images of the DaemonSet in line with the tool versions"""
+    operator = operators.get_operator()
+
+    if not config.k8s.image_pre_pull.enabled:
+        operator.delete_image_pre_pull()
+        return
+
+    with database.SessionLocal() as db:
+        images = get_pre_pull_images(crud.get_versions(db))
+
+    daemon_set = operator.get_image_pre_pull()
+    if daemon_set and (
+        (daemon_set.metadata.annotations or {}).get(k8s.SPEC_ANNOTATION)
+        == k8s.get_spec_hash(images)
+    ):
+        return
+
+    log.info("Updating the image pre-pull with %d images", len(images))
+    operator.apply_image_pre_pull(images)
+
+
+def reconcile_image_pre_pull_in_background():  # pragma: no cover
+    scheduling.scheduler.add_job(
+        reconcile_image_pre_pull,
+        "interval",
+        seconds=config.k8s.image_pre_pull.reconcile_interval,
+        id="reconcile_image_pre_pull",
+        replace_existing=True,
+    )
+
+
+def get_image_pull_state(
+    status: client.V1ContainerStatus | None,
+) -> tuple[models.ImagePullState, str | None]:
+    if status is None:
+        return models.ImagePullState.PULLING, None
+
+    waiting = status.state.waiting if status.state else None
+    if waiting and waiting.reason in PULL_FAILURE_REASONS:
+        return models.ImagePullState.FAILED, waiting.message or waiting.reason
+
+    # The image ID is only known once the image is present on the node
+    if status.image_id:
+        return models.ImagePullState.PULLED, None
+
+    return models.ImagePullState.PULLING, None
+
+
+def get_image_pre_pull_status(
+    operator: k8s.KubernetesOperator, images: list[str]
+) -> models.ImagePrePullStatus:
+    """Collect the pull state of each image on each node
+
+    During updates of the DaemonSet, old pods may still report
+    images, which are no longer configured.
+    """
+    nodes: dict[str, list[models.NodeImagePullState]] = {
+        image: [] for image in images
+    }
+
+    pods = operator.get_pods(
+        label_selector="capellacollab/workload=image-pre-pull"
+    )
+    for pod in sorted(pods, key=lambda pod: pod.spec.node_name or ""):
+        if not pod.spec.node_name:
+            continue
+
+        statuses = {
+            status.name: status
+            for status in (pod.status.container_statuses or [])
+        }
+        for container in pod.spec.containers:
+            state, reason = get_image_pull_state(statuses.get(container.name))
+            nodes.setdefault(container.image, []).append(
+                models.NodeImagePullState(
+                    node=pod.spec.node_name, state=state, reason=reason
+                )
+            )
+
+    return models.ImagePrePullStatus(
+        enabled=config.k8s.image_pre_pull.enabled,
+        images=[
+            models.PrePulledImage(image=image, nodes=image_nodes)
+            for image, image_nodes in nodes.items()
+        ],
+    )
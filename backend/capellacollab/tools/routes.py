@@ -15,8 +15,10 @@ from capellacollab.core import exceptions as core_exceptions
 from capellacollab.core.logging import exceptions as logging_exceptions
 from capellacollab.permissions import injectables as permissions_injectables
 from capellacollab.permissions import models as permissions_models
+from capellacollab.sessions import operators
+from capellacollab.sessions.operators import k8s
 
-from . import crud, exceptions, injectables, models
+from . import crud, exceptions, injectables, models, prepull
 
 router = fastapi.APIRouter()
 
@@ -168,6 +170,35 @@ def get_versions_for_all_tools(
     return crud.get_versions(db)
 
 
+@router.get(
+    "/-/image-pre-pull",
+    response_model=models.ImagePrePullStatus,
+    dependencies=[
+        fastapi.Depends(
+            permissions_injectables.PermissionValidation(
+                required_scope=permissions_models.GlobalScopes(
+                    admin=permissions_models.AdminScopes(
+                        tools={permissions_models.UserTokenVerb.GET}
+                    )
+                )
+            ),
+        )
+    ],
+)
+def get_image_pre_pull_status(
+    db: t.Annotated[orm.Session, fastapi.Depends(database.get_db)],
+    operator: t.Annotated[
+        k8s.KubernetesOperator, fastapi.Depends(operators.get_operator)
+    ],
+) -> models.ImagePrePullStatus:
+    """Get the progress of pulling the images
+    of all tool versions on the session nodes.
+    """
+    return prepull.get_image_pre_pull_status(
+        operator, prepull.get_pre_pull_images(crud.get_versions(db))
+    )
+
+
 @router.get(
     "/{tool_id}/versions",
     response_model=list[models.ToolVersion],
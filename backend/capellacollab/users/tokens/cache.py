@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import threading
+
+import cachetools
+
+from . import models
+
+
+class VerifiedTokenCache:
+    """Remember personal access tokens which were verified successfully.
+
+    Verifying the argon2 hash of a token is expensive and happens on every
+    request. Entries are keyed by the token ID and a SHA-256 digest of the
+    stored hash and the presented secret. A cache hit therefore only
+    replaces the argon2 verification, the token is still loaded from the
+    database and checked for expiration. Entries expire after `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 300):
+        self._cache: cachetools.TTLCache[tuple[int, str], bool] = (
+            cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        )
+        self._lock = threading.Lock()
+
+    def is_verified(
+        self, token: models.DatabaseUserToken, secret: str
+    ) -> bool:
+        with self._lock:
+            return self._cache.get(self._key(token, secret), False)
+
+    def add(self, token: models.DatabaseUserToken, secret: str) -> None:
+        with self._lock:
+            self._cache[self._key(token, secret)] = True
+
+    def invalidate(self, token_id: int) -> None:
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == token_id]:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _key(token: models.DatabaseUserToken, secret: str) -> tuple[int, str]:
+        digest = hashlib.sha256(f"{token.hash}\0{secret}".encode()).hexdigest()
+        return token.id, digest
+
+
+verified_tokens = VerifiedTokenCache()
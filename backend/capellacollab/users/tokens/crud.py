@@ -12,7 +12,7 @@ from capellacollab.core import credentials
 from capellacollab.permissions import models as permissions_models
 from capellacollab.users import models as users_models
 
-from . import models
+from . import cache, models
 
 
 def create_token(
@@ -96,3 +96,4 @@ def delete_token(
 ) -> None:
     db.delete(existing_token)
     db.commit()
+    cache.verified_tokens.invalidate(existing_token.id)
@@ -1,7 +1,19 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from unittest import mock
+
+import pytest
 from fastapi import testclient
+from sqlalchemy import orm
+
+from capellacollab.__main__ import app
+from capellacollab.core import database
+from capellacollab.core.authentication import basic_auth
+from capellacollab.core.authentication import exceptions as auth_exceptions
+from capellacollab.core.authentication import (
+    injectables as auth_injectables,
+)
 
 
 def test_authentication_unknown_scheme(
@@ -12,3 +24,59 @@ def test_authentication_unknown_scheme(
     )
     assert response.status_code == 401
     assert response.json()["detail"]["err_code"] == "UNKNOWN_SCHEME"
+
+
+def test_authentication_is_shared_within_request(
+    client_pat: testclient.TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the route dependencies authenticate the request only once"""
+    validate = mock.AsyncMock(wraps=basic_auth.HTTPBasicAuth().validate)
+    monkeypatch.setattr(basic_auth.HTTPBasicAuth, "validate", validate)
+
+    response = client_pat.get("/api/v1/projects")
+
+    assert response.status_code == 200
+    validate.assert_awaited_once()
+
+
+def test_authentication_uses_database_session_of_request(
+    client_pat: testclient.TestClient,
+    db: orm.Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that only the database session of the route is opened"""
+    session_local = mock.Mock(return_value=db)
+    monkeypatch.setattr(database, "SessionLocal", session_local)
+    opened_sessions = []
+
+    def get_db() -> orm.Session:
+        opened_sessions.append(db)
+        return db
+
+    monkeypatch.setitem(app.dependency_overrides, database.get_db, get_db)
+
+    response = client_pat.get("/api/v1/projects")
+
+    assert response.status_code == 200
+    session_local.assert_not_called()
+    assert len(opened_sessions) == 1
+
+
+def test_authentication_error_is_shared_within_request(
+    client_unauthenticated: testclient.TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    authenticate = mock.AsyncMock(
+        side_effect=auth_exceptions.UnauthenticatedError()
+    )
+    monkeypatch.setattr(
+        auth_injectables._AuthenticationInformationValidation,
+        "authenticate",
+        authenticate,
+    )
+
+    response = client_unauthenticated.get("/api/v1/projects")
+
+    assert response.status_code == 401
+    authenticate.assert_awaited_once()
@@ -3,7 +3,9 @@
 
 import base64
 import datetime
+from unittest import mock
 
+import argon2
 import pytest
 from fastapi import testclient
 from sqlalchemy import orm
@@ -11,6 +13,7 @@ from sqlalchemy import orm
 from capellacollab.__main__ import app
 from capellacollab.permissions import models as permissions_models
 from capellacollab.users import models as users_models
+from capellacollab.users.tokens import cache as tokens_cache
 from capellacollab.users.tokens import crud as tokens_crud
 from capellacollab.users.tokens import models as tokens_models
 
@@ -189,3 +192,40 @@ def test_invalid_basic_auth_expired_token(
 
     assert response.status_code == 401
     assert response.json()["detail"]["err_code"] == "PAT_EXPIRED"
+
+
+def test_pat_verification_is_cached(client_pat: testclient.TestClient):
+    """Test that the argon2 hash of a PAT is only verified once"""
+    tokens_cache.verified_tokens.clear()
+
+    with mock.patch.object(
+        argon2.PasswordHasher,
+        "verify",
+        autospec=True,
+        side_effect=argon2.PasswordHasher.verify,
+    ) as verify:
+        assert client_pat.get("/api/v1/projects").status_code == 200
+        assert client_pat.get("/api/v1/projects").status_code == 200
+
+    verify.assert_called_once()
+
+
+def test_revoked_pat_is_removed_from_cache(
+    db: orm.Session,
+    client_pat: testclient.TestClient,
+    pat: tokens_models.DatabaseUserToken,
+    pat_password: str,
+):
+    assert client_pat.get("/api/v1/projects").status_code == 200
+    assert tokens_cache.verified_tokens.is_verified(
+        pat, pat_password.split("_")[1]
+    )
+
+    tokens_crud.delete_token(db, pat)
+
+    assert not tokens_cache.verified_tokens.is_verified(
+        pat, pat_password.split("_")[1]
+    )
+    response = client_pat.get("/api/v1/projects")
+    assert response.status_code == 401
+    assert response.json()["detail"]["err_code"] == "BASIC_TOKEN_INVALID"
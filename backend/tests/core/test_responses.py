@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime as dt
+
+import fastapi
+
+from capellacollab.core import responses
+
+LAST_MODIFIED = dt.datetime(2050, 4, 11, 10, 9, 59, 123, tzinfo=dt.UTC)
+
+
+def _create_request(headers: dict[str, str]) -> fastapi.Request:
+    return fastapi.Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [
+                (key.lower().encode(), value.encode())
+                for key, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_matching_etag_is_not_modified():
+    etag = responses.make_etag("abc", "README.md")
+    request = _create_request({"If-None-Match": f'"other", W/{etag}'})
+
+    assert responses.is_not_modified(request, etag, LAST_MODIFIED)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    etag = responses.make_etag("abc", "README.md")
+    headers = responses.get_validator_headers(etag, LAST_MODIFIED)
+    request = _create_request(
+        {
+            "If-None-Match": responses.make_etag("def", "README.md"),
+            "If-Modified-Since": headers["Last-Modified"],
+        }
+    )
+
+    assert not responses.is_not_modified(request, etag, LAST_MODIFIED)
+
+
+def test_last_modified_is_compared_in_seconds():
+    headers = responses.get_validator_headers(None, LAST_MODIFIED)
+    request = _create_request({"If-Modified-Since": headers["Last-Modified"]})
+
+    assert headers["Last-Modified"] == "Mon, 11 Apr 2050 10:09:59 GMT"
+    assert responses.is_not_modified(request, None, LAST_MODIFIED)
+    assert not responses.is_not_modified(
+        request, None, LAST_MODIFIED + dt.timedelta(seconds=1)
+    )
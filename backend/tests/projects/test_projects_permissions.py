@@ -4,8 +4,10 @@
 import fastapi
 import pytest
 from fastapi import testclient
+from sqlalchemy import orm
 
 from capellacollab.permissions import models as permissions_models
+from capellacollab.projects import crud as projects_crud
 from capellacollab.projects import models as projects_models
 from capellacollab.projects.permissions import (
     injectables as projects_permissions_injectables,
@@ -15,6 +17,7 @@ from capellacollab.projects.permissions import (
 )
 from capellacollab.projects.users import models as projects_users_models
 from capellacollab.users import models as users_models
+from capellacollab.users.tokens import models as tokens_models
 
 
 def test_get_available_project_permissions(
@@ -340,3 +343,41 @@ def test_get_actual_project_permissions_as_user_for_other_user(
 
     assert response.status_code == 403
     assert response.json()["detail"]["err_code"] == "INSUFFICIENT_PERMISSION"
+
+
+@pytest.mark.usefixtures("project_user")
+@pytest.mark.parametrize(
+    "pat_scope",
+    [
+        (
+            permissions_models.GlobalScopes(),
+            projects_permissions_models.ProjectUserScopes(
+                root={permissions_models.UserTokenVerb.GET}
+            ),
+        )
+    ],
+)
+@pytest.mark.parametrize("use_pat", [True, False])
+def test_get_scope_masks_for_projects_matches_get_scope_mask(
+    db: orm.Session,
+    user: users_models.DatabaseUser,
+    pat: tokens_models.DatabaseUserToken,
+    use_pat: bool,
+):
+    """Test that the bulk evaluation returns the same scopes
+    as the evaluation for individual projects
+    """
+    token = pat if use_pat else None
+    global_scope_mask = permissions_models.ROLE_MASKS[user.role]
+    projects = projects_crud.get_projects(db)
+
+    masks = projects_permissions_injectables.get_scope_masks_for_projects(
+        user, token, global_scope_mask, projects, db
+    )
+
+    assert masks == {
+        project.id: projects_permissions_injectables.get_scope_mask(
+            user, token, global_scope_mask, project, db
+        )
+        for project in projects
+    }
@@ -8,6 +8,7 @@ import capellacollab.projects.models as projects_models
 import capellacollab.projects.toolmodels.crud as toolmodels_crud
 import capellacollab.projects.toolmodels.models as toolmodels_models
 import capellacollab.tools.models as tools_models
+from capellacollab.projects.toolmodels.diagrams import core as diagrams_core
 
 
 @pytest.fixture(name="capella_model")
@@ -39,3 +40,8 @@ def fixture_jupyter_model(
         jupyter_model,
         tool=jupyter_tool,
     )
+
+
+@pytest.fixture(autouse=True)
+def clear_diagram_cache_indices():
+    diagrams_core.diagram_cache_indices.clear()
@@ -1,21 +1,73 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
 import datetime
 import logging
+import typing as t
 
 import pytest
+import valkey
+from testcontainers.core import container as testcontainers_container
+from testcontainers.core import waiting_utils
 
 import capellacollab.settings.modelsources.git.models as git_models
 import capellacollab.settings.modelsources.t4c.instance.models as t4c_models
 import capellacollab.settings.modelsources.t4c.instance.repositories.interface as t4c_repositories_interface
+from capellacollab.configuration.app import config
 from capellacollab.core import credentials
+from capellacollab.projects.toolmodels.modelsources.git.github import (
+    artifacts as github_artifacts,
+)
+from capellacollab.projects.toolmodels.modelsources.git.gitlab import (
+    handler as gitlab_handler,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    cache as git_cache,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    local_cache as git_local_cache,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    metrics as git_metrics,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    ratelimit as git_ratelimit,
+)
+
+
+@contextlib.asynccontextmanager
+async def _mock_lock(*args, **kwargs):
+    yield False
+
+
+@pytest.fixture(name="valkey_url", scope="session")
+def fixture_valkey_url() -> t.Generator[str, None, None]:
+    with testcontainers_container.DockerContainer(
+        "valkey/valkey:8.1"
+    ).with_exposed_ports(6379) as valkey_container:
+        waiting_utils.wait_for_logs(
+            valkey_container, "Ready to accept connections"
+        )
+        host = valkey_container.get_container_host_ip()
+        port = valkey_container.get_exposed_port(6379)
+        yield f"valkey://{host}:{port}/0"
+
+
+@pytest.fixture(name="git_valkey_cache")
+def fixture_git_valkey_cache(
+    valkey_url: str, monkeypatch: pytest.MonkeyPatch
+) -> git_cache.GitValkeyCache:
+    monkeypatch.setattr(config.valkey, "url", valkey_url)
+    valkey.Valkey.from_url(valkey_url).flushdb()
+    return git_cache.GitValkeyCache(git_model_id=1)
 
 
 @pytest.fixture(name="mock_git_valkey_cache")
 def fixture_mock_git_valkey_cache(monkeypatch: pytest.MonkeyPatch):
     class MockGitValkeyCache:
-        cache: dict[str, tuple[datetime.datetime, bytes]] = {}
+        cache: dict[str, tuple] = {}
+        head_commits: dict[str, str] = {}
 
         def __init__(self, *args, **kwargs) -> None:
             super().__init__()
@@ -25,9 +77,27 @@ def fixture_mock_git_valkey_cache(monkeypatch: pytest.MonkeyPatch):
             file_path: str,
             revision: str,
             logger: logging.LoggerAdapter,
-        ) -> tuple[datetime.datetime, bytes] | None:
+        ) -> (
+            tuple[
+                datetime.datetime, bytes, str | None, datetime.datetime | None
+            ]
+            | None
+        ):
             return MockGitValkeyCache.cache.get(f"f:{file_path}", None)
 
+        async def get_head_commit(
+            self, revision: str, logger: logging.LoggerAdapter
+        ) -> str | None:
+            return MockGitValkeyCache.head_commits.get(f"h:{revision}")
+
+        async def put_head_commit(
+            self,
+            revision: str,
+            head_commit: str,
+            logger: logging.LoggerAdapter,
+        ) -> None:
+            MockGitValkeyCache.head_commits[f"h:{revision}"] = head_commit
+
         async def get_artifact_data(
             self,
             job_id: str,
@@ -43,10 +113,25 @@ def fixture_mock_git_valkey_cache(monkeypatch: pytest.MonkeyPatch):
             content: bytes,
             revision: str,
             logger: logging.LoggerAdapter,
+            head_commit: str | None = None,
         ) -> None:
             MockGitValkeyCache.cache[f"f:{file_path}"] = (
                 last_updated,
                 content,
+                head_commit,
+                datetime.datetime.now(datetime.UTC),
+            )
+
+        async def touch_file_data(
+            self,
+            file_path: str,
+            revision: str,
+            logger: logging.LoggerAdapter,
+        ) -> None:
+            file_data = MockGitValkeyCache.cache[f"f:{file_path}"]
+            MockGitValkeyCache.cache[f"f:{file_path}"] = (
+                *file_data[:3],
+                datetime.datetime.now(datetime.UTC),
             )
 
         async def put_artifact_data(
@@ -62,8 +147,11 @@ def fixture_mock_git_valkey_cache(monkeypatch: pytest.MonkeyPatch):
                 content,
             )
 
+        lock_file_data = lock_artifact_data = _mock_lock
+
         async def clear(self) -> None:
             MockGitValkeyCache.cache.clear()
+            MockGitValkeyCache.head_commits.clear()
 
     monkeypatch.setattr(
         "capellacollab.projects.toolmodels.modelsources.git.handler.cache.GitValkeyCache",
@@ -97,3 +185,28 @@ def fixture_mock_add_user_to_t4c_repository(monkeypatch: pytest.MonkeyPatch):
         "add_user_to_repository",
         mock_add_user_to_repository,
     )
+
+
+@pytest.fixture(autouse=True)
+def clear_last_successful_job_runs():
+    gitlab_handler.last_successful_job_runs.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_github_artifact_archives():
+    github_artifacts.artifact_archives.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_git_upstream_usage():
+    git_metrics.clear_upstream_usage()
+
+
+@pytest.fixture(autouse=True)
+def clear_git_local_cache():
+    git_local_cache.local_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_git_rate_limits():
+    git_ratelimit.rate_limiter.clear()
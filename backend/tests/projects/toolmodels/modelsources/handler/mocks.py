@@ -68,6 +68,19 @@ def mock_git_get_commit_information_api(
             )
 
 
+def mock_gitlab_project_api(
+    git_type: git_models.GitType, aiomock: aioresponses
+):
+    """Mock the lookup of the GitLab project ID in the handler factory"""
+    if git_type == git_models.GitType.GITLAB:
+        aiomock.get(
+            "https://example.com/api/v4/projects/test%2Fproject",
+            status=200,
+            repeat=True,
+            payload={"id": "10000"},
+        )
+
+
 def mock_git_rest_api_for_artifacts(
     git_type: git_models.GitType,
     job_name: str,
@@ -75,15 +88,10 @@ def mock_git_rest_api_for_artifacts(
     pipeline_ids: list[str],
     aiomock: aioresponses,
 ):
+    mock_gitlab_project_api(git_type, aiomock)
+
     match git_type:
         case git_models.GitType.GITLAB:
-            aiomock.get(
-                "https://example.com/api/v4/projects/test%2Fproject",
-                status=200,
-                repeat=True,
-                payload={"id": "10000"},
-            )
-
             aiomock.get(
                 "https://example.com/api/v4/projects/10000/pipelines?per_page=20&ref=main",
                 status=200,
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import aiohttp
+import aioresponses
+import pytest
+
+from capellacollab.projects.toolmodels.modelsources.git.gitlab import (
+    handler as gitlab_handler,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    client as git_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuses_session_per_api_url():
+    pool = git_client.GitClientSessionPool()
+    pool.open()
+
+    session = pool.get("https://example.com/api/v4")
+    assert session is not None
+    assert pool.get("https://example.com/api/v4") is session
+    assert pool.get("https://example.org/api/v4") is not session
+
+    await pool.close()
+
+    assert session.closed
+    assert pool.get("https://example.com/api/v4") is None
+
+
+@pytest.mark.asyncio
+async def test_session_pool_is_bound_to_event_loop():
+    """Sessions can't be shared between event loops"""
+    pool = git_client.GitClientSessionPool()
+
+    assert pool.get("https://example.com/api/v4") is None
+
+    await asyncio.to_thread(asyncio.run, _open_pool(pool))
+
+    assert pool.get("https://example.com/api/v4") is None
+
+
+async def _open_pool(pool: git_client.GitClientSessionPool):
+    pool.open()
+
+
+@pytest.mark.asyncio
+async def test_handler_uses_shared_session(
+    aiomock: aioresponses.aioresponses,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_git_valkey_cache,
+):
+    """Test that the handler doesn't open a session per request"""
+    pool = git_client.GitClientSessionPool()
+    pool.open()
+    session = pool.get("https://example.com/api/v4")
+    monkeypatch.setattr(aiohttp, "ClientSession", None)
+
+    handler = gitlab_handler.GitLabHandler(
+        1,
+        "https://example.com/test/project",
+        "main",
+        "password",
+        "https://example.com/api/v4",
+        "10000",
+        session,
+    )
+    aiomock.get(
+        "https://example.com/api/v4/projects/10000/jobs/1",
+        payload={"started_at": "2050-04-11T10:09:59.000+02:00"},
+        repeat=True,
+    )
+
+    await handler.get_started_at_for_job("1")
+    await handler.get_started_at_for_job("1")
+
+    assert not session.closed
+    await pool.close()
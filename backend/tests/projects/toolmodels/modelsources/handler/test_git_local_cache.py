@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime as dt
+
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    local_cache as git_local_cache,
+)
+
+LAST_UPDATED = dt.datetime(2050, 4, 11, tzinfo=dt.UTC)
+
+
+def test_local_cache_is_bounded_by_entries():
+    cache = git_local_cache.LocalGitCache(maxsize=2)
+
+    cache.put("1:f:main:a", (LAST_UPDATED, b"a", None))
+    cache.put("1:f:main:b", (LAST_UPDATED, b"b", None))
+    cache.get("1:f:main:a")
+    cache.put("1:f:main:c", (LAST_UPDATED, b"c", None))
+
+    assert cache.get("1:f:main:a")
+    assert cache.get("1:f:main:b") is None
+    assert cache.get("1:f:main:c")
+
+
+def test_local_cache_is_bounded_by_bytes():
+    cache = git_local_cache.LocalGitCache(maxbytes=2048)
+
+    cache.put("1:f:main:a", (LAST_UPDATED, b"a" * 1024, None))
+    cache.put("1:f:main:b", (LAST_UPDATED, b"b" * 1024, None))
+
+    assert cache.get("1:f:main:a") is None
+    assert cache.get("1:f:main:b")
+
+
+def test_local_cache_skips_large_entries():
+    """Large entries are only cached in Valkey"""
+    cache = git_local_cache.LocalGitCache()
+    content = b"a" * (git_local_cache.MAX_ENTRY_SIZE + 1)
+
+    cache.put("1:f:main:a", (LAST_UPDATED, b"a", None))
+    cache.put("1:f:main:a", (LAST_UPDATED, content, None))
+
+    assert cache.get("1:f:main:a") is None
+
+
+def test_invalidation_message_drops_entries_of_git_model():
+    git_local_cache.local_cache.put("1:h:main", ("abc",))
+    git_local_cache.local_cache.put("11:h:main", ("def",))
+
+    git_local_cache.invalidation_listener.handle_message("1")
+
+    assert git_local_cache.local_cache.get("1:h:main") is None
+    assert git_local_cache.local_cache.get("11:h:main") == ("def",)
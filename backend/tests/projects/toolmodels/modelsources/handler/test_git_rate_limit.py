@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+
+import multidict
+import pytest
+
+from capellacollab.configuration.app import config
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    exceptions as git_handler_exceptions,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    ratelimit,
+)
+
+API_URL = "https://example.com/api/v4"
+HEADERS = {"PRIVATE-TOKEN": "password"}
+
+
+def _update(
+    limiter: ratelimit.UpstreamRateLimiter,
+    status: int,
+    **response_headers: str,
+) -> bool:
+    return limiter.update(
+        API_URL,
+        HEADERS,
+        status,
+        multidict.CIMultiDictProxy(
+            multidict.CIMultiDict(
+                (name.replace("_", "-"), value)
+                for name, value in response_headers.items()
+            )
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_rejects_requests_until_reset():
+    limiter = ratelimit.UpstreamRateLimiter()
+
+    assert _update(
+        limiter,
+        403,
+        X_RateLimit_Limit="5000",
+        X_RateLimit_Remaining="0",
+        X_RateLimit_Reset=str(int(time.time()) + 600),
+    )
+
+    with pytest.raises(git_handler_exceptions.GitInstanceRateLimitedError):
+        await limiter.acquire(API_URL, HEADERS)
+    # Requests with other tokens have their own budget
+    await limiter.acquire(API_URL, {"PRIVATE-TOKEN": "other"})
+
+
+@pytest.mark.asyncio
+async def test_background_requests_leave_reserve_to_interactive_requests(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.requests, "rate_limit_reserve", 0.1)
+    limiter = ratelimit.UpstreamRateLimiter()
+
+    assert not _update(
+        limiter,
+        200,
+        RateLimit_Limit="100",
+        RateLimit_Remaining="10",
+        RateLimit_Reset=str(int(time.time()) + 60),
+    )
+
+    with ratelimit.background_priority():
+        with pytest.raises(git_handler_exceptions.GitInstanceRateLimitedError):
+            await limiter.acquire(API_URL, HEADERS)
+    await limiter.acquire(API_URL, HEADERS)
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_wait_for_short_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.requests, "timeout", 2)
+    delays = []
+
+    async def mock_sleep(delay: float):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+    limiter = ratelimit.UpstreamRateLimiter()
+
+    assert _update(limiter, 429, Retry_After="1")
+    await limiter.acquire(API_URL, HEADERS)
+
+    assert len(delays) == 1
+    assert 0 < delays[0] <= 1
+
+
+def test_limits_without_reset_use_exponential_backoff():
+    limiter = ratelimit.UpstreamRateLimiter()
+
+    assert _update(limiter, 429)
+    first = limiter.get_retry_after(API_URL, HEADERS)
+    assert _update(limiter, 429)
+    second = limiter.get_retry_after(API_URL, HEADERS)
+
+    assert first == ratelimit.MIN_BACKOFF
+    assert second == 2 * ratelimit.MIN_BACKOFF
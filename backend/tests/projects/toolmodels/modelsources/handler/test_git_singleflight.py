@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    singleflight,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_shared():
+    flights = singleflight.SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    tasks = [asyncio.create_task(flights.do("key", call)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [(1, False), (1, True), (1, True)]
+    assert await flights.do("key", call) == (2, False)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flights = singleflight.SingleFlight()
+    release = asyncio.Event()
+
+    async def call() -> str:
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(flights.do("key", call))
+    second = asyncio.create_task(flights.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == ("result", True)
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_shared():
+    flights = singleflight.SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        flights.do("key", call),
+        flights.do("key", call),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime as dt
+import logging
+from unittest import mock
+
+import pytest
+
+from capellacollab.configuration.app import config
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    cache as git_cache,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    local_cache as git_local_cache,
+)
+
+LAST_UPDATED = dt.datetime(2050, 4, 11, tzinfo=dt.UTC)
+
+
+async def put_file(
+    cache: git_cache.GitValkeyCache,
+    file_path: str,
+    content: bytes,
+    logger: logging.LoggerAdapter,
+) -> None:
+    await cache.put_file_data(file_path, LAST_UPDATED, content, "main", logger)
+    # Read the entries from Valkey instead of the process
+    git_local_cache.local_cache.clear()
+
+
+async def get_file(
+    cache: git_cache.GitValkeyCache,
+    file_path: str,
+    logger: logging.LoggerAdapter,
+) -> bytes | None:
+    file_data = await cache.get_file_data(file_path, "main", logger)
+    git_local_cache.local_cache.clear()
+    return file_data[1] if file_data else None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("content", "encoding"),
+    [
+        (b"short", b""),
+        (b"a" * 4096, b"gzip"),
+        (b"a" * (git_cache.COMPRESSION_OFFLOAD_THRESHOLD + 1), b"gzip"),
+    ],
+)
+async def test_file_data_round_trip(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+    monkeypatch: pytest.MonkeyPatch,
+    content: bytes,
+    encoding: bytes,
+):
+    monkeypatch.setattr(config.valkey, "git_cache_compression_threshold", 1024)
+    key = git_valkey_cache._get_file_key("README.md", "main")
+
+    await put_file(git_valkey_cache, "README.md", content, logger)
+
+    stored_content, stored_encoding = await git_valkey_cache._valkey.hmget(
+        key, ["content", "encoding"]
+    )
+    assert stored_encoding == encoding
+    if encoding:
+        assert len(stored_content) < len(content)
+    assert await get_file(git_valkey_cache, "README.md", logger) == content
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.valkey, "git_cache_quota", 2500)
+
+    await put_file(git_valkey_cache, "a", b"a" * 1000, logger)
+    await put_file(git_valkey_cache, "b", b"b" * 1000, logger)
+    assert await get_file(git_valkey_cache, "a", logger)
+    await put_file(git_valkey_cache, "c", b"c" * 1000, logger)
+
+    assert await get_file(git_valkey_cache, "a", logger)
+    assert await get_file(git_valkey_cache, "b", logger) is None
+    assert await get_file(git_valkey_cache, "c", logger)
+    assert (await git_cache.get_cached_bytes([1]))[1] <= 2500
+
+
+@pytest.mark.asyncio
+async def test_overwritten_entries_are_accounted_once(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+):
+    key = git_valkey_cache._get_file_key("README.md", "main")
+
+    await put_file(git_valkey_cache, "README.md", b"a" * 1000, logger)
+    await put_file(git_valkey_cache, "README.md", b"b" * 500, logger)
+
+    size = await git_valkey_cache._valkey.hget(
+        git_valkey_cache._sizes_key, key
+    )
+    assert (
+        await git_valkey_cache._valkey.zcard(git_valkey_cache._keys_key) == 1
+    )
+    assert (await git_cache.get_cached_bytes([1]))[1] == int(size)
+    assert 500 < int(size) < 1000
+
+
+@pytest.mark.asyncio
+async def test_clear_deletes_tracked_and_untracked_keys(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+):
+    await put_file(git_valkey_cache, "README.md", b"# README", logger)
+    await git_valkey_cache.put_head_commit("main", "abc", logger)
+    # Entries of previous versions aren't tracked
+    await git_valkey_cache._valkey.hset(
+        "1:f:main:legacy", mapping={"content": b"legacy"}
+    )
+    await git_valkey_cache._valkey.set("2:h:main", "def")
+
+    await git_valkey_cache.clear()
+
+    assert sorted(
+        [key async for key in git_valkey_cache._valkey.scan_iter()]
+    ) == [b"1:legacy-keys-cleared", b"2:h:main"]
+
+
+@pytest.mark.asyncio
+async def test_clear_searches_untracked_keys_only_once(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+):
+    await git_valkey_cache.clear()
+    await put_file(git_valkey_cache, "README.md", b"# README", logger)
+    await git_valkey_cache._valkey.set("1:h:untracked", "abc")
+
+    with mock.patch.object(
+        git_valkey_cache._valkey, "scan_iter", autospec=True
+    ) as scan_iter:
+        await git_valkey_cache.clear()
+
+    scan_iter.assert_not_called()
+    assert sorted(
+        [key async for key in git_valkey_cache._valkey.scan_iter()]
+    ) == [b"1:h:untracked", b"1:legacy-keys-cleared"]
+
+
+@pytest.mark.asyncio
+async def test_touch_file_data_updates_validation(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+):
+    await put_file(git_valkey_cache, "README.md", b"# README", logger)
+    validated_at = (
+        await git_valkey_cache.get_file_data("README.md", "main", logger)
+    )[3]
+
+    await git_valkey_cache.touch_file_data("README.md", "main", logger)
+
+    file_data = await git_valkey_cache.get_file_data(
+        "README.md", "main", logger
+    )
+    assert file_data[1] == b"# README"
+    assert file_data[3] > validated_at
+
+
+@pytest.mark.asyncio
+async def test_touch_file_data_does_not_recreate_evicted_entry(
+    git_valkey_cache: git_cache.GitValkeyCache,
+    logger: logging.LoggerAdapter,
+):
+    key = git_valkey_cache._get_file_key("README.md", "main")
+
+    await git_valkey_cache.touch_file_data("README.md", "main", logger)
+
+    assert not await git_valkey_cache._valkey.exists(key)
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import io
+import typing as t
+import zipfile
+
+import pytest
+
+from capellacollab.projects.toolmodels.modelsources.git.github import (
+    artifacts as github_artifacts,
+)
+
+
+def _create_zip_file() -> bytes:
+    byte_io = io.BytesIO()
+    with zipfile.ZipFile(byte_io, "w") as zf:
+        zf.writestr("index.json", "[]")
+        zf.writestr("_c90e4Hdf2d2UosmJBo0GTw.svg", "<svg></svg>")
+    return byte_io.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_artifact_archive_is_downloaded_once():
+    downloads = 0
+
+    async def download(file: t.BinaryIO):
+        nonlocal downloads
+        downloads += 1
+        await asyncio.sleep(0.01)
+        file.write(_create_zip_file())
+
+    cache = github_artifacts.ArtifactArchiveCache()
+    archives = await asyncio.gather(
+        *(cache.get(("github", "test/project", "1"), download) for _ in "abc")
+    )
+    archive = await cache.get(("github", "test/project", "1"), download)
+
+    assert downloads == 1
+    assert all(other is archive for other in archives)
+    assert archive.read("_c90e4Hdf2d2UosmJBo0GTw.svg") == b"<svg></svg>"
+    assert archive.read("index.json") == b"[]"
+    assert archive.read("unknown.svg") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_artifact_download_is_retried():
+    async def failing_download(file: t.BinaryIO):
+        raise ConnectionError
+
+    async def download(file: t.BinaryIO):
+        file.write(_create_zip_file())
+
+    cache = github_artifacts.ArtifactArchiveCache()
+    with pytest.raises(ConnectionError):
+        await cache.get(("github", "test/project", "1"), failing_download)
+
+    archive = await cache.get(("github", "test/project", "1"), download)
+    assert archive.read("index.json") == b"[]"
@@ -0,0 +1,368 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import base64
+import datetime as dt
+import logging
+
+import aiohttp
+import aioresponses
+import prometheus_client
+import pytest
+
+from capellacollab.configuration.app import config
+from capellacollab.projects.toolmodels.modelsources.git import (
+    exceptions as git_exceptions,
+)
+from capellacollab.projects.toolmodels.modelsources.git.gitlab import (
+    handler as gitlab_handler,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    exceptions as git_handler_exceptions,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    handler as git_handler,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    metrics as git_metrics,
+)
+
+API_URL = "https://example.com/api/v4/projects/10000"
+
+
+@pytest.fixture(name="gitlab_handler")
+def fixture_gitlab_handler(
+    mock_git_valkey_cache,
+) -> gitlab_handler.GitLabHandler:
+    return gitlab_handler.GitLabHandler(
+        1,
+        "https://example.com/test/project",
+        "main",
+        "password",
+        "https://example.com/api/v4",
+        "10000",
+    )
+
+
+def _mock_pipelines(
+    aiomock: aioresponses.aioresponses, job_states: dict[str, str | None]
+):
+    aiomock.get(
+        f"{API_URL}/pipelines?per_page=20&ref=main",
+        payload=[{"id": pipeline_id} for pipeline_id in job_states],
+    )
+    for pipeline_id, job_state in job_states.items():
+        jobs = []
+        if job_state:
+            jobs.append(
+                {
+                    "id": f"job-{pipeline_id}",
+                    "name": "update_capella_diagram_cache",
+                    "status": job_state,
+                    "started_at": "2050-04-11T10:09:59.000+02:00",
+                }
+            )
+        aiomock.get(f"{API_URL}/pipelines/{pipeline_id}/jobs", payload=jobs)
+
+
+@pytest.mark.asyncio
+async def test_last_successful_job_run_uses_newest_finished_job(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    _mock_pipelines(
+        aiomock, {"3": None, "2": "running", "1": "success", "0": "success"}
+    )
+
+    job_id, started_at = await gitlab_handler.get_last_successful_job_run(
+        "update_capella_diagram_cache"
+    )
+
+    assert job_id == "job-1"
+    assert started_at == dt.datetime.fromisoformat(
+        "2050-04-11T10:09:59.000+02:00"
+    )
+
+
+@pytest.mark.asyncio
+async def test_last_successful_job_run_fails_for_newer_failed_job(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    _mock_pipelines(aiomock, {"2": "failed", "1": "success"})
+
+    with pytest.raises(git_exceptions.GitPipelineJobUnsuccessfulError):
+        await gitlab_handler.get_last_successful_job_run(
+            "update_capella_diagram_cache"
+        )
+
+
+@pytest.mark.asyncio
+async def test_last_successful_job_run_is_memoised(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    _mock_pipelines(aiomock, {"1": "success"})
+
+    first = await gitlab_handler.get_last_successful_job_run(
+        "update_capella_diagram_cache"
+    )
+    # The mocked responses are consumed, a second lookup would fail
+    second = await gitlab_handler.get_last_successful_job_run(
+        "update_capella_diagram_cache"
+    )
+
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_get_file_skips_commit_lookup_for_unchanged_head(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    """Test that files are served from the cache
+    while the head commit of the revision is unchanged
+    """
+    aiomock.get(
+        f"{API_URL}/repository/commits/main",
+        payload={"id": "ee85bc253111b7a8ca2ce5aa26b8f5f36325f48a"},
+        repeat=True,
+    )
+    aiomock.get(
+        f"{API_URL}/repository/commits?path=README.md&ref_name=main",
+        payload=[{"authored_date": "2050-04-11T10:09:59.000+02:00"}],
+    )
+    aiomock.get(
+        f"{API_URL}/repository/files/README.md?ref=main",
+        payload={"content": base64.b64encode(b"# README").decode()},
+    )
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+
+    first = await gitlab_handler.get_file("README.md", logger)
+    # The mocked file responses are consumed, a second lookup would fail
+    second = await gitlab_handler.get_file("README.md", logger)
+
+    assert first == second
+    assert second[1] == b"# README"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exception",
+    [
+        aiohttp.ClientConnectionError(),
+        TimeoutError(),
+        git_handler_exceptions.GitInstanceRateLimitedError(60),
+    ],
+)
+async def test_unresolved_head_commit_falls_back_to_cache(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+    exception: Exception,
+):
+    """Test that the cached file is used if the head commit
+    of the revision can't be resolved
+    """
+    aiomock.get(f"{API_URL}/repository/commits/main", exception=exception)
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+
+    assert await gitlab_handler.get_head_commit("main", logger) is None
+
+
+def _get_cache_lookups(result: str) -> float:
+    return (
+        prometheus_client.REGISTRY.get_sample_value(
+            "backend_git_cache_lookups_total",
+            {"kind": "file", "result": result},
+        )
+        or 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_file_records_cache_lookups_and_upstream_usage(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    aiomock.get(
+        f"{API_URL}/repository/commits/main",
+        payload={"id": "ee85bc253111b7a8ca2ce5aa26b8f5f36325f48a"},
+    )
+    aiomock.get(
+        f"{API_URL}/repository/commits?path=README.md&ref_name=main",
+        payload=[{"authored_date": "2050-04-11T10:09:59.000+02:00"}],
+    )
+    aiomock.get(
+        f"{API_URL}/repository/files/README.md?ref=main",
+        payload={"content": base64.b64encode(b"# README").decode()},
+    )
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+    misses, hits = _get_cache_lookups("miss"), _get_cache_lookups("hit")
+
+    await gitlab_handler.get_file("README.md", logger)
+    await gitlab_handler.get_file("README.md", logger)
+
+    assert _get_cache_lookups("miss") == misses + 1
+    assert _get_cache_lookups("hit") == hits + 1
+    assert git_metrics.get_upstream_usage()[1].requests == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_file_calls_share_upstream_requests(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    aiomock.get(
+        f"{API_URL}/repository/commits/main",
+        payload={"id": "ee85bc253111b7a8ca2ce5aa26b8f5f36325f48a"},
+    )
+    aiomock.get(
+        f"{API_URL}/repository/commits?path=README.md&ref_name=main",
+        payload=[{"authored_date": "2050-04-11T10:09:59.000+02:00"}],
+    )
+    aiomock.get(
+        f"{API_URL}/repository/files/README.md?ref=main",
+        payload={"content": base64.b64encode(b"# README").decode()},
+    )
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+
+    # The mocked responses can only be consumed once
+    results = await asyncio.gather(
+        *(gitlab_handler.get_file("README.md", logger) for _ in range(3))
+    )
+
+    assert all(result[1] == b"# README" for result in results)
+
+
+def _mock_changed_readme(aiomock: aioresponses.aioresponses):
+    aiomock.get(
+        f"{API_URL}/repository/commits/main",
+        payload={"id": "ee85bc253111b7a8ca2ce5aa26b8f5f36325f48a"},
+    )
+    aiomock.get(
+        f"{API_URL}/repository/commits?path=README.md&ref_name=main",
+        payload=[{"authored_date": "2050-04-11T10:09:59.000+02:00"}],
+    )
+    aiomock.get(
+        f"{API_URL}/repository/files/README.md?ref=main",
+        payload={"content": base64.b64encode(b"# New README").decode()},
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_file_serves_stale_file_while_revalidating(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    mock_git_valkey_cache,
+    aiomock: aioresponses.aioresponses,
+):
+    """Test that a recently validated file is served immediately,
+    while the file is refreshed in the background
+    """
+    _mock_changed_readme(aiomock)
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+    await mock_git_valkey_cache.put_file_data(
+        "README.md",
+        dt.datetime(2050, 1, 1, tzinfo=dt.UTC),
+        b"# README",
+        "main",
+        logger,
+        "0d5c4b5c0eb8ff37dc4bd5bdaf64e7b3b3d6e6b2",
+    )
+
+    _, content = await gitlab_handler.get_file("README.md", logger)
+
+    assert content == b"# README"
+    assert gitlab_handler.served_stale
+    assert (
+        gitlab_handler.get_file_commit("README.md")
+        == "0d5c4b5c0eb8ff37dc4bd5bdaf64e7b3b3d6e6b2"
+    )
+
+    await asyncio.gather(*git_handler._background_refreshes)
+    file_data = await mock_git_valkey_cache.get_file_data(
+        "README.md", "main", logger
+    )
+    assert file_data[1] == b"# New README"
+    assert file_data[2] == "ee85bc253111b7a8ca2ce5aa26b8f5f36325f48a"
+
+
+@pytest.mark.asyncio
+async def test_get_file_waits_for_git_instance_without_max_staleness(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    mock_git_valkey_cache,
+    aiomock: aioresponses.aioresponses,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.valkey, "git_cache_max_staleness", 0)
+    _mock_changed_readme(aiomock)
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+    await mock_git_valkey_cache.put_file_data(
+        "README.md",
+        dt.datetime(2050, 1, 1, tzinfo=dt.UTC),
+        b"# README",
+        "main",
+        logger,
+        "0d5c4b5c0eb8ff37dc4bd5bdaf64e7b3b3d6e6b2",
+    )
+
+    _, content = await gitlab_handler.get_file("README.md", logger)
+
+    assert content == b"# New README"
+    assert not gitlab_handler.served_stale
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exception",
+    [
+        TimeoutError(),
+        git_handler_exceptions.GitInstanceRateLimitedError(60),
+    ],
+)
+async def test_get_file_serves_cached_file_if_git_instance_is_unavailable(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    mock_git_valkey_cache,
+    aiomock: aioresponses.aioresponses,
+    monkeypatch: pytest.MonkeyPatch,
+    exception: Exception,
+):
+    """Test that the cached file is served beyond the maximum staleness
+    if it can't be validated
+    """
+    monkeypatch.setattr(config.valkey, "git_cache_max_staleness", 0)
+    aiomock.get(f"{API_URL}/repository/commits/main", exception=exception)
+    aiomock.get(
+        f"{API_URL}/repository/commits?path=README.md&ref_name=main",
+        exception=exception,
+    )
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+    await mock_git_valkey_cache.put_file_data(
+        "README.md",
+        dt.datetime(2050, 1, 1, tzinfo=dt.UTC),
+        b"# README",
+        "main",
+        logger,
+        "0d5c4b5c0eb8ff37dc4bd5bdaf64e7b3b3d6e6b2",
+    )
+
+    _, content = await gitlab_handler.get_file("README.md", logger)
+
+    assert content == b"# README"
+    assert gitlab_handler.served_stale
+
+
+@pytest.mark.asyncio
+async def test_get_file_fails_without_cached_file_if_git_instance_is_unavailable(
+    gitlab_handler: gitlab_handler.GitLabHandler,
+    aiomock: aioresponses.aioresponses,
+):
+    aiomock.get(f"{API_URL}/repository/commits/main", exception=TimeoutError())
+    aiomock.get(
+        f"{API_URL}/repository/commits?path=README.md&ref_name=main",
+        exception=TimeoutError(),
+    )
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+
+    with pytest.raises(TimeoutError):
+        await gitlab_handler.get_file("README.md", logger)
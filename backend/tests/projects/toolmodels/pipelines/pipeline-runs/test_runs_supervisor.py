@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+import time
+import types
+from unittest import mock
+
+import pytest
+from kubernetes import client as k8s_client
+
+from capellacollab.projects.toolmodels.backups.runs import (
+    interface as pipeline_runs_interface,
+)
+from capellacollab.projects.toolmodels.backups.runs import (
+    supervisor as pipeline_runs_supervisor,
+)
+from capellacollab.sessions import operators
+from capellacollab.sessions.operators import informer
+
+
+@pytest.fixture(name="operator")
+def fixture_operator(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    operator = types.SimpleNamespace(
+        job_informer=informer.Informer(
+            "jobs", mock.Mock(), namespace="default", resync_interval=60
+        ),
+        pod_informer=informer.Informer(
+            "pods", mock.Mock(), namespace="default", resync_interval=60
+        ),
+    )
+    monkeypatch.setattr(operators, "get_operator", lambda: operator)
+    return operator
+
+
+@pytest.fixture(name="supervisor")
+def fixture_supervisor(
+    operator: types.SimpleNamespace,
+) -> pipeline_runs_supervisor.PipelineRunSupervisor:
+    del operator
+    return pipeline_runs_supervisor.PipelineRunSupervisor()
+
+
+@pytest.fixture(name="supervise_job_run")
+def fixture_supervise_job_run(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    supervise_job_run = mock.Mock()
+    monkeypatch.setattr(
+        pipeline_runs_interface, "supervise_job_run", supervise_job_run
+    )
+    return supervise_job_run
+
+
+def _create_job(labels: dict[str, str] | None) -> k8s_client.V1Job:
+    return k8s_client.V1Job(
+        metadata=k8s_client.V1ObjectMeta(name="example-job", labels=labels)
+    )
+
+
+async def _run_supervisor(
+    supervisor: pipeline_runs_supervisor.PipelineRunSupervisor,
+    seconds: float,
+):
+    supervisor.start()
+    await asyncio.sleep(seconds)
+    await supervisor.stop()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_polls_unfinished_runs(
+    supervisor: pipeline_runs_supervisor.PipelineRunSupervisor,
+    supervise_job_run: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that all unfinished runs are updated on startup"""
+    monkeypatch.setattr(
+        pipeline_runs_supervisor,
+        "_get_unfinished_run_ids",
+        lambda: {1, 2},
+    )
+
+    await _run_supervisor(supervisor, 0.1)
+
+    assert sorted(
+        call.args[0] for call in supervise_job_run.call_args_list
+    ) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_supervisor_updates_run_on_event(
+    supervisor: pipeline_runs_supervisor.PipelineRunSupervisor,
+    supervise_job_run: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that events of labelled jobs trigger an update of the run"""
+    monkeypatch.setattr(
+        pipeline_runs_supervisor, "_get_unfinished_run_ids", set
+    )
+    supervisor.start()
+    await asyncio.sleep(0.05)
+
+    watch_thread = threading.Thread(
+        target=supervisor.notify,
+        args=(
+            "MODIFIED",
+            _create_job({pipeline_runs_supervisor.PIPELINE_RUN_LABEL: "3"}),
+        ),
+    )
+    watch_thread.start()
+    watch_thread.join()
+    supervisor.notify("MODIFIED", _create_job(None))
+
+    await asyncio.sleep(0.1)
+    await supervisor.stop()
+
+    supervise_job_run.assert_called_once_with(3)
+
+
+@pytest.mark.asyncio
+async def test_supervisor_uses_operator_informers(
+    supervisor: pipeline_runs_supervisor.PipelineRunSupervisor,
+    operator: types.SimpleNamespace,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the supervisor subscribes to the informers of the operator
+    and unsubscribes when it's stopped
+    """
+    monkeypatch.setattr(
+        pipeline_runs_supervisor, "_get_unfinished_run_ids", set
+    )
+    supervisor.start()
+    await asyncio.sleep(0.05)
+
+    for _informer in (operator.job_informer, operator.pod_informer):
+        assert _informer._event_handlers == [supervisor.notify]
+
+    await supervisor.stop()
+
+    for _informer in (operator.job_informer, operator.pod_informer):
+        assert not _informer._event_handlers
+
+
+@pytest.mark.asyncio
+async def test_supervisor_runs_updates_concurrently(
+    supervisor: pipeline_runs_supervisor.PipelineRunSupervisor,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that slow updates of one run don't block updates of other runs"""
+    monkeypatch.setattr(
+        pipeline_runs_supervisor,
+        "_get_unfinished_run_ids",
+        lambda: {1, 2, 3, 4},
+    )
+    monkeypatch.setattr(
+        pipeline_runs_interface,
+        "supervise_job_run",
+        lambda run_id: time.sleep(0.2),
+    )
+
+    start = time.monotonic()
+    await _run_supervisor(supervisor, 0.3)
+
+    assert not supervisor._in_progress
+    assert time.monotonic() - start < 0.5
@@ -2,10 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import asyncio
 import base64
+import datetime as dt
 import io
 import json
+import logging
 import zipfile
+from collections import abc
+from unittest import mock
 
 import aioresponses
 import pytest
@@ -15,7 +20,14 @@ import capellacollab.projects.models as project_models
 import capellacollab.projects.toolmodels.models as toolmodels_models
 import capellacollab.projects.toolmodels.modelsources.git.models as projects_git_models
 import capellacollab.settings.modelsources.git.models as git_models
+from capellacollab.core import responses
 from capellacollab.projects.toolmodels.diagrams import core as diagrams_core
+from capellacollab.projects.toolmodels.diagrams import (
+    models as diagrams_models,
+)
+from capellacollab.projects.toolmodels.modelsources.git import (
+    exceptions as git_exceptions,
+)
 from tests.projects.toolmodels.modelsources.handler import (
     mocks as git_handler_mocks,
 )
@@ -354,6 +366,75 @@ def test_get_diagrams_failed_diagram_cache_job_found(
     assert "failure" in reason or "failed" in reason
 
 
+@pytest.mark.usefixtures(
+    "project_user",
+    "git_instance",
+    "git_model",
+    "mock_git_valkey_cache",
+    "mock_fetch_diagram_cache_metadata",
+    "mock_git_diagram_cache_index_api",
+    "mock_git_diagram_cache_svg",
+)
+def test_get_diagram_archive(
+    git_type: git_models.GitType,
+    aiomock: aioresponses.aioresponses,
+    project: project_models.DatabaseProject,
+    capella_model: toolmodels_models.ToolModel,
+    client: testclient.TestClient,
+):
+    mock_git_diagram_cache_from_repo_api(git_type, aiomock, 404)
+    git_handler_mocks.mock_git_get_commit_information_api(
+        git_type=git_type,
+        aiomock=aiomock,
+        path="diagram_cache/_c90e4Hdf2d2UosmJBo0GTw.svg",
+        revision="diagram-cache/main",
+    )
+    git_handler_mocks.mock_git_rest_api_for_artifacts(
+        git_type,
+        "update_capella_diagram_cache",
+        "success",
+        ["12345", "12346"],
+        aiomock,
+    )
+
+    response = client.get(
+        f"/api/v1/projects/{project.slug}/models/{capella_model.slug}/diagrams/-/archive",
+        params={"uuids": ["_c90e4Hdf2d2UosmJBo0GTw"]},
+    )
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == ["_c90e4Hdf2d2UosmJBo0GTw.svg"]
+        assert archive.read("_c90e4Hdf2d2UosmJBo0GTw.svg") == EXAMPLE_SVG
+
+
+@pytest.mark.usefixtures(
+    "project_user",
+    "git_instance",
+    "git_model",
+    "mock_fetch_diagram_cache_metadata",
+)
+def test_get_diagram_archive_with_unknown_diagram(
+    git_type: git_models.GitType,
+    aiomock: aioresponses.aioresponses,
+    project: project_models.DatabaseProject,
+    capella_model: toolmodels_models.ToolModel,
+    client: testclient.TestClient,
+):
+    git_handler_mocks.mock_gitlab_project_api(git_type, aiomock)
+
+    response = client.get(
+        f"/api/v1/projects/{project.slug}/models/{capella_model.slug}/diagrams/-/archive",
+        params={"uuids": ["_unknown"]},
+    )
+
+    assert response.status_code == 404
+    assert (
+        response.json()["detail"]["err_code"]
+        == "DIAGRAM_CACHE_DIAGRAM_NOT_FOUND"
+    )
+
+
 @pytest.mark.usefixtures(
     "project_user",
     "git_instance",
@@ -394,6 +475,35 @@ def test_get_single_diagram_from_artifacts(
     assert response.content == EXAMPLE_SVG
 
 
+@pytest.mark.usefixtures(
+    "project_user",
+    "git_instance",
+    "git_model",
+    "mock_git_valkey_cache",
+    "mock_git_diagram_cache_index_api",
+)
+def test_get_single_diagram_of_job_is_not_modified(
+    git_type: git_models.GitType,
+    aiomock: aioresponses.aioresponses,
+    project: project_models.DatabaseProject,
+    capella_model: toolmodels_models.ToolModel,
+    client: testclient.TestClient,
+):
+    """Test that a known diagram of a job is revalidated without loading it"""
+    git_handler_mocks.mock_gitlab_project_api(git_type, aiomock)
+    etag = responses.make_etag("00002", "_c90e4Hdf2d2UosmJBo0GTw")
+
+    response = client.get(
+        f"/api/v1/projects/{project.slug}/models/{capella_model.slug}/diagrams/_c90e4Hdf2d2UosmJBo0GTw",
+        params={"job_id": "00002"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
 @pytest.mark.usefixtures(
     "project_user",
     "git_instance",
@@ -590,3 +700,100 @@ def test_diagram_unsuccessful(
         response.json()["detail"]["err_code"]
         == "DIAGRAM_CACHE_DIAGRAM_NOT_SUCCESSFUL"
     )
+
+
+@pytest.mark.asyncio
+async def test_diagram_cache_index_is_memoised_per_job(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    fetched_job_ids: list[str | None] = []
+
+    async def mock_fetch_diagram_cache_metadata(logger, handler, job_id):
+        fetched_job_ids.append(job_id)
+        return (
+            "00002",
+            dt.datetime(2050, 1, 1, tzinfo=dt.UTC),
+            json.dumps(get_diagram_cache_index()),
+        )
+
+    monkeypatch.setattr(
+        diagrams_core,
+        "fetch_diagram_cache_metadata",
+        mock_fetch_diagram_cache_metadata,
+    )
+    handler = mock.Mock(git_model_id=1, revision="main")
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+
+    index = await diagrams_core.get_diagram_cache_index(logger, handler)
+    assert (
+        await diagrams_core.get_diagram_cache_index(logger, handler, "00002")
+        is index
+    )
+
+    assert fetched_job_ids == [None]
+    assert [diagram.uuid for diagram in index.diagrams] == [
+        "_c90e4Hdf2d2UosmJBo0GTw",
+        "_VjvUMasdf2e2wVuAPh3ezQ",
+    ]
+    assert index.diagrams_by_uuid["_VjvUMasdf2e2wVuAPh3ezQ"].name == (
+        "Diagram 2"
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_diagram_archive_skips_failing_diagrams():
+    async def get_file_or_artifact(trusted_file_path: str, **kwargs):
+        if "_VjvUMasdf2e2wVuAPh3ezQ" in trusted_file_path:
+            raise git_exceptions.GitRepositoryFileNotFoundError(
+                filename=trusted_file_path
+            )
+        return None, None, EXAMPLE_SVG
+
+    chunks = [
+        chunk async for chunk in stream_diagram_archive(get_file_or_artifact)
+    ]
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.namelist() == ["_c90e4Hdf2d2UosmJBo0GTw.svg"]
+        assert archive.read("_c90e4Hdf2d2UosmJBo0GTw.svg") == EXAMPLE_SVG
+
+
+@pytest.mark.asyncio
+async def test_stream_diagram_archive_awaits_cancelled_prefetches():
+    cancelled = []
+
+    async def get_file_or_artifact(trusted_file_path: str, **kwargs):
+        if "_VjvUMasdf2e2wVuAPh3ezQ" in trusted_file_path:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(trusted_file_path)
+                raise
+        return None, None, EXAMPLE_SVG
+
+    stream = stream_diagram_archive(get_file_or_artifact)
+    await anext(stream)
+    await stream.aclose()
+
+    assert len(cancelled) == 1
+
+
+def stream_diagram_archive(
+    get_file_or_artifact: abc.Callable,
+) -> abc.AsyncIterator[bytes]:
+    handler = mock.Mock(revision="main")
+    handler.get_file_or_artifact = get_file_or_artifact
+    logger = logging.LoggerAdapter(logging.getLogger(__name__))
+    diagrams = [
+        diagrams_models.DiagramMetadata.model_validate(diagram)
+        for diagram in get_diagram_cache_index()
+    ]
+    index = diagrams_core.DiagramCacheIndex(
+        job_id="00002",
+        last_updated=dt.datetime(2050, 1, 1, tzinfo=dt.UTC),
+        diagrams=diagrams,
+        diagrams_by_uuid={diagram.uuid: diagram for diagram in diagrams},
+    )
+    return diagrams_core.stream_diagram_archive(
+        logger, handler, index, diagrams
+    )
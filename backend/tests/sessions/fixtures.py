@@ -5,12 +5,16 @@ import datetime
 import uuid
 
 import pytest
+from kubernetes import client
+from kubernetes.client import exceptions
 from sqlalchemy import orm
 
+from capellacollab.__main__ import app
 from capellacollab.sessions import crud as sessions_crud
 from capellacollab.sessions import injection as sessions_injection
 from capellacollab.sessions import models as sessions_models
 from capellacollab.sessions import models2 as sessions_models2
+from capellacollab.sessions import operators
 from capellacollab.sessions.operators import k8s as k8s_operator
 from capellacollab.tools import models as tools_models
 from capellacollab.users import models as users_models
@@ -75,3 +79,98 @@ def fixture_mock_session_injection(monkeypatch: pytest.MonkeyPatch):
             sessions_models.SessionState.UNKNOWN,
         ),
     )
+    monkeypatch.setattr(
+        sessions_injection,
+        "get_idle_states",
+        lambda session_ids: {
+            session_id: sessions_models2.IdleState(
+                available=False,
+                unavailable_reason="Unavailable during testing",
+                terminate_after_minutes=90,
+            )
+            for session_id in session_ids
+        },
+    )
+    monkeypatch.setattr(
+        k8s_operator.KubernetesOperator,
+        "get_session_states",
+        lambda self, session_ids: dict.fromkeys(
+            session_ids,
+            (
+                sessions_models.SessionPreparationState.UNKNOWN,
+                sessions_models.SessionState.UNKNOWN,
+            ),
+        ),
+    )
+
+
+class MockOperator:
+    """Warm pools and image pre-pull of the Kubernetes operator in memory"""
+
+    def __init__(self):
+        self.warm_pools: dict[int, client.V1Deployment] = {}
+        self.node_name: str | None = "node"
+        self.applied: dict[int, int] = {}
+        self.deleted: list[int] = []
+        self.claimed: list[int] = []
+        self.failing_deletions: set[int] = set()
+
+        self.pods: list[client.V1Pod] = []
+        self.daemon_set: client.V1DaemonSet | None = None
+        self.applied_images: list[list[str]] = []
+        self.image_pre_pull_deleted = False
+
+    def get_warm_pools(self) -> dict[int, client.V1Deployment]:
+        return self.warm_pools
+
+    def apply_warm_pool(
+        self,
+        version_id: int,
+        image: str,
+        tool_resources: tools_models.Resources,
+        size: int,
+    ):
+        self.applied[version_id] = size
+
+    def delete_warm_pool(self, version_id: int):
+        self.deleted.append(version_id)
+        if version_id in self.failing_deletions:
+            raise exceptions.ApiException(status=500)
+
+    def claim_warm_pool_pod(self, version_id: int) -> str | None:
+        self.claimed.append(version_id)
+        return self.node_name
+
+    def get_pods(self, label_selector: str | None) -> list[client.V1Pod]:
+        return self.pods
+
+    def get_image_pre_pull(self) -> client.V1DaemonSet | None:
+        return self.daemon_set
+
+    def apply_image_pre_pull(self, images: list[str]):
+        self.applied_images.append(images)
+        self.daemon_set = client.V1DaemonSet(
+            metadata=client.V1ObjectMeta(
+                annotations={
+                    k8s_operator.SPEC_ANNOTATION: k8s_operator.get_spec_hash(
+                        images
+                    )
+                }
+            )
+        )
+
+    def delete_image_pre_pull(self):
+        self.image_pre_pull_deleted = True
+
+
+@pytest.fixture(name="mock_operator")
+def fixture_mock_operator(monkeypatch: pytest.MonkeyPatch) -> MockOperator:
+    mock_operator = MockOperator()
+    # Routes depend on the original function, which has to be overridden
+    monkeypatch.setitem(
+        app.dependency_overrides,
+        operators.get_operator,
+        lambda: mock_operator,
+    )
+    monkeypatch.setattr(operators, "get_operator", lambda: mock_operator)
+    return mock_operator
@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+import pytest
+from kubernetes import client, watch
+
+from capellacollab.sessions import operators
+from capellacollab.sessions.operators import informer
+
+
+def _pod(name: str, labels: dict[str, str]) -> client.V1Pod:
+    return client.V1Pod(metadata=client.V1ObjectMeta(name=name, labels=labels))
+
+
+@pytest.fixture(name="pod_informer")
+def fixture_pod_informer() -> informer.Informer:
+    pod_informer = informer.Informer(
+        "pods",
+        lambda **kwargs: client.V1PodList(
+            metadata=client.V1ListMeta(resource_version="1"),
+            items=[
+                _pod(
+                    "session",
+                    {
+                        "capellacollab/workload": "session",
+                        "capellacollab/session-id": "session",
+                    },
+                ),
+                _pod(
+                    "sidecar",
+                    {
+                        "capellacollab/workload": "session-sidecar",
+                        "capellacollab/session-id": "session",
+                    },
+                ),
+            ],
+        ),
+        namespace="test",
+        resync_interval=300,
+    )
+    pod_informer._resync()
+    return pod_informer
+
+
+def test_informer_not_synced():
+    pod_informer = informer.Informer(
+        "pods", mock.Mock(), namespace="test", resync_interval=300
+    )
+
+    assert pod_informer.get("session") is None
+    assert pod_informer.list("capellacollab/workload=session") is None
+
+
+def test_informer_get_by_name(pod_informer: informer.Informer):
+    assert pod_informer.get("session").metadata.name == "session"
+    assert pod_informer.get("unknown") is None
+
+
+def test_informer_list_by_labels(pod_informer: informer.Informer):
+    assert {
+        pod.metadata.name
+        for pod in pod_informer.list("capellacollab/session-id=session")
+    } == {"session", "sidecar"}
+    assert [
+        pod.metadata.name
+        for pod in pod_informer.list(
+            "capellacollab/session-id=session,capellacollab/workload==session"
+        )
+    ] == ["session"]
+    assert pod_informer.list("capellacollab/workload=job") == []
+
+
+def test_informer_unsupported_label_selector(
+    pod_informer: informer.Informer,
+):
+    """Set-based selectors can't be answered from the cache"""
+    assert pod_informer.list("capellacollab/workload!=session") is None
+    assert pod_informer.list("capellacollab/workload in (session)") is None
+
+
+def test_informer_doesnt_cover_label_selector(
+    pod_informer: informer.Informer,
+):
+    """Selectors, which match resources excluded by the selector of
+    the informer, can't be answered from the cache
+    """
+    pod_informer.label_selector = "capellacollab/workload"
+
+    assert pod_informer.list(None) is None
+    assert pod_informer.list("capellacollab/session-id=session") is None
+    assert len(pod_informer.list("capellacollab/workload=session")) == 1
+
+
+def test_informer_applies_watch_events(
+    monkeypatch: pytest.MonkeyPatch, pod_informer: informer.Informer
+):
+    monkeypatch.setattr(
+        watch.Watch,
+        "stream",
+        lambda *args, **kwargs: iter(
+            [
+                {
+                    "type": "ADDED",
+                    "object": _pod("job", {"capellacollab/workload": "job"}),
+                },
+                {
+                    "type": "MODIFIED",
+                    "object": _pod(
+                        "session", {"capellacollab/workload": "session"}
+                    ),
+                },
+                {"type": "DELETED", "object": _pod("sidecar", {})},
+            ]
+        ),
+    )
+
+    pod_informer._watch_events("1")
+
+    assert pod_informer.get("sidecar") is None
+    assert [
+        pod.metadata.name
+        for pod in pod_informer.list("capellacollab/workload=job")
+    ] == ["job"]
+    assert pod_informer.list("capellacollab/session-id=session") == []
+
+
+def test_informer_calls_event_handlers(
+    monkeypatch: pytest.MonkeyPatch, pod_informer: informer.Informer
+):
+    job_pod = _pod("job", {"capellacollab/workload": "job"})
+    monkeypatch.setattr(
+        watch.Watch,
+        "stream",
+        lambda *args, **kwargs: iter([{"type": "ADDED", "object": job_pod}]),
+    )
+    failing_handler = mock.Mock(side_effect=RuntimeError)
+    handler = mock.Mock()
+    pod_informer.add_event_handler(failing_handler)
+    pod_informer.add_event_handler(handler)
+
+    pod_informer._watch_events("1")
+
+    handler.assert_called_once_with("ADDED", job_pod)
+    assert pod_informer.get("job") is job_pod
+
+
+def test_operator_reads_from_informer(
+    monkeypatch: pytest.MonkeyPatch, pod_informer: informer.Informer
+):
+    operator = operators.get_operator()
+    monkeypatch.setattr(operator, "pod_informer", pod_informer)
+    read_namespaced_pod = mock.Mock(return_value=_pod("unknown", {}))
+    monkeypatch.setattr(
+        client.CoreV1Api, "read_namespaced_pod", read_namespaced_pod
+    )
+
+    assert operator.get_pod_by_name("session").metadata.name == "session"
+    read_namespaced_pod.assert_not_called()
+
+    assert operator.get_pod_by_name("unknown").metadata.name == "unknown"
+    read_namespaced_pod.assert_called_once()
+
+
+def test_operator_lists_uncovered_pods_from_api(
+    monkeypatch: pytest.MonkeyPatch, pod_informer: informer.Informer
+):
+    operator = operators.get_operator()
+    pod_informer.label_selector = "capellacollab/workload"
+    monkeypatch.setattr(operator, "pod_informer", pod_informer)
+    list_namespaced_pod = mock.Mock(
+        return_value=client.V1PodList(items=[_pod("other", {})])
+    )
+    monkeypatch.setattr(
+        client.CoreV1Api, "list_namespaced_pod", list_namespaced_pod
+    )
+
+    assert len(operator.get_pods("capellacollab/workload=session")) == 1
+    list_namespaced_pod.assert_not_called()
+
+    assert [pod.metadata.name for pod in operator.get_pods(None)] == ["other"]
+    list_namespaced_pod.assert_called_once()
+
+
+def test_operator_falls_back_to_api_for_unknown_job_pod(
+    monkeypatch: pytest.MonkeyPatch, pod_informer: informer.Informer
+):
+    """The pod of a new job may not be in the cache yet"""
+    operator = operators.get_operator()
+    monkeypatch.setattr(operator, "pod_informer", pod_informer)
+    job_pod = _pod(
+        "job-pod", {"capellacollab/workload": "job", "job-name": "job"}
+    )
+    list_namespaced_pod = mock.Mock(
+        return_value=client.V1PodList(items=[job_pod])
+    )
+    monkeypatch.setattr(
+        client.CoreV1Api, "list_namespaced_pod", list_namespaced_pod
+    )
+
+    assert operator.get_pod_for_job("job") is job_pod
+    assert operator.get_pod_name_from_job_name("job") == "job-pod"
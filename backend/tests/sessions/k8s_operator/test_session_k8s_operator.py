@@ -82,6 +82,67 @@ def test_start_session(monkeypatch: pytest.MonkeyPatch):
     assert session["id"] == "testname"
 
 
+def test_failed_session_start_deletes_created_resources(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    operator = k8s.KubernetesOperator()
+    deleted: list[str] = []
+
+    def create_namespaced_pod(namespace, pod):
+        raise exceptions.ApiException(status=403, reason="Quota exceeded")
+
+    monkeypatch.setattr(
+        operator.v1_core, "create_namespaced_pod", create_namespaced_pod
+    )
+    monkeypatch.setattr(
+        operator.v1_core,
+        "create_namespaced_service",
+        lambda namespace, service: client.V1Service(
+            metadata=client.V1ObjectMeta(name="testname")
+        ),
+    )
+    monkeypatch.setattr(
+        operator.v1_policy,
+        "create_namespaced_pod_disruption_budget",
+        lambda namespace, budget: None,
+    )
+    monkeypatch.setattr(
+        operator.v1_core,
+        "delete_namespaced_pod",
+        lambda name, namespace: deleted.append("pod") or client.V1Status(),
+    )
+    monkeypatch.setattr(
+        operator.v1_core,
+        "delete_namespaced_service",
+        lambda name, namespace: deleted.append("service") or client.V1Status(),
+    )
+    monkeypatch.setattr(
+        operator.v1_policy,
+        "delete_namespaced_pod_disruption_budget",
+        lambda name, namespace: (
+            deleted.append("disruption_budget") or client.V1Status()
+        ),
+    )
+
+    with pytest.raises(exceptions.ApiException):
+        operator.start_session(
+            session_id="testname",
+            image="hello-world",
+            username="testuser",
+            session_type=sessions_models.SessionType.PERSISTENT,
+            tool=tools_models.DatabaseTool(name="testtool"),
+            environment={},
+            init_environment={},
+            ports={"rdp": 3389},
+            volumes=[],
+            init_volumes=[],
+            labels={},
+            annotations={},
+        )
+
+    assert set(deleted) == {"pod", "service", "disruption_budget"}
+
+
 def test_kill_session(monkeypatch: pytest.MonkeyPatch):
     operator = k8s.KubernetesOperator()
 
@@ -122,6 +183,103 @@ def test_create_job(monkeypatch: pytest.MonkeyPatch):
     assert result
 
 
+def test_image_pre_pull_pulls_each_image_in_own_container(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that an image which can't be pulled doesn't block the others"""
+    operator = k8s.KubernetesOperator()
+    monkeypatch.setattr(
+        operator.v1_apps,
+        "create_namespaced_daemon_set",
+        lambda namespace, daemon_set: daemon_set,
+    )
+
+    daemon_set = operator.apply_image_pre_pull(
+        ["capella:6.0.0", "capella:7.0.0"]
+    )
+
+    pod_spec = daemon_set.spec.template.spec
+    assert [container.image for container in pod_spec.containers] == [
+        "capella:6.0.0",
+        "capella:7.0.0",
+    ]
+    assert all(
+        container.command[0] == "/image-pre-pull/busybox"
+        for container in pod_spec.containers
+    )
+    assert [container.name for container in pod_spec.init_containers] == [
+        "copy-busybox"
+    ]
+
+
+def create_warm_pool_pod(
+    name: str, annotations: dict[str, str] | None = None
+) -> client.V1Pod:
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(
+            name=name, annotations=annotations, resource_version="1"
+        ),
+        spec=client.V1PodSpec(containers=[], node_name=f"{name}-node"),
+        status=client.V1PodStatus(phase="Running"),
+    )
+
+
+def test_claim_warm_pool_pod_scales_down_warm_pool(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the claimed pod isn't replaced by the deployment"""
+    operator = k8s.KubernetesOperator()
+    calls = []
+    monkeypatch.setattr(
+        operator,
+        "get_pods",
+        lambda label_selector: [
+            create_warm_pool_pod(
+                "claimed",
+                {k8s.POD_DELETION_COST_ANNOTATION: "-2147483648"},
+            ),
+            create_warm_pool_pod("placeholder"),
+        ],
+    )
+    monkeypatch.setattr(
+        operator.v1_core,
+        "patch_namespaced_pod",
+        lambda name, namespace, body: calls.append(("patch", name)),
+    )
+    monkeypatch.setattr(
+        operator.v1_apps,
+        "read_namespaced_deployment_scale",
+        lambda name, namespace: client.V1Scale(
+            spec=client.V1ScaleSpec(replicas=2)
+        ),
+    )
+
+    def replace_namespaced_deployment_scale(name, namespace, scale):
+        calls.append(("scale", scale.spec.replicas))
+        # A concurrent claim updated the deployment
+        if len(calls) == 2:
+            raise exceptions.ApiException(status=409)
+
+    monkeypatch.setattr(
+        operator.v1_apps,
+        "replace_namespaced_deployment_scale",
+        replace_namespaced_deployment_scale,
+    )
+    monkeypatch.setattr(
+        operator,
+        "delete_pod",
+        lambda name: calls.append(("delete", name)),
+    )
+
+    assert operator.claim_warm_pool_pod(1) == "placeholder-node"
+    assert calls == [
+        ("patch", "placeholder"),
+        ("scale", 1),
+        ("scale", 1),
+        ("delete", "placeholder"),
+    ]
+
+
 def test_delete_disruption_budget_with_api_error(
     monkeypatch: pytest.MonkeyPatch,
 ):
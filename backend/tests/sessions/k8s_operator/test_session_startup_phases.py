@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+
+import pytest
+from kubernetes import client
+
+from capellacollab.sessions import models as sessions_models
+from capellacollab.sessions import operators
+
+STARTED_AT = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def create_pod(
+    init_container_state: client.V1ContainerState,
+    container_state: client.V1ContainerState,
+) -> client.V1Pod:
+    return client.V1Pod(
+        status=client.V1PodStatus(
+            init_container_statuses=[
+                client.V1ContainerStatus(
+                    name="session-preparation",
+                    state=init_container_state,
+                    image="hello-world",
+                    image_id="hello-world",
+                    ready=True,
+                    restart_count=0,
+                )
+            ],
+            container_statuses=[
+                client.V1ContainerStatus(
+                    name="session",
+                    state=container_state,
+                    image="hello-world",
+                    image_id="hello-world",
+                    ready=True,
+                    restart_count=0,
+                )
+            ],
+        )
+    )
+
+
+def create_event(reason: str, field_path: str) -> client.CoreV1Event:
+    return client.CoreV1Event(
+        metadata=client.V1ObjectMeta(),
+        involved_object=client.V1ObjectReference(field_path=field_path),
+        reason=reason,
+        first_timestamp=STARTED_AT + datetime.timedelta(seconds=5),
+    )
+
+
+def test_startup_phases_of_running_session(monkeypatch: pytest.MonkeyPatch):
+    pod = create_pod(
+        client.V1ContainerState(
+            terminated=client.V1ContainerStateTerminated(
+                exit_code=0,
+                reason="Completed",
+                finished_at=STARTED_AT + datetime.timedelta(seconds=10),
+            )
+        ),
+        client.V1ContainerState(
+            running=client.V1ContainerStateRunning(
+                started_at=STARTED_AT + datetime.timedelta(seconds=20)
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        client.CoreV1Api, "read_namespaced_pod", lambda *args, **kwargs: pod
+    )
+    monkeypatch.setattr(
+        client.CoreV1Api,
+        "list_namespaced_event",
+        lambda *args, **kwargs: client.CoreV1EventList(
+            items=[
+                create_event(
+                    "Pulled", "spec.initContainers{session-preparation}"
+                ),
+                create_event("Pulled", "spec.containers{session}"),
+                create_event("Started", "spec.containers{session}"),
+            ]
+        ),
+    )
+
+    phases = operators.KubernetesOperator().get_session_startup_phases("id")
+
+    assert phases == {
+        sessions_models.SessionStartupPhase.IMAGE_PULLED: STARTED_AT
+        + datetime.timedelta(seconds=5),
+        sessions_models.SessionStartupPhase.SESSION_PREPARATION_FINISHED: STARTED_AT
+        + datetime.timedelta(seconds=10),
+        sessions_models.SessionStartupPhase.CONTAINER_RUNNING: STARTED_AT
+        + datetime.timedelta(seconds=20),
+    }
+
+
+def test_events_are_not_requested_before_container_runs(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    pod = create_pod(
+        client.V1ContainerState(
+            running=client.V1ContainerStateRunning(started_at=STARTED_AT)
+        ),
+        client.V1ContainerState(
+            waiting=client.V1ContainerStateWaiting(reason="PodInitializing")
+        ),
+    )
+    monkeypatch.setattr(
+        client.CoreV1Api, "read_namespaced_pod", lambda *args, **kwargs: pod
+    )
+
+    def list_namespaced_event(*args, **kwargs):
+        raise AssertionError("Events shouldn't be requested")
+
+    monkeypatch.setattr(
+        client.CoreV1Api, "list_namespaced_event", list_namespaced_event
+    )
+
+    assert not operators.KubernetesOperator().get_session_startup_phases("id")
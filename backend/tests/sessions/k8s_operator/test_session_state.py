@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from unittest import mock
+
 import pytest
 from kubernetes import client
 
@@ -240,3 +242,46 @@ def test_session_state_not_found(monkeypatch: pytest.MonkeyPatch):
         sessions_models.SessionPreparationState.NOT_FOUND,
         sessions_models.SessionState.NOT_FOUND,
     )
+
+
+def test_session_states(monkeypatch: pytest.MonkeyPatch):
+    """Test that the states of multiple sessions are resolved with one call"""
+
+    list_namespaced_pod = mock.Mock(
+        return_value=client.V1PodList(
+            items=[
+                client.V1Pod(
+                    metadata=client.V1ObjectMeta(name="running"),
+                    status=client.V1PodStatus(
+                        container_statuses=[
+                            client.V1ContainerStatus(
+                                name="session",
+                                state=client.V1ContainerState(running=True),
+                                image="hello-world",
+                                image_id="hello-world",
+                                ready=True,
+                                restart_count=0,
+                            ),
+                        ],
+                    ),
+                )
+            ]
+        )
+    )
+    monkeypatch.setattr(
+        client.CoreV1Api, "list_namespaced_pod", list_namespaced_pod
+    )
+
+    assert operators.get_operator().get_session_states(
+        ["running", "missing"]
+    ) == {
+        "running": (
+            sessions_models.SessionPreparationState.UNKNOWN,
+            sessions_models.SessionState.RUNNING,
+        ),
+        "missing": (
+            sessions_models.SessionPreparationState.NOT_FOUND,
+            sessions_models.SessionState.NOT_FOUND,
+        ),
+    }
+    list_namespaced_pod.assert_called_once()
@@ -77,3 +77,56 @@ def test_get_idle_status():
             idle_for_minutes=12,
             terminate_after_minutes=90,
         )
+
+
+def test_get_idle_states():
+    with responses.RequestsMock() as rsps:
+        rsps.get(
+            f"{config.prometheus.url}/api/v1/query?query=idletime_minutes",
+            status=status.HTTP_200_OK,
+            json={
+                "status": "success",
+                "data": {
+                    "resultType": "vector",
+                    "result": [
+                        {
+                            "metric": {"session_id": "test"},
+                            "value": [1731683497.386, "12.5"],
+                        },
+                        {
+                            "metric": {"session_id": "other"},
+                            "value": [1731683497.386, "3"],
+                        },
+                    ],
+                },
+            },
+        )
+
+        assert injection.get_idle_states(["test", "unknown"]) == {
+            "test": models2_sessions.IdleState(
+                available=True,
+                idle_for_minutes=12,
+                terminate_after_minutes=90,
+            ),
+            "unknown": models2_sessions.IdleState(
+                available=False,
+                unavailable_reason="No metrics found for session",
+                terminate_after_minutes=90,
+            ),
+        }
+
+
+def test_get_idle_states_exception():
+    with responses.RequestsMock() as rsps:
+        rsps.get(
+            f"{config.prometheus.url}/api/v1/query?query=idletime_minutes",
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+        assert injection.get_idle_states(["test"]) == {
+            "test": models2_sessions.IdleState(
+                available=False,
+                unavailable_reason="Exception during fetching of idle state",
+                terminate_after_minutes=90,
+            )
+        }
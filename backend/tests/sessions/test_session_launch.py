@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+import types
+import typing as t
+
+import pytest
+
+from capellacollab.sessions import launch
+from capellacollab.sessions import util as sessions_util
+from capellacollab.sessions.hooks import interface as hooks_interface
+
+
+def test_steps_run_concurrently():
+    # Each step waits for all other steps to start
+    barrier = threading.Barrier(3, timeout=5)
+
+    def step(value: int) -> int:
+        barrier.wait()
+        return value
+
+    timings = launch.LaunchTimings()
+    results = launch.run_concurrently(
+        {
+            "first": lambda: step(1),
+            "second": lambda: step(2),
+            "third": lambda: step(3),
+        },
+        timings,
+    )
+
+    assert results == {"first": 1, "second": 2, "third": 3}
+    assert set(timings.durations) == {"first", "second", "third"}
+
+
+def test_failing_step_does_not_cancel_other_steps():
+    completed = threading.Event()
+
+    def fail():
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        launch.run_concurrently(
+            {"fail": fail, "complete": completed.set},
+        )
+
+    assert completed.is_set()
+
+
+class MockDatabaseSession:
+    expire_on_commit = True
+
+    def refresh(self, instance):
+        pass
+
+
+class RecordingHook(hooks_interface.HookRegistration):
+    def __init__(self, name: str, events: list[str], delay: float = 0):
+        self.name = name
+        self.events = events
+        self.delay = delay
+
+    def configuration_hook(
+        self, request: hooks_interface.ConfigurationHookRequest
+    ) -> hooks_interface.ConfigurationHookResult:
+        self.events.append(f"start:{self.name}")
+        time.sleep(self.delay)
+        self.events.append(f"end:{self.name}")
+        return hooks_interface.ConfigurationHookResult(
+            environment={"HOOK": self.name}
+        )
+
+
+class ParallelSafeHook(RecordingHook):
+    parallel_safe = True
+
+
+class DependentHook(RecordingHook):
+    parallel_safe = True
+    depends_on = (RecordingHook,)
+
+
+@pytest.fixture(name="configuration_hook_request")
+def fixture_configuration_hook_request() -> (
+    hooks_interface.ConfigurationHookRequest
+):
+    return t.cast(
+        hooks_interface.ConfigurationHookRequest,
+        types.SimpleNamespace(
+            db=MockDatabaseSession(),
+            user=None,
+            tool=None,
+            tool_version=None,
+            project_scope=None,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_parallel_safe_configuration_hooks_run_concurrently(
+    configuration_hook_request: hooks_interface.ConfigurationHookRequest,
+):
+    events: list[str] = []
+    activated_hooks: list[hooks_interface.HookRegistration] = [
+        RecordingHook("database", events, delay=0.1),
+        ParallelSafeHook("first", events, delay=0.1),
+        ParallelSafeHook("second", events),
+    ]
+
+    results = await sessions_util.run_configuration_hooks(
+        configuration_hook_request, activated_hooks
+    )
+
+    assert [result["environment"]["HOOK"] for result in results] == [
+        "database",
+        "first",
+        "second",
+    ]
+    assert events.index("start:first") < events.index("end:database")
+    assert events.index("start:second") < events.index("end:first")
+    assert configuration_hook_request.db.expire_on_commit
+
+
+@pytest.mark.asyncio
+async def test_configuration_hooks_using_the_database_run_sequentially(
+    configuration_hook_request: hooks_interface.ConfigurationHookRequest,
+):
+    events: list[str] = []
+    activated_hooks: list[hooks_interface.HookRegistration] = [
+        RecordingHook("first", events, delay=0.05),
+        RecordingHook("second", events),
+    ]
+
+    await sessions_util.run_configuration_hooks(
+        configuration_hook_request, activated_hooks
+    )
+
+    assert events == ["start:first", "end:first", "start:second", "end:second"]
+
+
+@pytest.mark.asyncio
+async def test_configuration_hook_waits_for_dependencies(
+    configuration_hook_request: hooks_interface.ConfigurationHookRequest,
+):
+    events: list[str] = []
+    activated_hooks: list[hooks_interface.HookRegistration] = [
+        DependentHook("dependent", events),
+        RecordingHook("dependency", events, delay=0.05),
+    ]
+
+    results = await sessions_util.run_configuration_hooks(
+        configuration_hook_request, activated_hooks
+    )
+
+    assert events == [
+        "start:dependency",
+        "end:dependency",
+        "start:dependent",
+        "end:dependent",
+    ]
+    assert results[0]["environment"]["HOOK"] == "dependent"
+
+
+class FailingHook(hooks_interface.HookRegistration):
+    def configuration_hook(
+        self, request: hooks_interface.ConfigurationHookRequest
+    ) -> hooks_interface.ConfigurationHookResult:
+        raise RuntimeError("failed")
+
+
+@pytest.mark.asyncio
+async def test_failing_configuration_hook_waits_for_running_hooks(
+    configuration_hook_request: hooks_interface.ConfigurationHookRequest,
+):
+    events: list[str] = []
+    activated_hooks: list[hooks_interface.HookRegistration] = [
+        FailingHook(),
+        ParallelSafeHook("running", events, delay=0.05),
+    ]
+
+    with pytest.raises(RuntimeError):
+        await sessions_util.run_configuration_hooks(
+            configuration_hook_request, activated_hooks
+        )
+
+    assert "end:running" in events
+    assert configuration_hook_request.db.expire_on_commit
+
+
+@pytest.mark.asyncio
+async def test_configuration_hooks_are_marked_in_timings(
+    configuration_hook_request: hooks_interface.ConfigurationHookRequest,
+):
+    events: list[str] = []
+    timings = launch.LaunchTimings()
+
+    await sessions_util.run_configuration_hooks(
+        configuration_hook_request,
+        [RecordingHook("database", events), DependentHook("first", events)],
+        timings,
+    )
+
+    assert (
+        timings.phases["configuration_hook:RecordingHook"]
+        <= timings.phases["configuration_hook:DependentHook"]
+    )
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+
+import prometheus_client
+import pytest
+from fastapi import testclient
+from sqlalchemy import orm
+
+from capellacollab.sessions import auth as sessions_auth
+from capellacollab.sessions import models as sessions_models
+from capellacollab.sessions import operators, startup
+
+RECEIVED_AT = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+class MockOperator:
+    def __init__(self, phases: dict[str, datetime.datetime]):
+        self.phases = phases
+        self.requested: list[str] = []
+
+    def get_session_startup_phases(
+        self, session_id: str
+    ) -> dict[str, datetime.datetime]:
+        self.requested.append(session_id)
+        return self.phases
+
+
+def get_observations(
+    session: sessions_models.DatabaseSession, phase: str
+) -> float:
+    return (
+        prometheus_client.REGISTRY.get_sample_value(
+            "backend_session_startup_seconds_count",
+            {
+                "phase": phase,
+                "tool": session.tool.name,
+                "version": session.version.name,
+            },
+        )
+        or 0
+    )
+
+
+def test_record_startup_phases(session: sessions_models.DatabaseSession):
+    phase = sessions_models.SessionStartupPhase.POD_CREATED
+    observations = get_observations(session, phase)
+
+    assert startup.record_startup_phases(
+        session,
+        {
+            sessions_models.SessionStartupPhase.REQUEST_RECEIVED: RECEIVED_AT,
+            phase: RECEIVED_AT + datetime.timedelta(seconds=3),
+        },
+    )
+
+    assert session.startup_timeline == {
+        "request_received": "2026-01-01T00:00:00+00:00",
+        "pod_created": "2026-01-01T00:00:03+00:00",
+    }
+    assert get_observations(session, phase) == observations + 1
+
+
+def test_reached_startup_phases_are_not_overwritten(
+    session: sessions_models.DatabaseSession,
+):
+    phase = sessions_models.SessionStartupPhase.FIRST_CONNECTION
+    startup.record_startup_phases(
+        session,
+        {
+            sessions_models.SessionStartupPhase.REQUEST_RECEIVED: RECEIVED_AT,
+            phase: RECEIVED_AT + datetime.timedelta(seconds=30),
+        },
+    )
+    observations = get_observations(session, phase)
+
+    assert not startup.record_startup_phases(
+        session, {phase: RECEIVED_AT + datetime.timedelta(seconds=60)}
+    )
+
+    assert session.startup_timeline[phase] == "2026-01-01T00:00:30+00:00"
+    assert get_observations(session, phase) == observations
+
+
+def test_record_pod_startup_phases(
+    db: orm.Session,
+    session: sessions_models.DatabaseSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    running_at = datetime.datetime.now(datetime.UTC)
+    mock_operator = MockOperator(
+        {sessions_models.SessionStartupPhase.CONTAINER_RUNNING: running_at}
+    )
+    monkeypatch.setattr(operators, "get_operator", lambda: mock_operator)
+
+    startup.record_pod_startup_phases()
+    startup.record_pod_startup_phases()
+
+    db.refresh(session)
+    assert mock_operator.requested == [session.id]
+    assert (
+        session.startup_timeline["container_running"] == running_at.isoformat()
+    )
+
+
+@pytest.mark.usefixtures("user")
+def test_connection_records_first_connection(
+    db: orm.Session,
+    session: sessions_models.DatabaseSession,
+    client: testclient.TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        sessions_auth, "PRIVATE_KEY", sessions_auth.generate_private_key()
+    )
+
+    response = client.get(f"/api/v1/sessions/{session.id}/connection")
+
+    assert response.status_code == 200
+    db.refresh(session)
+    assert "first_connection" in session.startup_timeline
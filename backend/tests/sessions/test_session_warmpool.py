@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import types
+import typing as t
+
+import pytest
+from kubernetes import client
+from sqlalchemy import orm
+
+from capellacollab.configuration.app import config
+from capellacollab.sessions import warmpool
+from capellacollab.sessions.operators import k8s
+from capellacollab.tools import models as tools_models
+from tests.sessions import fixtures as sessions_fixtures
+
+
+def create_version(size: int) -> tools_models.DatabaseVersion:
+    return t.cast(
+        tools_models.DatabaseVersion,
+        types.SimpleNamespace(
+            id=1,
+            name="6.0.0",
+            config=tools_models.ToolVersionConfiguration(
+                sessions=tools_models.SessionToolConfiguration(
+                    persistent=tools_models.PersistentSessionToolConfiguration(
+                        image=tools_models.PersistentSessionToolConfigurationImages(
+                            regular="docker.io/capella:{version}"
+                        )
+                    ),
+                    warm_pool=tools_models.WarmPoolSessionToolConfiguration(
+                        size=size
+                    ),
+                )
+            ),
+            tool=types.SimpleNamespace(
+                config=tools_models.ToolSessionConfiguration()
+            ),
+        ),
+    )
+
+
+def create_deployment(
+    warm_pool: warmpool.WarmPool, replicas: int
+) -> client.V1Deployment:
+    return client.V1Deployment(
+        metadata=client.V1ObjectMeta(
+            annotations={
+                k8s.SPEC_ANNOTATION: k8s.get_spec_hash(
+                    {
+                        "image": warm_pool.image,
+                        "resources": warm_pool.resources.model_dump(),
+                    }
+                )
+            }
+        ),
+        spec=client.V1DeploymentSpec(
+            replicas=replicas,
+            selector=client.V1LabelSelector(),
+            template=client.V1PodTemplateSpec(),
+        ),
+    )
+
+
+def test_desired_warm_pools_skip_versions_without_size():
+    warm_pools = warmpool.get_desired_warm_pools([create_version(size=0)])
+
+    assert not warm_pools
+
+
+def test_desired_warm_pool_uses_regular_image():
+    warm_pools = warmpool.get_desired_warm_pools([create_version(size=2)])
+
+    assert warm_pools[1].image == "docker.io/capella:6.0.0"
+    assert warm_pools[1].size == 2
+
+
+def test_outdated_warm_pool_is_detected():
+    warm_pool = warmpool.get_desired_warm_pools([create_version(size=2)])[1]
+
+    assert warmpool.is_up_to_date(create_deployment(warm_pool, 2), warm_pool)
+    assert not warmpool.is_up_to_date(
+        create_deployment(warm_pool, 1), warm_pool
+    )
+
+    warm_pool.image = "docker.io/capella:6.0.1"
+    assert not warmpool.is_up_to_date(
+        create_deployment(
+            warmpool.WarmPool(
+                "docker.io/capella:6.0.0", warm_pool.resources, 2
+            ),
+            2,
+        ),
+        warm_pool,
+    )
+
+
+@pytest.fixture(name="warm_pool_version")
+def fixture_warm_pool_version(
+    db: orm.Session, tool_version: tools_models.DatabaseVersion
+) -> tools_models.DatabaseVersion:
+    tool_version.config = tools_models.ToolVersionConfiguration(
+        sessions=tools_models.SessionToolConfiguration(
+            warm_pool=tools_models.WarmPoolSessionToolConfiguration(size=2)
+        )
+    )
+    db.commit()
+    return tool_version
+
+
+@pytest.fixture(name="warm_pool_priority_class")
+def fixture_warm_pool_priority_class(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        config.k8s.warm_pool, "priority_class_name", "collab-warm-pool"
+    )
+
+
+@pytest.mark.usefixtures("warm_pool_priority_class")
+def test_reconcile_warm_pools(
+    warm_pool_version: tools_models.DatabaseVersion,
+    mock_operator: sessions_fixtures.MockOperator,
+):
+    tool_version = warm_pool_version
+    mock_operator.warm_pools = {-1: client.V1Deployment()}
+
+    warmpool.reconcile_warm_pools()
+
+    assert mock_operator.applied == {tool_version.id: 2}
+    assert mock_operator.deleted == [-1]
+
+
+@pytest.mark.usefixtures("warm_pool_version")
+def test_warm_pools_require_priority_class(
+    mock_operator: sessions_fixtures.MockOperator,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.k8s.warm_pool, "priority_class_name", None)
+
+    warmpool.reconcile_warm_pools()
+
+    assert not mock_operator.applied
+
+
+@pytest.mark.usefixtures("warm_pool_priority_class")
+def test_failed_deletion_does_not_abort_reconcile(
+    warm_pool_version: tools_models.DatabaseVersion,
+    mock_operator: sessions_fixtures.MockOperator,
+):
+    mock_operator.warm_pools = {
+        -1: client.V1Deployment(),
+        -2: client.V1Deployment(),
+    }
+    mock_operator.failing_deletions = {-1, -2}
+
+    warmpool.reconcile_warm_pools()
+
+    assert mock_operator.applied == {warm_pool_version.id: 2}
+    assert sorted(mock_operator.deleted) == [-2, -1]
+
+
+def test_claim_warm_pool_pod(
+    logger: logging.LoggerAdapter,
+    mock_operator: sessions_fixtures.MockOperator,
+):
+    node_name = warmpool.claim_warm_pool_pod(
+        mock_operator,  # type: ignore
+        create_version(size=2),
+        "docker.io/capella:6.0.0",
+        logger,
+    )
+
+    assert node_name == "node"
+    assert mock_operator.claimed == [1]
+
+
+@pytest.mark.parametrize(
+    ("size", "image"),
+    [(0, "docker.io/capella:6.0.0"), (2, "docker.io/capella-beta:6.0.0")],
+)
+def test_warm_pool_is_not_claimed(
+    logger: logging.LoggerAdapter,
+    mock_operator: sessions_fixtures.MockOperator,
+    size: int,
+    image: str,
+):
+    node_name = warmpool.claim_warm_pool_pod(
+        mock_operator,  # type: ignore
+        create_version(size=size),
+        image,
+        logger,
+    )
+
+    assert node_name is None
+    assert not mock_operator.claimed
@@ -6,6 +6,12 @@ import pytest
 from fastapi import testclient
 from sqlalchemy import orm
 
+from capellacollab.projects.toolmodels.modelsources.git import (
+    models as project_git_models,
+)
+from capellacollab.projects.toolmodels.modelsources.git.handler import (
+    cache as git_cache,
+)
 from capellacollab.settings.modelsources.git import crud as git_crud
 from capellacollab.settings.modelsources.git import models as git_models
 
@@ -155,3 +161,29 @@ def test_validate_path_invalid(client: testclient.TestClient):
         },
     )
     assert response.json() is False
+
+
+@pytest.mark.usefixtures("admin")
+def test_get_git_cache_statistics(
+    client: testclient.TestClient,
+    git_model: project_git_models.DatabaseGitModel,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async def get_cached_bytes(git_model_ids: list[int]) -> dict[int, int]:
+        # The demo git models of the development mode have smaller caches
+        return {
+            git_model_id: 2048 if git_model_id == git_model.id else 1024
+            for git_model_id in git_model_ids
+        }
+
+    monkeypatch.setattr(git_cache, "get_cached_bytes", get_cached_bytes)
+
+    response = client.get(
+        "/api/v1/settings/modelsources/git/-/cache-statistics"
+    )
+
+    assert response.status_code == 200
+    largest_cache = response.json()["largest_caches"][0]
+    assert largest_cache["git_model_id"] == git_model.id
+    assert largest_cache["cached_bytes"] == 2048
+    assert largest_cache["upstream_requests"] == 0
@@ -367,3 +367,38 @@ def test_global_scope_merging():
 
     with pytest.raises(TypeError):
         permissions_models.GlobalScopes() | None  # type: ignore
+
+
+@pytest.mark.parametrize("role", list(users_models.Role))
+def test_scope_bitmask_round_trip(role: users_models.Role):
+    scope = permissions_models.ROLE_MAPPING[role]
+    mask = permissions_models.GLOBAL_SCOPES_BITMASK.to_mask(scope)
+
+    assert mask == permissions_models.ROLE_MASKS[role]
+    assert permissions_models.GLOBAL_SCOPES_BITMASK.to_model(mask) == scope
+
+
+def test_scope_bitmask_find_missing():
+    bitmask = permissions_models.GLOBAL_SCOPES_BITMASK
+    required = bitmask.to_mask(
+        permissions_models.GlobalScopes(
+            admin=permissions_models.AdminScopes(
+                users={
+                    permissions_models.UserTokenVerb.GET,
+                    permissions_models.UserTokenVerb.UPDATE,
+                }
+            )
+        )
+    )
+    actual = bitmask.bit(
+        "admin", "users", verb=permissions_models.UserTokenVerb.GET
+    )
+
+    assert bitmask.find_missing(required, required) is None
+    assert bitmask.find_missing(required, actual) == (
+        ("admin", "users"),
+        {
+            permissions_models.UserTokenVerb.GET,
+            permissions_models.UserTokenVerb.UPDATE,
+        },
+    )
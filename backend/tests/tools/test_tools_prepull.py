@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import abc
+
+import pytest
+from fastapi import testclient
+from kubernetes import client
+from sqlalchemy import orm
+
+from capellacollab.configuration.app import config
+from capellacollab.tools import crud as tools_crud
+from capellacollab.tools import models as tools_models
+from capellacollab.tools import prepull
+from tests.sessions import fixtures as sessions_fixtures
+
+SESSION_PREPARATION_IMAGE = (
+    f"{config.docker.registry}/session-preparation:{config.docker.tag}"
+)
+
+
+@pytest.fixture(name="create_version")
+def fixture_create_version(
+    db: orm.Session, tool: tools_models.DatabaseTool
+) -> abc.Callable[..., tools_models.DatabaseVersion]:
+    def create_version(
+        name: str,
+        regular: str | None,
+        beta: str | None = None,
+        is_deprecated: bool = False,
+    ) -> tools_models.DatabaseVersion:
+        return tools_crud.create_version(
+            db,
+            tool,
+            tools_models.CreateToolVersion(
+                name=name,
+                config=tools_models.ToolVersionConfiguration(
+                    is_deprecated=is_deprecated,
+                    sessions=tools_models.SessionToolConfiguration(
+                        persistent=tools_models.PersistentSessionToolConfiguration(
+                            image=tools_models.PersistentSessionToolConfigurationImages(
+                                regular=regular, beta=beta
+                            )
+                        ),
+                    ),
+                ),
+            ),
+        )
+
+    return create_version
+
+
+def create_pod(
+    node_name: str, statuses: list[client.V1ContainerStatus]
+) -> client.V1Pod:
+    return client.V1Pod(
+        spec=client.V1PodSpec(
+            node_name=node_name,
+            containers=[
+                client.V1Container(name="image-0", image="capella:6.0.0"),
+                client.V1Container(name="image-1", image="capella:7.0.0"),
+            ],
+        ),
+        status=client.V1PodStatus(container_statuses=statuses),
+    )
+
+
+def create_container_status(
+    name: str,
+    image_id: str = "",
+    waiting_reason: str | None = None,
+) -> client.V1ContainerStatus:
+    return client.V1ContainerStatus(
+        name=name,
+        image="",
+        image_id=image_id,
+        ready=False,
+        restart_count=0,
+        state=client.V1ContainerState(
+            waiting=client.V1ContainerStateWaiting(reason=waiting_reason)
+            if waiting_reason
+            else None
+        ),
+    )
+
+
+def test_pre_pull_images(
+    create_version: abc.Callable[..., tools_models.DatabaseVersion],
+):
+    images = prepull.get_pre_pull_images(
+        [
+            create_version(
+                "6.0.0", "capella:{version}", beta="capella-beta:{version}"
+            ),
+            create_version("6.0.1", "capella:6.0.0"),
+            create_version(
+                "6.0.2", "deprecated:{version}", is_deprecated=True
+            ),
+            create_version("6.0.3", None),
+        ]
+    )
+
+    assert images == sorted(
+        ["capella:6.0.0", "capella-beta:6.0.0", SESSION_PREPARATION_IMAGE]
+    )
+
+
+def test_image_pre_pull_status(
+    mock_operator: sessions_fixtures.MockOperator,
+):
+    mock_operator.pods = [
+        create_pod(
+            "node-1",
+            [
+                create_container_status("image-0", image_id="sha256:1"),
+                create_container_status(
+                    "image-1", waiting_reason="ImagePullBackOff"
+                ),
+            ],
+        ),
+        create_pod(
+            "node-2",
+            [
+                create_container_status(
+                    "image-0", waiting_reason="ContainerCreating"
+                )
+            ],
+        ),
+    ]
+
+    status = prepull.get_image_pre_pull_status(
+        mock_operator,  # type: ignore
+        ["capella:6.0.0", "capella:7.0.0", "capella:8.0.0"],
+    )
+
+    states = {
+        image.image: [(node.node, node.state) for node in image.nodes]
+        for image in status.images
+    }
+    assert states == {
+        "capella:6.0.0": [
+            ("node-1", tools_models.ImagePullState.PULLED),
+            ("node-2", tools_models.ImagePullState.PULLING),
+        ],
+        "capella:7.0.0": [
+            ("node-1", tools_models.ImagePullState.FAILED),
+            ("node-2", tools_models.ImagePullState.PULLING),
+        ],
+        "capella:8.0.0": [],
+    }
+
+
+def test_reconcile_image_pre_pull(
+    mock_operator: sessions_fixtures.MockOperator,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.k8s.image_pre_pull, "enabled", True)
+
+    prepull.reconcile_image_pre_pull()
+    prepull.reconcile_image_pre_pull()
+
+    assert len(mock_operator.applied_images) == 1
+    assert SESSION_PREPARATION_IMAGE in mock_operator.applied_images[0]
+
+
+def test_disabled_image_pre_pull_is_deleted(
+    mock_operator: sessions_fixtures.MockOperator,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(config.k8s.image_pre_pull, "enabled", False)
+
+    prepull.reconcile_image_pre_pull()
+
+    assert mock_operator.image_pre_pull_deleted
+    assert not mock_operator.applied_images
+
+
+@pytest.mark.usefixtures("admin", "tool_version", "mock_operator")
+def test_get_image_pre_pull_status_route(client: testclient.TestClient):
+    response = client.get("/api/v1/tools/-/image-pre-pull")
+
+    assert response.status_code == 200
+    assert {image["image"] for image in response.json()["images"]} >= {
+        "docker.io/hello-world:latest",
+        SESSION_PREPARATION_IMAGE,
+    }